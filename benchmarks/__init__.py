@@ -0,0 +1,8 @@
+"""## Benchmarks of DisplayLib
+
+Builds synthetic scenes headlessly, and measures frames per second and time per phase of the engine loop
+
+Run from the root of the repository:
+>>> python -m benchmarks                      # every scene, results as JSON on stdout
+>>> python -m benchmarks sprites particles --frames 500 --output results.json
+"""
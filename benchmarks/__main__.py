@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import argparse
+import atexit
+import contextlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from typing import Any
+
+SCREENS = ("memory", "null", "terminal") # "terminal" encodes every frame like a terminal would receive it, written to devnull
+
+
+def run_scene(name: str, count: int, frames: int, warmup: int, width: int, height: int, screen: str) -> dict[str, Any]:
+    """Runs a scene in the current process, which has to be a fresh interpreter, since nodes are global
+
+    Args:
+        name (str): name of the scene, in `SCENES`
+        count (int): amount of nodes, emitters or chains, depending on the scene
+        frames (int): amount of frames measured
+        warmup (int): amount of frames run before measuring
+        width (int): screen width
+        height (int): screen height
+        screen (str): one of `SCREENS`
+
+    Returns:
+        dict[str, Any]: results of the scene, with times in milliseconds
+    """
+    import displaylib.ascii as dl
+    from displaylib.template import FrameTimer
+    from .scenes import SCENES
+
+    scene = SCENES[name]
+    screen_type = {"memory": dl.MemoryScreen, "null": dl.NullScreen, "terminal": dl.Screen}[screen]
+
+    class BenchmarkEngine(dl.Engine):
+        def _on_start(self) -> None:
+            self.frame_timer = FrameTimer(capacity=frames) # keeps only the measured frames, as the warmup is overwritten
+            self.frame = 0
+            start = time.perf_counter()
+            self.tick = scene.build(count, width, height)
+            self.setup_time = time.perf_counter() - start
+            self.measure_start = start
+
+        def _update(self, delta: float) -> None:
+            if self.frame == warmup:
+                self.measure_start = time.perf_counter()
+            if self.tick is not None:
+                self.tick(self.frame)
+            self.frame += 1
+            if self.frame >= warmup + frames:
+                self.is_running = False
+                self.measure_time = time.perf_counter() - self.measure_start
+
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        engine = BenchmarkEngine(tps=1_000_000, width=width, height=height, screen_type=screen_type, frame_timing=True)
+    assert engine.frame_timer is not None
+    phases = {
+        phase: {key: round(value * 1000, 4) for key, value in timing._asdict().items()}
+        for phase, timing in engine.frame_timer.get_timings().items()
+    }
+    return {
+        "scene": name,
+        "description": scene.description,
+        "count": count,
+        "frames": frames,
+        "nodes": len(dl.Node.nodes),
+        "textured_nodes": len(dl.Texture._instances),
+        "setup_ms": round(engine.setup_time * 1000, 4),
+        "fps": round(frames / engine.measure_time, 2),
+        "phases": phases
+    }
+
+
+def main() -> None:
+    from .scenes import SCENES
+
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Runs synthetic scenes headlessly, and prints the results as JSON")
+    parser.add_argument("scenes", nargs="*", help=f"scenes to run, from: {', '.join(SCENES)}. Defaults to every scene")
+    parser.add_argument("--count", type=int, default=None, help="amount of nodes, emitters or chains, overriding the default of each scene")
+    parser.add_argument("--frames", type=int, default=200, help="frames measured per scene. Defaults to 200")
+    parser.add_argument("--warmup", type=int, default=20, help="frames run before measuring. Defaults to 20")
+    parser.add_argument("--width", type=int, default=120, help="screen width. Defaults to 120")
+    parser.add_argument("--height", type=int, default=40, help="screen height. Defaults to 40")
+    parser.add_argument("--screen", choices=SCREENS, default="memory", help="screen backend. Defaults to memory")
+    parser.add_argument("--output", default=None, help="file to write the results to, instead of stdout")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS) # runs a single scene in this process
+    args = parser.parse_args()
+    for name in args.scenes:
+        if name not in SCENES:
+            parser.error(f"unknown scene '{name}', choose from: {', '.join(SCENES)}")
+
+    if args.child:
+        name = args.scenes[0]
+        count = args.count if args.count is not None else SCENES[name].count
+        result = run_scene(name, count, args.frames, args.warmup, args.width, args.height, args.screen)
+        print(json.dumps(result))
+        return
+
+    import displaylib
+    from displaylib.ascii import cursor
+    atexit.unregister(cursor.show) # no escape code after the results on stdout
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    results: list[dict[str, Any]] = []
+    for name in args.scenes or SCENES:
+        command = [sys.executable, "-m", "benchmarks", name, "--child", "--frames", str(args.frames), "--warmup", str(args.warmup),
+                   "--width", str(args.width), "--height", str(args.height), "--screen", args.screen]
+        if args.count is not None:
+            command += ["--count", str(args.count)]
+        process = subprocess.run(command, cwd=root, capture_output=True, text=True)
+        if process.returncode != 0:
+            sys.stderr.write(process.stderr)
+            raise SystemExit(f"scene '{name}' failed with exit code {process.returncode}")
+        lines = [line for line in process.stdout.splitlines() if line.startswith("{")] # skips escape codes written at exit
+        results.append(json.loads(lines[-1]))
+        print(f"{name:<12}{results[-1]['fps']:>10.1f} fps", file=sys.stderr)
+
+    report = {
+        "displaylib": displaylib.__version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "screen": args.screen,
+        "width": args.width,
+        "height": args.height,
+        "results": results
+    }
+    content = json.dumps(report, indent=2)
+    if args.output is None:
+        print(content)
+    else:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(content + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import math
+import random
+from typing import Callable, NamedTuple
+
+import displaylib.ascii as dl
+from displaylib.ascii import color
+from displaylib.ascii.prototypes.particles_emitter import ParticlesEmitter
+
+
+Tick = Callable[[int], None] # called by the engine with the index of the current frame
+COLORS = (color.RED, color.GREEN, color.BLUE, color.YELLOW, color.CYAN, color.MAGENTA, color.WHITE, color.ORANGE)
+SPRITE_TEXTURE = [
+    [*"/^\\"],
+    [*"|#|"],
+    [*"\\_/"]
+]
+
+
+class Scene(NamedTuple):
+    """Synthetic scene, built by `build(count, width, height)` in `Engine._on_start`
+    """
+    build: Callable[[int, int, int], Tick | None]
+    count: int # default amount of nodes, emitters or chains
+    description: str
+
+
+class StormEmitter(ParticlesEmitter):
+    """`ParticlesEmitter` that spawns a particle every frame, and frees it after `.lifetime_frames` frames
+
+    Unlike `ParticlesEmitter`, independent of delta time, so that the amount of particles is the same on every run
+    """
+    lifetime_frames: int = 30
+    initial_velocity = 4.0
+    spread = math.radians(90)
+    colors = COLORS
+    textures = ([["*"]], [["+"]], [["."]])
+
+    def _update(self, delta: float) -> None:
+        super()._update(self._spawn_interval) # always due to spawn
+        self._particles[-1].lifetime = math.inf
+        if len(self._particles) > self.lifetime_frames:
+            self._particles.pop(0).queue_free()
+
+
+def build_sprites(count: int, width: int, height: int) -> Tick:
+    rng = random.Random(0)
+    sprites = [
+        dl.Sprite(x=rng.randrange(width), y=rng.randrange(height), texture=SPRITE_TEXTURE, color=COLORS[index % len(COLORS)])
+        for index in range(count)
+    ]
+    starts = [sprite.position.x for sprite in sprites]
+    def tick(frame: int) -> None:
+        for sprite, start in zip(sprites, starts):
+            sprite.position.x = (start + frame) % width
+    return tick
+
+
+def build_labels(count: int, width: int, height: int) -> Tick:
+    rng = random.Random(0)
+    labels = [
+        dl.Label(x=rng.randrange(width), y=rng.randrange(height), text=f"label {index}\nvalue 0", color=COLORS[index % len(COLORS)])
+        for index in range(count)
+    ]
+    def tick(frame: int) -> None:
+        if frame % 8 == 0: # text changes every 8th frame
+            for index, label in enumerate(labels):
+                label.text = f"label {index}\nvalue {frame}"
+    return tick
+
+
+def build_rotated(count: int, width: int, height: int) -> Tick:
+    rng = random.Random(0)
+    sprites = [
+        dl.Sprite(x=rng.randrange(width), y=rng.randrange(height), texture=SPRITE_TEXTURE, color=COLORS[index % len(COLORS)], centered=True)
+        for index in range(count)
+    ]
+    def tick(frame: int) -> None:
+        for index, sprite in enumerate(sprites):
+            sprite.rotation = (frame + index) * 0.05
+    return tick
+
+
+def build_particles(count: int, width: int, height: int) -> None:
+    rng = random.Random(0)
+    random.seed(0) # used by `ParticlesEmitter` when spawning
+    for _ in range(count):
+        StormEmitter(x=rng.randrange(width), y=rng.randrange(height))
+
+
+def build_lines(count: int, width: int, height: int) -> Tick:
+    rng = random.Random(0)
+    lines = [
+        dl.Line(x=rng.randrange(width), y=rng.randrange(height), color=COLORS[index % len(COLORS)])
+        for index in range(count)
+    ]
+    def tick(frame: int) -> None:
+        for index, line in enumerate(lines): # endpoints spinning around the center of the line
+            angle = (frame + index) * 0.1
+            line.start = dl.Vec2(math.cos(angle), math.sin(angle)) * -6
+            line.end = dl.Vec2(math.cos(angle), math.sin(angle)) * 6
+    return tick
+
+
+def build_chains(count: int, width: int, height: int, depth: int = 16) -> Tick:
+    rng = random.Random(0)
+    roots: list[dl.Node2D] = []
+    for index in range(count):
+        node = dl.Node2D(x=rng.randrange(width), y=rng.randrange(height))
+        roots.append(node)
+        for _ in range(depth):
+            node = dl.Node2D(node, x=1)
+        dl.Sprite(node, texture=[["@"]], color=COLORS[index % len(COLORS)])
+    starts = [root.position.y for root in roots]
+    def tick(frame: int) -> None:
+        for root, start in zip(roots, starts):
+            root.position.y = (start + frame) % height
+    return tick
+
+
+def build_churn(count: int, width: int, height: int) -> Tick:
+    rng = random.Random(0)
+    batch: list[dl.Sprite] = []
+    def tick(frame: int) -> None:
+        for sprite in batch:
+            sprite.queue_free()
+        batch[:] = [
+            dl.Sprite(x=rng.randrange(width), y=rng.randrange(height), texture=SPRITE_TEXTURE, color=COLORS[index % len(COLORS)])
+            for index in range(count)
+        ]
+    return tick
+
+
+SCENES: dict[str, Scene] = {
+    "sprites": Scene(build_sprites, 500, "sprites moving horizontally"),
+    "labels": Scene(build_labels, 300, "colored labels, with text changing every 8th frame"),
+    "rotated": Scene(build_rotated, 200, "sprites rotating around their center"),
+    "particles": Scene(build_particles, 20, "emitters spawning a particle every frame, each living 30 frames"),
+    "lines": Scene(build_lines, 40, "lines spinning, which recreate their points every frame"),
+    "chains": Scene(build_chains, 100, "sprites at the end of 16 deep `Node2D` parent chains, moving vertically"),
+    "churn": Scene(build_churn, 100, "sprites created and freed every frame"),
+}
@@ -16,6 +16,7 @@ __all__ = [
     "debug",             # (function)
     "Debug",             # (class)
     "load_texture",      # (function)
+    "CompiledTexture",   # (data structure)
     # base
     "BaseNode",          # (class alias)
     # core ascii
@@ -24,6 +25,12 @@ __all__ = [
     "Engine",            # (class)
     "Camera",            # (class)
     "Screen",            # (class)
+    "FrameWriter",       # (class)
+    "NullScreen",        # (class)
+    "MemoryScreen",      # (class)
+    "Recorder",          # (class)
+    "SpatialGrid",       # (class)
+    "OutputGovernor",    # (class)
     "AnimationFrame",    # (class)
     "Animation",         # (class)
     "EmptyAnimation",    # (class)
@@ -50,7 +57,8 @@ __all__ = [
     "networking",        # (module)
     # typing support
     "AnyNode",           # (protocol)
-    "ColorValue"         # (type alias)
+    "ColorValue",        # (type alias)
+    "ColorId"            # (type alias)
 ]
 
 # math
@@ -58,7 +66,7 @@ from ..math import lerp, sign, clamp, Vec2, Vec2i
 # utility
 from ..util import autorun#, extend
 from .debug import debug, Debug
-from .texture import load_texture
+from .texture import load_texture, CompiledTexture
 # base
 from ..template import Node as BaseNode
 # core ascii
@@ -66,6 +74,11 @@ from .node import AsciiNode as Node, AsciiNode2D as Node2D
 from .engine import AsciiEngine as Engine
 from .camera import AsciiCamera as Camera
 from .screen import AsciiScreen as Screen
+from .writer import FrameWriter
+from .headless import NullScreen, MemoryScreen
+from .recording import Recorder
+from .spatial import SpatialGrid
+from .governor import OutputGovernor
 from .animation import AnimationFrame, Animation, EmptyAnimation, AnimationPlayer
 from .audio import AudioStreamPlayer
 from .clock import Clock
@@ -89,10 +102,11 @@ from . import cursor
 from ..template import networking
 # typing support
 from ..template.type_hints import AnyNode
-from .color import ColorValue
+from .color import ColorValue, ColorId
 
 
 # activate ANSI escape codes
 import os as _os
-_os.system("")
+if _os.name == "nt": # Windows
+    _os.system("")
 del _os
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import os
+import time
 from typing import TYPE_CHECKING, Protocol, cast
 
 from ..template import Node
+from ..template.profiling import NodeProfiler
 from ..template.type_hints import MroNext, NodeType
 from .texture import Texture, load_texture
 
@@ -284,25 +286,36 @@ class AnimationPlayer(Node):
         """
         def _update(delta: float) -> None:
             update_function(delta)
-            if self.current_animation != "" and not self.current_animation in self.animations:
-                raise ValueError(f"current animation name is invalid: '{self.current_animation}'")
-                
-            if self.parent is None or not isinstance(self.parent, Texture):
-                raise TypeError("parent requires component 'Texture'")
-
-            if self.is_playing and self._has_updated:
-                animation = self.active_animation
-                if animation is not None:
-                    # check playback mode and future index
-                    if self.reverse_playback and (self.frame -1) >= 0:
-                        self.frame -= 1
-                        self.parent.texture = animation.frames[self.frame].texture
-                    elif not self.reverse_playback and (self.frame +1) < len(animation.frames):
-                        self.frame += 1
-                        self.parent.texture = animation.frames[self.frame].texture
-                    else: # both is out of bounds, therefore, stop
-                        self.is_playing = False
-
-            elif not self._has_updated:
-                self._has_updated = True
+            profiler = NodeProfiler.current
+            if profiler is None:
+                self._advance_animation()
+                return
+            start = time.perf_counter() # counted separately from `update_function`
+            self._advance_animation()
+            profiler.record_wrapper(self, "_animation_player_update_wrapper", time.perf_counter() - start)
         return _update
+
+    def _advance_animation(self) -> None:
+        """Steps the active animation one frame, and sets the parent's texture to the new frame
+        """
+        if self.current_animation != "" and not self.current_animation in self.animations:
+            raise ValueError(f"current animation name is invalid: '{self.current_animation}'")
+            
+        if self.parent is None or not isinstance(self.parent, Texture):
+            raise TypeError("parent requires component 'Texture'")
+
+        if self.is_playing and self._has_updated:
+            animation = self.active_animation
+            if animation is not None:
+                # check playback mode and future index
+                if self.reverse_playback and (self.frame -1) >= 0:
+                    self.frame -= 1
+                    self.parent.texture = animation.frames[self.frame].texture
+                elif not self.reverse_playback and (self.frame +1) < len(animation.frames):
+                    self.frame += 1
+                    self.parent.texture = animation.frames[self.frame].texture
+                else: # both is out of bounds, therefore, stop
+                    self.is_playing = False
+
+        elif not self._has_updated:
+            self._has_updated = True
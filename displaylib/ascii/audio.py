@@ -6,6 +6,8 @@ if sys.platform != "win32": # if not on Windows, implement a skeleton, which rai
     class AudioStreamPlayer:
         """Raises NotImplemented. Only implemented for Windows (win32)
         """
+        max_sound_count_default: int = 1 # keeps the signature equal to the Windows version
+
         @classmethod
         def load(cls, file_path: str, /) -> NotImplemented:
             raise NotImplemented("AudioStreamPlayer only implemented for Windows (win32)")
@@ -17,6 +17,7 @@ class Clock:
         self.delta_time = 1.0 / self.tps # initial delta time (optimal)
         self._target_delta = 1.0 / self.tps
         self._last_tick = time.perf_counter()
+        self._start_time = self._last_tick
     
     @property
     def tps(self) -> int:
@@ -27,6 +28,15 @@ class Clock:
         self._tps = value
         self._target_delta = 1.0 / self._tps
     
+    @property
+    def elapsed_time(self) -> float:
+        """Returns the time since the clock was created
+
+        Returns:
+            float: elapsed time in seconds
+        """
+        return time.perf_counter() - self._start_time
+
     def tick(self) -> None:
         """Pauses the clock temporay to achieve the desired framerate (tps)
         """
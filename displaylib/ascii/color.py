@@ -1,16 +1,186 @@
 from __future__ import annotations as _annotations
 
+import re as _re
 import random as _random
-from typing import TypeAlias as _TypeAlias
+import threading as _threading
+from typing import TypeAlias as _TypeAlias, Literal as _Literal, overload as _overload
 
 ColorValue: _TypeAlias = str
+ColorId: _TypeAlias = int
 _ColorCode: _TypeAlias = int | str
 _OptionalColorCode: _TypeAlias = int | str | None
 _HexCode: _TypeAlias = str
 _OptionalHexCode: _TypeAlias = str | None
 
+# palette of interned colors, where id 0 means no color
+_palette_ids: dict[ColorValue, ColorId] = {}
+_palette_values: list[ColorValue] = [""]
+_palette_bytes: list[bytes] = [b""]
+_palette_lock = _threading.Lock() # frames may be encoded and decoded on different threads
+# style escape sequences, indexed by `bold | underline << 1 | reverse << 2`
+_STYLES = tuple(
+    ("\x1b[1m" if idx & 1 else "") + ("\x1b[4m" if idx & 2 else "") + ("\x1b[7m" if idx & 4 else "")
+    for idx in range(8)
+)
 
-def color(fg: _ColorCode = 7, bg: _OptionalColorCode = None, *, bold: bool = False, reverse: bool = False, underline: bool = False) -> ColorValue:
+
+def intern_color(value: ColorValue | ColorId | None, /) -> ColorId:
+    """Interns a color to a small integer id in the palette, precomputing its escape sequence as bytes
+
+    Args:
+        value (ColorValue | ColorId | None): color value, or an id which is returned as is. None and "" means no color
+
+    Raises:
+        ValueError: an id that is not in the palette was given
+
+    Returns:
+        ColorId: id of the color, where 0 means no color
+    """
+    if isinstance(value, int):
+        if not (len(_palette_values) > value >= 0):
+            raise ValueError(f"color id {value} is not in the palette")
+        return value
+    if not value:
+        return 0
+    color_id = _palette_ids.get(value)
+    if color_id is None:
+        with _palette_lock:
+            color_id = _palette_ids.get(value)
+            if color_id is None:
+                color_id = len(_palette_values)
+                _palette_values.append(value)
+                _palette_bytes.append(value.encode("utf-8"))
+                _palette_ids[value] = color_id
+    return color_id
+
+
+def get_color(color_id: ColorId, /) -> ColorValue:
+    """Returns the color value of an id in the palette
+
+    Args:
+        color_id (ColorId): id from `intern_color`
+
+    Returns:
+        ColorValue: ANSI color code as str, or "" for no color
+    """
+    return _palette_values[color_id]
+
+
+def get_color_bytes(color_id: ColorId, /) -> bytes:
+    """Returns the precomputed escape sequence of an id in the palette
+
+    Args:
+        color_id (ColorId): id from `intern_color`
+
+    Returns:
+        bytes: ANSI color code encoded as UTF-8, or b"" for no color
+    """
+    return _palette_bytes[color_id]
+
+
+# xterm 256 color palette: 16 system colors, a 6x6x6 color cube and 24 grays
+_SYSTEM_RGB = (
+    (0, 0, 0), (205, 0, 0), (0, 205, 0), (205, 205, 0), (0, 0, 238), (205, 0, 205), (0, 205, 205), (229, 229, 229),
+    (127, 127, 127), (255, 0, 0), (0, 255, 0), (255, 255, 0), (92, 92, 255), (255, 0, 255), (0, 255, 255), (255, 255, 255)
+)
+_CUBE_LEVELS = (0, 95, 135, 175, 215, 255)
+_XTERM_RGB = _SYSTEM_RGB + tuple(
+    (_CUBE_LEVELS[idx // 36], _CUBE_LEVELS[idx // 6 % 6], _CUBE_LEVELS[idx % 6]) for idx in range(216)
+) + tuple((8 + 10 * idx,) * 3 for idx in range(24))
+# nearest cube level and gray step of each channel value
+_CUBE_INDEX = bytes(min(range(6), key=lambda idx: abs(_CUBE_LEVELS[idx] - value)) for value in range(256))
+_GRAY_INDEX = bytes(min(23, max(0, round((value - 8) / 10))) for value in range(256))
+# nearest system color of each xterm 256 color
+_XTERM_TO_SYSTEM = bytes(
+    min(range(16), key=lambda idx: sum((a - b) ** 2 for a, b in zip(_SYSTEM_RGB[idx], rgb))) for rgb in _XTERM_RGB
+)
+_SEQUENCE_PATTERN = _re.compile("\x1b\\[([0-9;]*)m")
+_quantized: dict[tuple[ColorId, int], ColorId] = {} # (id, depth) -> id
+
+
+def _distance(first: tuple[int, ...], second: tuple[int, ...]) -> int:
+    return sum((a - b) ** 2 for a, b in zip(first, second))
+
+
+def _rgb_to_xterm(red: int, green: int, blue: int) -> int:
+    cube = 16 + 36 * _CUBE_INDEX[red] + 6 * _CUBE_INDEX[green] + _CUBE_INDEX[blue]
+    gray = 232 + _GRAY_INDEX[(red + green + blue) // 3]
+    rgb = (red, green, blue)
+    return cube if _distance(_XTERM_RGB[cube], rgb) <= _distance(_XTERM_RGB[gray], rgb) else gray
+
+
+def _rgb_to_system(red: int, green: int, blue: int) -> int:
+    rgb = (red, green, blue)
+    return min(range(16), key=lambda idx: _distance(_SYSTEM_RGB[idx], rgb))
+
+
+def _quantize_parameters(parameters: str, depth: int) -> str:
+    """Rewrites the parameters of a single SGR sequence, like "38;2;255;0;0", for the given color depth
+    """
+    parts = parameters.split(";")
+    if len(parts) < 3 or parts[0] not in ("38", "48"):
+        return parameters
+    is_background = parts[0] == "48"
+    try:
+        if parts[1] == "2" and len(parts) == 5: # 24 bit
+            red, green, blue = (min(255, max(0, int(part))) for part in parts[2:])
+            if depth == 8:
+                return f"{parts[0]};5;{_rgb_to_xterm(red, green, blue)}"
+            index = _rgb_to_system(red, green, blue)
+        elif parts[1] == "5" and len(parts) == 3: # 8 bit
+            if depth == 8:
+                return parameters
+            index = _XTERM_TO_SYSTEM[min(255, max(0, int(parts[2])))]
+        else:
+            return parameters
+    except ValueError:
+        return parameters
+    base = (40 if is_background else 30) if index < 8 else (100 if is_background else 90)
+    return str(base + index % 8)
+
+
+def quantize_color(color_id: ColorId, /, depth: int) -> ColorId:
+    """Maps a color to the nearest color available at a lower color depth, using precomputed lookup tables.
+    Results are cached, so that it can be called for every color of every frame
+
+    Args:
+        color_id (ColorId): id from `intern_color`
+        depth (int): bits per color, where 24 is truecolor, 8 is the xterm 256 color palette and 4 is the 16 system colors
+
+    Raises:
+        ValueError: unsupported color depth
+
+    Returns:
+        ColorId: id of the quantized color, using shorter escape sequences
+    """
+    if depth >= 24 or not color_id:
+        return color_id
+    key = (color_id, depth)
+    quantized = _quantized.get(key)
+    if quantized is None:
+        if depth not in (8, 4):
+            raise ValueError(f"unsupported color depth {depth}, expected 24, 8 or 4")
+        value = _SEQUENCE_PATTERN.sub(
+            lambda match: f"\x1b[{_quantize_parameters(match.group(1), depth)}m",
+            _palette_values[color_id]
+        )
+        quantized = intern_color(value)
+        _quantized[key] = quantized
+    return quantized
+
+
+def _finish(value: str, bold: bool, reverse: bool, underline: bool, as_id: bool) -> ColorValue | ColorId:
+    value += _STYLES[bold | underline << 1 | reverse << 2]
+    if as_id:
+        return intern_color(value)
+    return value
+
+
+@_overload
+def color(fg: _ColorCode = ..., bg: _OptionalColorCode = ..., *, bold: bool = ..., reverse: bool = ..., underline: bool = ..., as_id: _Literal[False] = ...) -> ColorValue: ...
+@_overload
+def color(fg: _ColorCode = ..., bg: _OptionalColorCode = ..., *, bold: bool = ..., reverse: bool = ..., underline: bool = ..., as_id: _Literal[True]) -> ColorId: ...
+def color(fg: _ColorCode = 7, bg: _OptionalColorCode = None, *, bold: bool = False, reverse: bool = False, underline: bool = False, as_id: bool = False) -> ColorValue | ColorId:
     """Creates a color from the given color code. Can be given both a foreground color and background color
 
     Args:
@@ -19,26 +189,23 @@ def color(fg: _ColorCode = 7, bg: _OptionalColorCode = None, *, bold: bool = Fal
         bold (bool, optional): applies bold style. Defaults to False.
         reverse (bool, optional): swaps fg and bg. Defaults to False.
         underline (bool, optional): adds an underline. Defaults to False.
+        as_id (bool, optional): whether to return the id of the color in the palette. Defaults to False.
 
     Returns:
-        ColorValue: ANSI color code as str
+        ColorValue | ColorId: ANSI color code as str, or its id
     """
     # NOTE: colors made using this function will not be equivalent to other colors defined in the RGB format
     value = f"\x1b[38;5;{fg}m"
-    if not (bold or reverse or underline):
-        return value
-    if bg is not None:
+    if bg is not None and (bold or reverse or underline):
         value += f"\x1b[48;5;{bg}m"
-    if bold:
-        value += f"\x1b[1m"
-    if underline:
-        value += f"\x1b[4m"
-    if reverse:
-        value += f"\x1b[7m"
-    return value
+    return _finish(value, bold, reverse, underline, as_id)
 
 
-def rgb_color(red: int = 0, green: int = 0, blue: int = 0, *, bold: bool = False, reverse: bool = False, underline: bool = False) -> ColorValue:
+@_overload
+def rgb_color(red: int = ..., green: int = ..., blue: int = ..., *, bold: bool = ..., reverse: bool = ..., underline: bool = ..., as_id: _Literal[False] = ...) -> ColorValue: ...
+@_overload
+def rgb_color(red: int = ..., green: int = ..., blue: int = ..., *, bold: bool = ..., reverse: bool = ..., underline: bool = ..., as_id: _Literal[True]) -> ColorId: ...
+def rgb_color(red: int = 0, green: int = 0, blue: int = 0, *, bold: bool = False, reverse: bool = False, underline: bool = False, as_id: bool = False) -> ColorValue | ColorId:
     """Creates a color from the given channels, which is red, green and blue. Can be given both a foreground color and background color
 
     Args:
@@ -48,23 +215,20 @@ def rgb_color(red: int = 0, green: int = 0, blue: int = 0, *, bold: bool = False
         bold (bool, optional): applies bold style. Defaults to False.
         reverse (bool, optional): swaps fg and bg. Defaults to False.
         underline (bool, optional): adds an underline. Defaults to False.
+        as_id (bool, optional): whether to return the id of the color in the palette. Defaults to False.
 
     Returns:
-        ColorValue: ANSI color code as str
+        ColorValue | ColorId: ANSI color code as str, or its id
     """
     value = "\x1b[38;2;{};{};{}m".format(red, green, blue)
-    if not (bold or reverse or underline):
-        return value
-    if bold:
-        value += f"\x1b[1m"
-    if underline:
-        value += f"\x1b[4m"
-    if reverse:
-        value += f"\x1b[7m"
-    return value
+    return _finish(value, bold, reverse, underline, as_id)
 
 
-def hex_color(fg: _HexCode = "#ffffff", bg: _OptionalHexCode = None, *, bold: bool = False, reverse: bool = False, underline: bool = False) -> ColorValue:
+@_overload
+def hex_color(fg: _HexCode = ..., bg: _OptionalHexCode = ..., *, bold: bool = ..., reverse: bool = ..., underline: bool = ..., as_id: _Literal[False] = ...) -> ColorValue: ...
+@_overload
+def hex_color(fg: _HexCode = ..., bg: _OptionalHexCode = ..., *, bold: bool = ..., reverse: bool = ..., underline: bool = ..., as_id: _Literal[True]) -> ColorId: ...
+def hex_color(fg: _HexCode = "#ffffff", bg: _OptionalHexCode = None, *, bold: bool = False, reverse: bool = False, underline: bool = False, as_id: bool = False) -> ColorValue | ColorId:
     """Creates a color from the given hex code. Can be given both a foreground color and background color
     The "#" in the hex codes are optional
 
@@ -74,9 +238,10 @@ def hex_color(fg: _HexCode = "#ffffff", bg: _OptionalHexCode = None, *, bold: bo
         bold (bool, optional): applies bold style. Defaults to False.
         reverse (bool, optional): swaps fg and bg. Defaults to False.
         underline (bool, optional): adds an underline. Defaults to False.
+        as_id (bool, optional): whether to return the id of the color in the palette. Defaults to False.
 
     Returns:
-        ColorValue: ANSI color code as str
+        ColorValue | ColorId: ANSI color code as str, or its id
     """
     fg = fg.lower()
     if fg.startswith("#"):
@@ -91,15 +256,7 @@ def hex_color(fg: _HexCode = "#ffffff", bg: _OptionalHexCode = None, *, bold: bo
 
     if bg is None:
         # does not compute background color
-        if not (bold or reverse or underline):
-            return value
-        if bold:
-            value += f"\x1b[1m"
-        if underline:
-            value += f"\x1b[4m"
-        if reverse:
-            value += f"\x1b[7m"
-        return value
+        return _finish(value, bold, reverse, underline, as_id)
 
     bg = bg.lower()
     if bg.startswith("#"):
@@ -111,15 +268,7 @@ def hex_color(fg: _HexCode = "#ffffff", bg: _OptionalHexCode = None, *, bold: bo
     green = int(bg[2:4], 16)
     blue = int(bg[4:6], 16)
     value += "\x1b[48;2;{};{};{}m".format(red, green, blue)
-    if not (bold or reverse or underline):
-        return value
-    if bold:
-        value += f"\x1b[1m"
-    if underline:
-        value += f"\x1b[4m"
-    if reverse:
-        value += f"\x1b[7m"
-    return value
+    return _finish(value, bold, reverse, underline, as_id)
 
 
 def rand_color(fg: bool = True, bg: bool = False, *, bold: bool = False, reverse: bool = False, underline: bool = False) -> ColorValue:
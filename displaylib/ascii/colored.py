@@ -3,11 +3,11 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, cast
 
 from ..template.type_hints import MroNext, NodeType
-from .color import RESET, WHITE
+from .color import RESET, WHITE, get_color
 from .type_hints import ValidColorNode
 
 if TYPE_CHECKING:
-    from .color import ColorValue
+    from .color import ColorValue, ColorId
 
 
 class Color: # Component (mixin class)
@@ -17,7 +17,7 @@ class Color: # Component (mixin class)
         - `Transform2D`: uses position and rotation to place the texture
         - `Texture`: allows the node to be displayed
     """
-    color: ColorValue
+    color: ColorValue | ColorId # either a value, or its id in the palette
     
     def __new__(cls: type[NodeType], *args, color = None, **kwargs) -> NodeType:
         mro_next = cast(MroNext[ValidColorNode], super())
@@ -36,8 +36,19 @@ class Color: # Component (mixin class)
             list[list[str]]: colorized texture
         """
         self = cast(ValidColorNode, self) # fixes type hints
+        color = self.color if isinstance(self.color, str) else get_color(self.color)
         transparent = self.root.screen.cell_transparant
         return [
-            [self.color + char + RESET if char != transparent else char for char in line]
+            [color + char + RESET if char != transparent else char for char in line]
             for line in self.texture
-        ] if self.color != WHITE else self.texture
+        ] if color != WHITE else self.texture
+
+    def _get_final_color(self) -> ColorValue | None:
+        """Returns the color applied to the texture. WHITE color is treated as no color, like in `._get_final_texture()`
+
+        Returns:
+            ColorValue | None: color, or None if WHITE
+        """
+        self = cast(ValidColorNode, self) # fixes type hints
+        color = self.color if isinstance(self.color, str) else get_color(self.color)
+        return color if color != WHITE else None
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import os
+import signal
+import threading
 from typing import TYPE_CHECKING, cast
 
 from ..math import Vec2i
@@ -8,6 +10,10 @@ from ..template import Node, Engine
 from ..template.type_hints import MroNext, EngineType
 from .clock import Clock
 from .screen import AsciiScreen
+from .writer import FrameWriter
+from .recording import Recorder
+from .spatial import SpatialGrid
+from .governor import OutputGovernor
 from .camera import AsciiCamera
 from .node import Ascii
 from .texture import Texture
@@ -28,8 +34,10 @@ class AsciiEngine(Engine):
     auto_resize_screen: bool
     screen_margin: Vec2i
     screen: AsciiScreen
+    _resize_requested: bool = False # set by SIGWINCH
+    _spatial_index_skips: int = 0 # frames left to render without the spatial index
 
-    def __new__(cls: type[EngineType], *, tps: float = 16, width: int = 16, height: int = 8, initial_clear: bool = False, auto_resize_screen: bool = False, screen_margin: Vec2i = Vec2i(1, 1), **config) -> EngineType:
+    def __new__(cls: type[EngineType], *, tps: float = 16, width: int = 16, height: int = 8, initial_clear: bool = False, auto_resize_screen: bool = False, screen_margin: Vec2i = Vec2i(1, 1), double_buffered: bool = False, screen_type: type[AsciiScreen] = AsciiScreen, record: str | None = None, spatial_index: bool = False, adaptive_output: bool = False, frame_timing: bool = False, profile_nodes: bool = False, **config) -> EngineType:
         """Sets `Node.root` when an Engine instance is created. Initializes default `AsciiCamera`
 
         Args:
@@ -39,29 +47,39 @@ class AsciiEngine(Engine):
             EngineType: the engine to be used in the program
         """
         mro_next = cast(MroNext[AsciiEngine], super())
-        instance = mro_next.__new__(cls, tps=tps, **config)
+        instance = mro_next.__new__(cls, tps=tps, frame_timing=frame_timing, profile_nodes=profile_nodes, **config)
         instance.tps = tps
         instance.auto_resize_screen = auto_resize_screen
         instance.screen_margin = screen_margin
-        instance.screen = AsciiScreen(width=width, height=height)
+        instance.screen = screen_type(width=width, height=height)
+        if double_buffered:
+            instance.screen.writer = FrameWriter(instance.screen)
+        if record is not None:
+            instance.screen.recorder = Recorder(instance.screen, record)
+        if adaptive_output:
+            instance.screen.governor = OutputGovernor(instance.screen, tps)
+        if spatial_index:
+            Texture._spatial_index = SpatialGrid()
+            for textured in Texture._instances:
+                Texture._spatial_index.insert(textured)
         
-        if auto_resize_screen:
+        if auto_resize_screen and instance.screen.is_terminal:
             terminal_size = os.get_terminal_size()
             if terminal_size.columns != instance.screen.width or terminal_size.lines != instance.screen.height:
                 instance.screen.width = int(terminal_size.columns - instance.screen_margin.x)
                 instance.screen.height = int(terminal_size.lines - instance.screen_margin.y)
                 if not initial_clear: # only clear once, so wait a bit to do it anyways
-                    os.system("cls")
+                    instance.screen.clear_terminal()
 
-        if initial_clear:
-            os.system("cls")
+        if initial_clear and instance.screen.is_terminal:
+            instance.screen.clear_terminal()
 
         if not hasattr(AsciiCamera, "current"):
             camera = AsciiCamera()
             AsciiCamera.current = camera # initialize default camera
         return cast(EngineType, instance)
 
-    def __init__(self, *, tps: float = 16, width: int = 16, height: int = 8, initial_clear: bool = False, auto_resize_screen: bool = False, screen_margin: Vec2i = Vec2i(1, 1), **config) -> None:
+    def __init__(self, *, tps: float = 16, width: int = 16, height: int = 8, initial_clear: bool = False, auto_resize_screen: bool = False, screen_margin: Vec2i = Vec2i(1, 1), double_buffered: bool = False, screen_type: type[AsciiScreen] = AsciiScreen, record: str | None = None, spatial_index: bool = False, adaptive_output: bool = False, frame_timing: bool = False, profile_nodes: bool = False, **config) -> None:
         """Initializes and starts the engine (only 1 instance should exist)
 
         Args:
@@ -71,6 +89,13 @@ class AsciiEngine(Engine):
             initial_clear (bool, optional): clear the screen on start. Defaults to False.
             auto_resize_screen (bool, optional): whether to automatically resize the screen to fit. Defaults to False.
             screen_margin (Vec2i, optional): subtracted from os terminal size. Defaults to Vec2i(1, 1).
+            double_buffered (bool, optional): write frames from a background thread, dropping stale frames. Defaults to False.
+            screen_type (type[AsciiScreen], optional): screen backend, like `NullScreen` or `MemoryScreen` when running without a terminal. Defaults to AsciiScreen.
+            record (str | None, optional): path of a recording to append the frames shown to. Defaults to None.
+            spatial_index (bool, optional): keep textured nodes in a `SpatialGrid`, so that only nodes near the viewport are rendered. Meant for scenes where most nodes are still. Defaults to False.
+            adaptive_output (bool, optional): degrade the output with an `OutputGovernor` when the terminal can't keep up, instead of falling behind. Defaults to False.
+            frame_timing (bool, optional): measure the phases of each frame in `.frame_timer`, to find where frame time goes. Defaults to False.
+            profile_nodes (bool, optional): measure `_update` of each node in `.node_profiler`, reported at exit. Defaults to False.
         """
         super().__init__(tps=tps)
     
@@ -89,45 +114,117 @@ class AsciiEngine(Engine):
     def _main_loop(self) -> None:
         """Overriden main loop spesific for `displaylib.ascii` mode
         """
-        Node.nodes = {uid: node for uid, node in sorted(Node.nodes.items(), key=self.sort_function_for_process_priority)}
         clock = Clock(self.tps)
-        while self.is_running:
-            self.screen.clear()
-
-            if self.auto_resize_screen:
-                terminal_size = os.get_terminal_size()
-                if ((terminal_size.columns - self.screen_margin.x) != self.screen.width) or ((terminal_size.lines - self.screen_margin.y) != self.screen.height):
-                    self.screen.width = int(terminal_size.columns - self.screen_margin.x)
-                    self.screen.height = int(terminal_size.lines - self.screen_margin.y)
-                    self.screen.clear() # used to resize its `.texture`
-                    size = Vec2i(terminal_size.columns, terminal_size.lines)
-                    self._on_screen_resize(size)
-                    for node in Node.nodes.values():
-                        if isinstance(node, Ascii):
-                            node._on_screen_resize(size)
-                    os.system("cls")
+        if self.screen.recorder is not None: # timestamps from the engine clock
+            self.screen.recorder.clock = clock
+        # on platforms with SIGWINCH, the terminal size is only checked after the terminal was resized
+        resize_signal = getattr(signal, "SIGWINCH", None)
+        if not (self.auto_resize_screen and self.screen.is_terminal) or threading.current_thread() is not threading.main_thread():
+            resize_signal = None # signal handlers can only be set from the main thread
+        previous_handler = None
+        if resize_signal is not None:
+            self._resize_requested = False
+            previous_handler = signal.signal(resize_signal, self._on_resize_signal)
+        timer = self.frame_timer # every phase is only marked when enabled
+        profiler = self.node_profiler
+        if timer is not None:
+            timer.begin_frame()
+        try:
+            while self.is_running:
+                # the governor may skip rendering ticks, while nodes are still updated every tick
+                is_rendering = self.screen.governor is None or self.screen.governor.should_render()
+                if is_rendering and not self.screen.dirty_tracking: # otherwise, only changed regions are cleared when rendering
+                    self.screen.clear()
+
+                if self.auto_resize_screen and self.screen.is_terminal and (resize_signal is None or self._resize_requested):
+                    self._resize_requested = False
+                    self._apply_terminal_size()
+                if timer is not None:
+                    timer.mark("clear")
                 
-            for task in self.per_frame_tasks:
-                task() # type: ignore
-            
-            self._update(clock.delta_time)
-            for node in tuple(Node.nodes.values()): # tuple, because removing a ref in lets say an list will free the node during iteration
-                node._update(clock.delta_time)
-
-            if Node._request_process_priority_sort: # only sort once per frame if needed
-                for uid in Node._queued_nodes:
-                    del Node.nodes[uid]
-                Node._queued_nodes.clear()
-                Node.nodes = {uid: node for uid, node in sorted(Node.nodes.items(), key=self.sort_function_for_process_priority)}
-            if Texture._request_z_index_sort:
-                Texture._instances.sort(key=self.sort_function_for_z_index)
-
-            # render content of visible nodes onto a surface
-            self.screen.render(Texture._instances)
+                for task in self.per_frame_tasks:
+                    task() # type: ignore
+                if timer is not None:
+                    timer.mark("tasks")
             
+                self._update(clock.delta_time)
+                if timer is not None:
+                    timer.mark("update")
+                if profiler is None:
+                    for node in Node.get_process_order(): # tuple, so nodes created or freed meanwhile do not affect the iteration
+                        node._update(clock.delta_time)
+                else:
+                    profiler.update_nodes(Node.get_process_order(), clock.delta_time)
+                if timer is not None:
+                    timer.mark("nodes")
+
+                if Node._queued_nodes: # process order is kept up to date by `Node`, so only freed nodes are handled here
+                    Node._free_queued_nodes()
+                if timer is not None:
+                    timer.mark("sort")
+                if Texture._request_z_index_sort:
+                    Texture._instances.sort(key=self.sort_function_for_z_index)
+                if timer is not None:
+                    timer.mark("z_sort")
+
+                # render content of visible nodes onto a surface
+                if is_rendering:
+                    self._render()
+                    if timer is not None:
+                        timer.mark("render")
+                    self.screen.show()
+                    if timer is not None:
+                        timer.mark("show")
+                clock.tick()
+                if timer is not None:
+                    timer.mark("sleep")
+                    timer.end_frame()
+
+            self.screen.clear()
+            self._render()
             self.screen.show()
-            clock.tick()
-        
-        self.screen.clear()
-        self.screen.render(Texture._instances)
-        self.screen.show()
+        finally: # also when interrupted, so that queued frames are written and the recording gets its index
+            if resize_signal is not None:
+                signal.signal(resize_signal, previous_handler)
+            try:
+                if self.screen.writer is not None: # wait for the last frame to be written
+                    self.screen.writer.stop()
+            finally:
+                if self.screen.recorder is not None:
+                    self.screen.recorder.close()
+
+    def _render(self) -> None:
+        """Renders textured nodes onto the screen, only querying those near the viewport when using a spatial index.
+        While most nodes move, every node is rendered and culled instead, as refreshing the index would cost more
+        """
+        index = Texture._spatial_index
+        if index is None:
+            self.screen.render(Texture._instances)
+            return
+        if self._spatial_index_skips > 0: # scene was busy, see `SpatialGrid.is_busy`
+            self._spatial_index_skips -= 1
+            self.screen.render(Texture._instances)
+            return
+        index.refresh() # nodes may have moved since last frame
+        if index.is_busy:
+            self._spatial_index_skips = index.busy_frames
+        self.screen.render(index.query_rect(self.screen.get_viewport_rect()))
+
+    def _on_resize_signal(self, _signum: int, _frame: object) -> None:
+        """Marks the terminal as resized. The new size is applied between frames
+        """
+        self._resize_requested = True
+
+    def _apply_terminal_size(self) -> None:
+        """Resizes the screen to fit the terminal, and notifies nodes overriding `_on_screen_resize`
+        """
+        terminal_size = os.get_terminal_size()
+        if ((terminal_size.columns - self.screen_margin.x) != self.screen.width) or ((terminal_size.lines - self.screen_margin.y) != self.screen.height):
+            self.screen.width = int(terminal_size.columns - self.screen_margin.x)
+            self.screen.height = int(terminal_size.lines - self.screen_margin.y)
+            self.screen.clear() # used to resize its `.texture`
+            size = Vec2i(terminal_size.columns, terminal_size.lines)
+            self._on_screen_resize(size)
+            for node in tuple(Ascii._resize_listeners.values()):
+                node._on_screen_resize(size)
+            self.screen.clear_terminal()
@@ -0,0 +1,582 @@
+"""### Framebuffer module
+
+Provides a compact, array backed storage of cells, used by `AsciiScreen`
+"""
+
+from __future__ import annotations as _annotations
+
+__all__ = [
+    "Framebuffer",
+    "FramebufferRow",
+    "RotatedRaster",
+    "encode_cell",
+    "decode_cell",
+    "encode_attribute",
+    "decode_attribute",
+    "rasterize_rotated"
+]
+
+import sys as _sys
+import re as _re
+import math as _math
+import functools as _functools
+import threading as _threading
+import itertools as _itertools
+from array import array as _array
+from collections.abc import Iterator as _Iterator, Sequence as _Sequence
+from typing import NamedTuple as _NamedTuple, Iterable as _Iterable, overload as _overload
+
+from . import text as _text
+from .color import RESET as _RESET, ColorValue as _ColorValue, ColorId as _ColorId, intern_color as _intern_color, get_color as _get_color, quantize_color as _quantize_color
+from .texture import CompiledTexture as _CompiledTexture
+
+# native byte order, so that `array("I")` can be decoded in bulk
+_UTF32 = "utf-32-le" if _sys.byteorder == "little" else "utf-32-be"
+# cells that are not a single character are interned as codes in the supplementary private use area A
+_EXTENDED_START = 0xF0000
+_EXTENDED_END = 0xFFFFE
+_extended_codes: dict[str, int] = {}
+_extended_table: dict[int, str] = {} # code -> cell, usable with `str.translate`
+_extended_lock = _threading.Lock() # frames may be encoded and decoded on different threads
+_translation_tables: dict[tuple[str, str], tuple[int, dict[int, str]]] = {} # (transparent, default) -> (amount of interned cells, table)
+
+
+def encode_cell(cell: str, /) -> int:
+    """Encodes a cell to a code storable in a `Framebuffer`
+
+    Single characters are stored as their codepoint, while other strings are interned
+
+    Args:
+        cell (str): content of the cell
+
+    Raises:
+        OverflowError: too many unique multi-character cells were interned
+
+    Returns:
+        int: cell code
+    """
+    if len(cell) == 1:
+        return ord(cell)
+    code = _extended_codes.get(cell)
+    if code is None:
+        with _extended_lock:
+            code = _extended_codes.get(cell)
+            if code is None:
+                code = _EXTENDED_START + len(_extended_codes)
+                if code >= _EXTENDED_END:
+                    raise OverflowError("ran out of codes for multi-character cells")
+                _extended_table[code] = cell
+                _extended_codes[cell] = code
+    return code
+
+
+def decode_cell(code: int, /) -> str:
+    """Decodes a cell code from a `Framebuffer`
+
+    Args:
+        code (int): cell code
+
+    Returns:
+        str: content of the cell
+    """
+    if code in _extended_table:
+        return _extended_table[code]
+    return chr(code)
+
+
+def encode_attribute(value: _ColorValue | _ColorId | None, /) -> int:
+    """Interns a color value (ANSI escape sequence) to an attribute id storable in a `Framebuffer`.
+    Attribute ids are the ids of the color palette
+
+    Args:
+        value (ColorValue | ColorId | None): color value or id, where None and "" means no attribute
+
+    Returns:
+        int: attribute id
+    """
+    return _intern_color(value)
+
+
+def decode_attribute(attribute: int, /) -> str:
+    """Returns the color value of an attribute id
+
+    Args:
+        attribute (int): attribute id
+
+    Returns:
+        str: color value, or "" for no attribute
+    """
+    return _get_color(attribute)
+
+
+class RotatedRaster(_NamedTuple):
+    """Destination offsets and codes of the opaque cells in a rotated texture,
+    relative to the texture's pivot in screen space, rounded to whole cells
+    """
+    xs: tuple[int, ...]
+    ys: tuple[int, ...]
+    codes: tuple[int, ...]
+    left: int
+    right: int
+    top: int
+    bottom: int
+    indices: dict[int, tuple[int, ...]] # stride -> flat offsets, filled by `Framebuffer.blit_rotated()`
+
+
+def rasterize_rotated(texture: _Sequence[_Sequence[str]], angle: float, x_offset: float, y_offset: float, /, transparent: str = " ", *, buckets: int = 720, texture_key: tuple[_Sequence[str], ...] | None = None) -> RotatedRaster:
+    """Computes where each opaque cell of a texture lands when rotated around (x_offset, y_offset)
+
+    The angle is snapped to one of `buckets` steps per full turn,
+    so that the result can be cached for nodes that keep spinning
+
+    Args:
+        texture (Sequence[Sequence[str]]): rows of cells
+        angle (float): counter clockwise rotation in radians
+        x_offset (float): horizontal pivot, relative to the texture's top left corner
+        y_offset (float): vertical pivot, relative to the texture's top left corner
+        transparent (str, optional): content marking a transparent cell. Defaults to " ".
+        buckets (int, optional): angle steps per full turn. Defaults to 720.
+        texture_key (tuple[Sequence[str], ...] | None, optional): rows of the texture as tuples, like from `Texture._get_texture_key()`.
+            Defaults to None, converting `texture` on every call.
+
+    Returns:
+        RotatedRaster: cached raster of the texture
+    """
+    bucket = round((angle % _math.tau) / _math.tau * buckets) % buckets
+    if texture_key is None:
+        texture_key = texture.rows if isinstance(texture, _CompiledTexture) else tuple(map(tuple, texture))
+    return _rasterize_rotated(texture_key, bucket, buckets, x_offset, y_offset, transparent, _text.Conversion._version)
+
+
+@_functools.lru_cache(maxsize=1024)
+def _rasterize_rotated(texture_key: tuple[_Sequence[str], ...], bucket: int, buckets: int, x_offset: float, y_offset: float, transparent: str, _version: int) -> RotatedRaster:
+    angle = bucket / buckets * _math.tau
+    cos_rotation = _math.cos(-angle)
+    sin_rotation = _math.sin(-angle)
+    glyphs: dict[str, int] = {} # rotated glyph codes, resolved once per symbol
+    xs: list[int] = []
+    ys: list[int] = []
+    codes: list[int] = []
+    for h, line in enumerate(texture_key):
+        y_diff = h - y_offset
+        for w, char in enumerate(line):
+            if char == transparent:
+                continue
+            x_diff = w - x_offset
+            xs.append(round(cos_rotation * x_diff - sin_rotation * y_diff))
+            ys.append(round(sin_rotation * x_diff + cos_rotation * y_diff))
+            if char not in glyphs:
+                glyphs[char] = encode_cell(_text.rotate(char, angle))
+            codes.append(glyphs[char])
+    if not codes:
+        return RotatedRaster((), (), (), 0, 0, 0, 0, {})
+    return RotatedRaster(tuple(xs), tuple(ys), tuple(codes), min(xs), max(xs), min(ys), max(ys), {})
+
+
+def _get_translation_table(transparent: str, default: str) -> dict[int, str]:
+    """Returns a table for `str.translate` that decodes interned cells and replaces transparent cells.
+    Tables are cached, and only rebuilt when more cells have been interned
+
+    Args:
+        transparent (str): content marking a transparent cell
+        default (str): replacement for transparent cells
+
+    Returns:
+        dict[int, str]: translation table, which should not be modified
+    """
+    size = len(_extended_table) # counted before copying, so that cells interned meanwhile cause a rebuild
+    cached = _translation_tables.get((transparent, default))
+    if cached is not None and cached[0] == size:
+        return cached[1]
+    table = dict(_extended_table)
+    if transparent != default:
+        table[encode_cell(transparent)] = default
+    _translation_tables[(transparent, default)] = (size, table)
+    return table
+
+
+class Framebuffer:
+    """`Framebuffer` storing cells as a flat `array("I")` of codes, in rows of `.stride` cells
+
+    Colors are stored next to the cells, in `.colors` as attribute ids.
+    An attribute id stands for the whole color value of a node, with foreground, background and style combined,
+    as that is how nodes hold their color. The cell at (x, y) is found at index `y * stride + x` in both
+    """
+    __slots__ = ("width", "height", "stride", "cells", "colors", "_fill_code")
+    width: int
+    height: int
+    stride: int
+    cells: _array[int]
+    colors: _array[int]
+
+    def __init__(self, width: int, height: int, /, fill: str = " ") -> None:
+        """Allocates the framebuffer, with every cell set to `fill`
+
+        Args:
+            width (int): cells per row
+            height (int): amount of rows
+            fill (str, optional): initial content of every cell. Defaults to " ".
+        """
+        self._fill_code = encode_cell(fill)
+        self.resize(width, height)
+
+    def resize(self, width: int, height: int, /) -> None:
+        """Reallocates the framebuffer with a new size. Content is reset to the last fill
+
+        Args:
+            width (int): cells per row
+            height (int): amount of rows
+        """
+        self.width = max(0, width)
+        self.height = max(0, height)
+        self.stride = self.width
+        self.cells = _array("I", [self._fill_code]) * (self.stride * self.height)
+        self.colors = _array("I", [0]) * (self.stride * self.height)
+
+    def copy(self) -> Framebuffer:
+        """Copies the framebuffer, so that it can be kept as a snapshot
+
+        Returns:
+            Framebuffer: independent copy
+        """
+        framebuffer = Framebuffer.__new__(Framebuffer)
+        framebuffer.width = self.width
+        framebuffer.height = self.height
+        framebuffer.stride = self.stride
+        framebuffer.cells = _array("I", self.cells)
+        framebuffer.colors = _array("I", self.colors)
+        framebuffer._fill_code = self._fill_code
+        return framebuffer
+
+    def fill(self, cell: str, /) -> None:
+        """Sets every cell to `cell` without any color, in place
+
+        Args:
+            cell (str): new content of every cell
+        """
+        self._fill_code = encode_cell(cell)
+        self.cells[:] = _array("I", [self._fill_code]) * len(self.cells)
+        self.colors[:] = _array("I", [0]) * len(self.colors)
+
+    def fill_rect(self, rect: tuple[int, int, int, int], cell: str, /) -> None:
+        """Sets every cell inside `rect` to `cell` without any color, in place
+
+        Args:
+            rect (tuple[int, int, int, int]): area as (left, top, right, bottom), where right and bottom are exclusive
+            cell (str): new content of the cells
+        """
+        left, top, right, bottom = rect
+        left = max(0, left)
+        right = min(self.width, right)
+        if left >= right:
+            return
+        code_run = _array("I", [encode_cell(cell)]) * (right - left)
+        color_run = _array("I", [0]) * (right - left)
+        for y in range(max(0, top), min(self.height, bottom)):
+            start = y * self.stride + left
+            self.cells[start:start + len(code_run)] = code_run
+            self.colors[start:start + len(color_run)] = color_run
+
+    def get_opaque_runs(self, transparent: str = " ", /) -> list[tuple[int, int]]:
+        """Finds runs of cells that are not `transparent`, as ranges into the flat `.cells`.
+        Runs may continue across rows
+
+        Args:
+            transparent (str, optional): content marking a transparent cell. Defaults to " ".
+
+        Returns:
+            list[tuple[int, int]]: runs as (start, end), where end is exclusive
+        """
+        text = self.cells.tobytes().decode(_UTF32) # each cell decodes to exactly one character
+        pattern = f"[^{_re.escape(chr(encode_cell(transparent)))}]+"
+        return [match.span() for match in _re.finditer(pattern, text)]
+
+    def paste(self, source: Framebuffer, runs: _Sequence[tuple[int, int]], /) -> None:
+        """Copies runs of cells and their colors from a framebuffer of the same size
+
+        Args:
+            source (Framebuffer): framebuffer to copy from
+            runs (Sequence[tuple[int, int]]): runs as (start, end), usually from `.get_opaque_runs()`
+        """
+        cells = self.cells
+        colors = self.colors
+        source_cells = source.cells
+        source_colors = source.colors
+        for start, end in runs:
+            cells[start:end] = source_cells[start:end]
+            colors[start:end] = source_colors[start:end]
+
+    def decode(self, start: int, end: int, /, transparent: str = " ", default: str = " ", *, styled: bool = False, color_depth: int = 24) -> str:
+        """Decodes a range of cells in bulk, replacing `transparent` cells with `default`
+
+        When `styled`, a color escape sequence is only emitted where the color changes along the range
+
+        Args:
+            start (int): first index
+            end (int): end index (exclusive)
+            transparent (str, optional): content marking a transparent cell. Defaults to " ".
+            default (str, optional): replacement for transparent cells. Defaults to " ".
+            styled (bool, optional): whether to include colors. Defaults to False.
+            color_depth (int, optional): bits per color, where colors are quantized below 24. Defaults to 24.
+
+        Returns:
+            str: decoded cells
+        """
+        chunk = self.cells[start:end]
+        if not chunk:
+            return ""
+        text = chunk.tobytes().decode(_UTF32)
+        has_extended = max(chunk) >= _EXTENDED_START
+        if not has_extended: # only single characters
+            if transparent != default:
+                text = text.replace(transparent, default)
+        elif not styled:
+            return text.translate(_get_translation_table(transparent, default))
+        if not styled:
+            return text
+        colors = self.colors[start:end]
+        if colors.count(0) == len(colors): # no colors
+            return text if not has_extended else text.translate(_get_translation_table(transparent, default))
+        parts: str | list[str] = text
+        if has_extended: # split into cells, since interned cells decode to multiple characters
+            table = _get_translation_table(transparent, default)
+            parts = [char.translate(table) for char in text]
+        pieces: list[str] = []
+        current = 0
+        x = 0
+        for attribute, group in _itertools.groupby(colors):
+            count = len(list(group))
+            if color_depth < 24:
+                attribute = _quantize_color(attribute, color_depth) # neighbours may become the same color
+            if attribute != current:
+                if current:
+                    pieces.append(_RESET)
+                if attribute:
+                    pieces.append(_get_color(attribute))
+                current = attribute
+            pieces.append("".join(parts[x:x + count]))
+            x += count
+        if current:
+            pieces.append(_RESET)
+        return "".join(pieces)
+
+    def get_lines(self, transparent: str = " ", default: str = " ", *, styled: bool = False, color_depth: int = 24) -> list[str]:
+        """Decodes every row, replacing `transparent` cells with `default`
+
+        Args:
+            transparent (str, optional): content marking a transparent cell. Defaults to " ".
+            default (str, optional): replacement for transparent cells. Defaults to " ".
+            styled (bool, optional): whether to include colors. Defaults to False.
+            color_depth (int, optional): bits per color, where colors are quantized below 24. Defaults to 24.
+
+        Returns:
+            list[str]: decoded rows
+        """
+        stride = self.stride
+        if not self.cells:
+            return ["" for _ in range(self.height)]
+        if styled and self.colors.count(0) != len(self.colors):
+            return [self.decode(start, start + stride, transparent, default, styled=True, color_depth=color_depth)
+                    for start in range(0, len(self.cells), stride)]
+        text = self.cells.tobytes().decode(_UTF32)
+        lines = [text[idx:idx + stride] for idx in range(0, len(text), stride)]
+        if max(self.cells) < _EXTENDED_START: # only single characters
+            if transparent != default:
+                return [line.replace(transparent, default) for line in lines]
+            return lines
+        table = _get_translation_table(transparent, default)
+        return [line.translate(table) for line in lines]
+
+    def blit(self, texture: _Sequence[_Sequence[str]], x: float, y: float, /, transparent: str = " ", color: int = 0, *, clip: tuple[int, int, int, int] | None = None) -> None:
+        """Copies a texture onto the framebuffer, with its top left corner at (x, y)
+
+        The texture rectangle is clipped to the framebuffer once, and each row is copied as slices of opaque runs.
+        Cells are placed at `int(x + column)` and `int(y + row)`, and `transparent` cells are skipped.
+        A `CompiledTexture` with the same transparent cell has its precomputed spans copied directly
+
+        Args:
+            texture (Sequence[Sequence[str]]): rows of cells
+            x (float): horizontal position of the top left corner
+            y (float): vertical position of the top left corner
+            transparent (str, optional): content marking a transparent cell. Defaults to " ".
+            color (int, optional): attribute id of the copied cells. Defaults to 0.
+            clip (tuple[int, int, int, int] | None, optional): only copy cells inside (left, top, right, bottom). Defaults to None.
+        """
+        left, top, right, bottom = (0, 0, self.width, self.height) if clip is None else clip
+        left = max(0, left)
+        top = max(0, top)
+        right = min(self.width, right)
+        bottom = min(self.height, bottom)
+        if left >= right or top >= bottom:
+            return
+        stride = self.stride
+        cells = self.cells
+        colors = self.colors
+        color_array = _array("I", [color])
+        x_floor = _math.floor(x)
+        first = 0 if x >= 0 else _math.ceil(-x) # first column where `x + column >= 0`
+        # a negative, fractional `x` truncates the column before `first` onto column 0 as well
+        straddle = first - 1 if x < 0 and x != x_floor and left == 0 else -1
+        first = max(first, left - x_floor)
+        last = right - x_floor # columns before this are inside
+        if isinstance(texture, _CompiledTexture) and texture.transparent == transparent:
+            for h, (row, spans, codes) in enumerate(zip(texture.rows, texture.spans, texture.codes)):
+                y_position = int(h + y)
+                if not (bottom > y_position >= top): # out of screen
+                    continue
+                row_start = y_position * stride
+                if straddle != -1 and straddle < len(row) and row[straddle] != transparent:
+                    cells[row_start] = ord(row[straddle])
+                    colors[row_start] = color
+                dest = row_start + x_floor
+                for (start, end), span_codes in zip(spans, codes):
+                    if start >= first and end <= last: # whole span
+                        cells[dest + start:dest + end] = span_codes
+                    else:
+                        start_clipped = max(start, first)
+                        end_clipped = min(end, last)
+                        if start_clipped >= end_clipped: # out of screen
+                            continue
+                        cells[dest + start_clipped:dest + end_clipped] = span_codes[start_clipped - start:end_clipped - start]
+                        start, end = start_clipped, end_clipped
+                    colors[dest + start:dest + end] = color_array * (end - start)
+            return
+        opaque_only = len(transparent) != 1 # then no single character can be transparent
+        for h, line in enumerate(texture):
+            y_position = int(h + y)
+            if not (bottom > y_position >= top): # out of screen
+                continue
+            row_start = y_position * stride
+            if straddle != -1 and straddle < len(line):
+                char = line[straddle]
+                if char != transparent:
+                    cells[row_start] = encode_cell(char)
+                    colors[row_start] = color
+            end = min(len(line), last)
+            if first >= end: # out of screen
+                continue
+            segment = line[first:end]
+            joined = "".join(segment)
+            dest = row_start + first + x_floor
+            if len(joined) != end - first: # contains multi-character cells
+                for w, char in enumerate(segment):
+                    if char != transparent:
+                        cells[dest + w] = encode_cell(char)
+                        colors[dest + w] = color
+            elif opaque_only or transparent not in joined:
+                cells[dest:dest + len(joined)] = _array("I", joined.encode(_UTF32))
+                colors[dest:dest + len(joined)] = color_array * len(joined)
+            else: # copy each opaque run
+                for run in joined.split(transparent):
+                    if run:
+                        cells[dest:dest + len(run)] = _array("I", run.encode(_UTF32))
+                        colors[dest:dest + len(run)] = color_array * len(run)
+                    dest += len(run) + 1
+
+    def blit_rotated(self, raster: RotatedRaster, x: float, y: float, /, color: int = 0, *, clip: tuple[int, int, int, int] | None = None) -> None:
+        """Copies a rotated raster onto the framebuffer, with its pivot at (x, y)
+
+        Cells are placed at `round(x) + offset`, and bounds checks are skipped when the raster is fully inside
+
+        Args:
+            raster (RotatedRaster): raster from `rasterize_rotated`
+            x (float): horizontal position of the pivot
+            y (float): vertical position of the pivot
+            color (int, optional): attribute id of the copied cells. Defaults to 0.
+            clip (tuple[int, int, int, int] | None, optional): only copy cells inside (left, top, right, bottom). Defaults to None.
+        """
+        clip_left, clip_top, clip_right, clip_bottom = (0, 0, self.width, self.height) if clip is None else clip
+        clip_left = max(0, clip_left)
+        clip_top = max(0, clip_top)
+        clip_right = min(self.width, clip_right)
+        clip_bottom = min(self.height, clip_bottom)
+        stride = self.stride
+        cells = self.cells
+        colors = self.colors
+        x_pivot = round(x)
+        y_pivot = round(y)
+        left = x_pivot + raster.left
+        right = x_pivot + raster.right
+        top = y_pivot + raster.top
+        bottom = y_pivot + raster.bottom
+        if right < clip_left or bottom < clip_top or left >= clip_right or top >= clip_bottom: # out of screen
+            return
+        if left >= clip_left and top >= clip_top and right < clip_right and bottom < clip_bottom: # fully inside
+            indices = raster.indices.get(stride)
+            if indices is None:
+                indices = raster.indices[stride] = tuple(y_diff * stride + x_diff for x_diff, y_diff in zip(raster.xs, raster.ys))
+            start = y_pivot * stride + x_pivot
+            for index, code in zip(indices, raster.codes):
+                cells[start + index] = code
+                colors[start + index] = color
+            return
+        for x_diff, y_diff, code in zip(raster.xs, raster.ys, raster.codes):
+            x_position = x_pivot + x_diff
+            y_position = y_pivot + y_diff
+            if (clip_right > x_position >= clip_left) and (clip_bottom > y_position >= clip_top):
+                index = y_position * stride + x_position
+                cells[index] = code
+                colors[index] = color
+
+
+class FramebufferRow:
+    """Mutable view of a single row in a `Framebuffer`, behaving like `list[str]`
+
+    Colored cells are read as `color + cell + RESET`
+    """
+    __slots__ = ("_framebuffer", "_start")
+
+    def __init__(self, framebuffer: Framebuffer, y: int, /) -> None:
+        self._framebuffer = framebuffer
+        self._start = y * framebuffer.stride
+
+    def __len__(self) -> int:
+        return self._framebuffer.width
+
+    @_overload
+    def __getitem__(self, x: int) -> str: ...
+    @_overload
+    def __getitem__(self, x: slice) -> list[str]: ...
+    def __getitem__(self, x: int | slice) -> str | list[str]:
+        width = self._framebuffer.width
+        if isinstance(x, slice):
+            return [self[idx] for idx in range(*x.indices(width))]
+        if x < 0:
+            x += width
+        if not (width > x >= 0):
+            raise IndexError("row index out of range")
+        cell = decode_cell(self._framebuffer.cells[self._start + x])
+        attribute = self._framebuffer.colors[self._start + x]
+        if attribute: # colorized like `Color._get_final_texture`
+            return _get_color(attribute) + cell + _RESET
+        return cell
+
+    @_overload
+    def __setitem__(self, x: int, cell: str) -> None: ...
+    @_overload
+    def __setitem__(self, x: slice, cell: _Iterable[str]) -> None: ...
+    def __setitem__(self, x: int | slice, cell: str | _Iterable[str]) -> None:
+        width = self._framebuffer.width
+        if isinstance(x, slice): # the row cannot change length, so the slice has to be replaced by as many cells
+            indices = range(*x.indices(width))
+            cells = list(cell) # a string is split into cells, like for `list`
+            if len(cells) != len(indices):
+                raise ValueError(f"attempt to assign sequence of size {len(cells)} to row slice of size {len(indices)}")
+            for idx, value in zip(indices, cells):
+                self[idx] = value
+            return
+        if x < 0:
+            x += width
+        if not (width > x >= 0):
+            raise IndexError("row assignment index out of range")
+        self._framebuffer.cells[self._start + x] = encode_cell(cell)
+        self._framebuffer.colors[self._start + x] = 0
+
+    def __iter__(self) -> _Iterator[str]:
+        return map(self.__getitem__, range(self._framebuffer.width))
+
+    def __eq__(self, other: object) -> bool:
+        return list(self) == other
+
+    def copy(self) -> list[str]:
+        return list(self)
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from .screen import AsciiScreen
+
+
+class GovernorState(NamedTuple):
+    """Current decisions and measurements of an `OutputGovernor`
+    """
+    level: int # 0 is full quality, higher levels degrade the output further
+    render_interval: int # ticks per rendered frame
+    diff_output: bool
+    color_depth: int
+    write_time: float # average seconds spent writing a frame
+    bytes_per_frame: float # average size of the output of a frame
+
+
+class OutputGovernor:
+    """`OutputGovernor` for keeping the engine at its tps when the terminal can't keep up with the output
+
+    Measures how long writing each frame takes, and how many bytes were written.
+    When writing takes too long, the output is degraded one level at a time:
+        1. only write changed cells (`AsciiScreen.diff_output`)
+        2. quantize to 256 colors
+        3. quantize to 16 colors
+        4. and above, render every 2nd, 3rd, ... tick, while the simulation still runs every tick
+
+    When writing is fast again, the output is upgraded one level at a time, back to the original settings
+
+    Measurements may be recorded from the writer thread, so they are guarded by a lock
+    """
+    budget: float = 0.5 # fraction of the time between rendered frames that writing a frame may take
+    recover: float = 0.2 # fraction of that time, below which the output is upgraded
+    patience: int = 16 # frames written between decisions
+    smoothing: float = 0.25 # weight of the newest measurement in the averages
+    max_render_interval: int = 8
+    max_bytes_per_second: float | None = None # output limit, for links that buffer instead of blocking
+
+    def __init__(self, screen: AsciiScreen, tps: float) -> None:
+        """Initializes the governor at full quality, keeping the current output settings of the screen to return to
+
+        Args:
+            screen (AsciiScreen): screen whose output is governed
+            tps (float): ticks per second of the engine
+        """
+        self.screen = screen
+        self.tps = tps
+        self.level = 0
+        self.render_interval = 1
+        self.write_time = 0.0
+        self.bytes_per_frame = 0.0
+        self._diff_output = screen.diff_output # original settings
+        self._color_depth = screen.color_depth
+        self._measured = 0 # frames written since the last decision
+        self._tick = 0
+        self._lock = threading.Lock() # guards the measurements and the level
+
+    @property
+    def max_level(self) -> int:
+        return 3 + self.max_render_interval - 1
+
+    @property
+    def state(self) -> GovernorState:
+        """Returns the current decisions and measurements
+
+        Returns:
+            GovernorState: snapshot of the state
+        """
+        with self._lock:
+            return GovernorState(self.level, self.render_interval, self.screen.diff_output, self.screen.color_depth,
+                                 self.write_time, self.bytes_per_frame)
+
+    def record(self, seconds: float, size: int) -> None:
+        """Adds the measurement of a written frame. Called by `AsciiScreen`, possibly from the writer thread
+
+        Args:
+            seconds (float): time spent writing and flushing the frame
+            size (int): amount of characters written
+        """
+        with self._lock:
+            if not self._measured and not self.write_time: # first measurement
+                self.write_time = seconds
+                self.bytes_per_frame = size
+            else:
+                self.write_time += (seconds - self.write_time) * self.smoothing
+                self.bytes_per_frame += (size - self.bytes_per_frame) * self.smoothing
+            self._measured += 1
+
+    def should_render(self) -> bool:
+        """Decides whether the current tick is rendered and shown, and adjusts the output level based on the measurements.
+        Called by the engine once per tick
+
+        Returns:
+            bool: whether to render this tick
+        """
+        with self._lock:
+            if self._measured >= self.patience:
+                self._measured = 0
+                if self._is_overloaded(self.level, self.budget):
+                    self._set_level(self.level + 1)
+                elif self.level and not self._is_overloaded(self.level - 1, self.recover):
+                    self._set_level(self.level - 1)
+        self._tick += 1 # only used by the engine thread
+        return self._tick % self.render_interval == 0
+
+    def reset(self) -> None:
+        """Restores full quality and the original output settings, and forgets the measurements
+        """
+        with self._lock:
+            self._set_level(0)
+            self.write_time = 0.0
+            self.bytes_per_frame = 0.0
+            self._measured = 0
+
+    def _get_render_interval(self, level: int) -> int:
+        return min(self.max_render_interval, max(1, level - 2))
+
+    def _is_overloaded(self, level: int, fraction: float) -> bool:
+        """Checks whether the measured output would take more than `fraction` of the time available at `level`.
+        Called while holding the lock
+        """
+        frame_time = self._get_render_interval(level) / self.tps
+        if self.write_time > frame_time * fraction:
+            return True
+        if self.max_bytes_per_second is not None: # scaled like the time, so that the limit is reached at `.budget`
+            return self.bytes_per_frame / frame_time > self.max_bytes_per_second * fraction / self.budget
+        return False
+
+    def _set_level(self, level: int) -> None:
+        """Applies the output settings of a level to the screen. Called while holding the lock
+        """
+        self.level = max(0, min(self.max_level, level))
+        screen = self.screen
+        screen.diff_output = self._diff_output or self.level >= 1
+        if self.level >= 3:
+            screen.color_depth = min(self._color_depth, 4)
+        elif self.level >= 2:
+            screen.color_depth = min(self._color_depth, 8)
+        else:
+            screen.color_depth = self._color_depth
+        self.render_interval = self._get_render_interval(self.level)
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, ClassVar, Iterable
+
+from .screen import AsciiScreen
+
+if TYPE_CHECKING:
+    from .framebuffer import Framebuffer
+    from .type_hints import ValidTextureNode
+
+
+class NullScreen(AsciiScreen):
+    """`NullScreen` for running without a terminal, where nothing is composed nor written
+
+    Useful for servers and for benchmarking the simulation alone
+    """
+    is_terminal: ClassVar[bool] = False
+    frames_shown: int = 0 # frames that would have been written
+
+    def render(self, textured_nodes: Iterable[ValidTextureNode] = [], /) -> None:
+        """Does nothing. Composition is skipped entirely
+
+        Args:
+            textured_nodes (Iterable[ValidTextureNode], optional): ignored. Defaults to [].
+        """
+        return
+
+    def clear(self) -> None:
+        """Only resizes the framebuffer when `.width` or `.height` has changed
+        """
+        if self.framebuffer.width != self.width or self.framebuffer.height != self.height:
+            self.framebuffer.resize(self.width, self.height)
+
+    def show(self) -> None:
+        """Counts the frame, without writing anything
+        """
+        self.frames_shown += 1
+
+
+class MemoryScreen(AsciiScreen):
+    """`MemoryScreen` for running without a terminal, that keeps the last frame in memory
+
+    Frames are composed like with `AsciiScreen`, but are stored instead of being written.
+    Useful for asserting on the content of the screen
+    """
+    is_terminal: ClassVar[bool] = False
+    frames_shown: int = 0 # frames stored so far
+    last_frame: Framebuffer | None = None # snapshot of the last frame shown
+
+    def _write_frame(self, frame: Framebuffer, clear: bool = False) -> None:
+        """Stores the frame as `.last_frame`, instead of writing it
+
+        Args:
+            frame (Framebuffer): snapshot of the framebuffer
+            clear (bool, optional): ignored. Defaults to False.
+        """
+        self.last_frame = frame
+        self.frames_shown += 1
+
+    def get_lines(self, *, styled: bool = False) -> list[str]:
+        """Decodes the last frame shown into lines, where transparent cells are replaced by `.cell_default`
+
+        Args:
+            styled (bool, optional): whether to include color escape sequences, quantized to `.color_depth`. Defaults to False.
+
+        Returns:
+            list[str]: lines of the last frame, or an empty list if no frame was shown yet
+        """
+        if self.last_frame is None:
+            return []
+        return self.last_frame.get_lines(self.cell_transparant, self.cell_default, styled=styled, color_depth=self.color_depth)
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar, cast
 
 from displaylib.template.type_hints import AnyNode
 
 from ..template import Node, Transform2D
+from ..template.type_hints import MroNext, NodeMixin, NodeType
 
 if TYPE_CHECKING:
     from ..math import Vec2i
@@ -19,6 +20,22 @@ class Ascii: # mode class with common hooks
         
     """
     root: AsciiEngine
+    _resize_listeners: ClassVar[dict[str, Ascii]] = {} # nodes overriding `_on_screen_resize`, by uid
+
+    def __new__(cls: type[NodeType], *args, **kwargs) -> NodeType:
+        """Registers the node to receive `_on_screen_resize`, if overridden
+
+        Args:
+            cls (type[NodeType]): original class that will be created
+
+        Returns:
+            NodeType: node instance that was stored
+        """
+        mro_next = cast(MroNext[Ascii], super())
+        instance = mro_next.__new__(cls, *args, **kwargs)
+        if cls._on_screen_resize is not Ascii._on_screen_resize: # type: ignore
+            Ascii._resize_listeners[instance.uid] = instance
+        return cast(NodeType, instance)
 
     def _on_screen_resize(self, size: Vec2i) -> None:
         """Override for custom functionality
@@ -28,6 +45,13 @@ class Ascii: # mode class with common hooks
         """
         ...
 
+    def queue_free(self) -> None:
+        """Stops the node from receiving `_on_screen_resize`, and queues it for deletion
+        """
+        Ascii._resize_listeners.pop(cast(NodeMixin, self).uid, None)
+        mro_next = cast(NodeMixin, super())
+        mro_next.queue_free()
+
 
 class AsciiNode(Ascii, Node): # Node with Ascii hooks
     """`AsciiNode` with additional hooks related to `ascii` mode functionality
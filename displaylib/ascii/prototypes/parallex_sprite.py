@@ -46,7 +46,7 @@ class ParallexSprite(AsciiNode2D):
         instance = super().__new__(cls, *args, **kwargs) # type: ParallexSprite  # type: ignore
         instance.z_index = z_index
         instance.layers = []
-        Texture._instances.append(instance) # type: ignore
+        Texture._add_instance(instance) # type: ignore
         return instance # type: ignore
 
     def add_layer(self, layer: ParallexLayer) -> None:
@@ -85,7 +85,7 @@ class ParallexSprite(AsciiNode2D):
         return self.get_global_position()
     
     def queue_free(self) -> None:
-        Texture._instances.remove(self) # type: ignore
+        Texture._remove_instance(self) # type: ignore
         super().queue_free()
         # TEMP
         for layer in self.layers:
@@ -60,11 +60,8 @@ class MemoryStreamedScreen(AsciiScreen):
         stdout.clear()
         stdout.set_screen_size(self.width, self.height)
         # ---
-        out = ""
-        lines = len(self.texture)
-        for idx, line in enumerate(self.texture):
-            rendered = "".join(letter if letter != self.cell_transparant else self.cell_default for letter in (line))
-            out += (rendered + " " + ("\n" if idx != lines else ""))
+        lines = self.framebuffer.get_lines(self.cell_transparant, self.cell_default)
+        out = "".join(line + " \n" for line in lines)
         sys.stdout.write(out)
         sys.stdout.flush()
 
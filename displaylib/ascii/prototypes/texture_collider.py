@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from typing import ClassVar, cast
+from typing import ClassVar, Sequence, cast
 
 from displaylib.math import Vec2
 from displaylib.template.type_hints import MroNext, NodeType
+from displaylib.ascii.texture import Texture
 
 
 class TextCollider: # Component (mixin class)
@@ -21,6 +22,7 @@ class TextCollider: # Component (mixin class)
         if collider := self.get_collider():
             self.position = old_position
             self.position.y = collider._get_texture_global_position().y - self.size().y # type: ignore
+        self._update_spatial_index()
     
     def move_and_slide(self, distance: Vec2) -> None:
         old_position = self.position.copy()
@@ -40,6 +42,7 @@ class TextCollider: # Component (mixin class)
                 self.position.y = collider._get_texture_global_position().y - self.size().y # type: ignore
             elif signs.y == -1:
                 self.position.y = collider._get_texture_global_position().y + collider.size().y # type: ignore
+        self._update_spatial_index()
     
     def is_on_floor(self) -> bool:
         old_position = self.position.copy()
@@ -49,7 +52,7 @@ class TextCollider: # Component (mixin class)
         return on_floor
 
     def is_colliding(self) -> bool:
-        for collider in TextCollider._colliders:
+        for collider in self._get_collider_candidates():
             if collider is self:
                 continue
             elif self.is_colliding_with(collider):
@@ -57,7 +60,7 @@ class TextCollider: # Component (mixin class)
         return False
 
     def get_collider(self) -> TextCollider | None:
-        for collider in TextCollider._colliders:
+        for collider in self._get_collider_candidates():
             if collider is self:
                 continue
             elif self.is_colliding_with(collider):
@@ -66,7 +69,7 @@ class TextCollider: # Component (mixin class)
     
     def get_all_colliders(self) -> list[TextCollider]:
         results: list[TextCollider] = []
-        for collider in TextCollider._colliders:
+        for collider in self._get_collider_candidates():
             if collider is self:
                 continue
             elif self.is_colliding_with(collider):
@@ -76,17 +79,39 @@ class TextCollider: # Component (mixin class)
     def is_colliding_with(self, other: TextCollider) -> bool:
         # basic implementation
         position = self._get_texture_global_position() # type: ignore
+        size = self.size() # type: ignore
         start = other._get_texture_global_position() # type: ignore
         rect = (start, start + other.size()) # start, end  # type: ignore
         return any( # any intersects
             self._point_intersects_with(point, rect)
             for point in [
                 position,
-                position + self.size(), # type: ignore
-                position + Vec2(self.size().x, 0), # type: ignore
-                position + Vec2(0, self.size().y) # type: ignore
+                position + size,
+                position + Vec2(size.x, 0),
+                position + Vec2(0, size.y)
             ])
 
+    def _get_collider_candidates(self) -> Sequence[TextCollider]:
+        """Returns colliders that may intersect, using the spatial index of `Texture` if enabled.
+        The index is refreshed first, since colliders may have moved since the last frame
+
+        Returns:
+            Sequence[TextCollider]: candidate colliders
+        """
+        index = Texture._spatial_index
+        if index is None or self not in index:
+            return TextCollider._colliders
+        index.refresh()
+        position = self._get_texture_global_position() # type: ignore
+        rect = (position, position + self.size()) # type: ignore
+        return [node for node in index.query_rect(rect) if isinstance(node, TextCollider)]
+
+    def _update_spatial_index(self) -> None:
+        """Rehashes this collider after moving, so that other colliders find it at its new position
+        """
+        if Texture._spatial_index is not None:
+            Texture._spatial_index.update(self) # type: ignore
+
     def _point_intersects_with(self, point: Vec2, rect: tuple[Vec2, Vec2]) -> bool:
         start, end = rect
         x_inside = start.x < point.x < end.x
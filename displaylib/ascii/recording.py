@@ -0,0 +1,606 @@
+"""### Recording module
+
+Records frames shown by `AsciiScreen` to a compact, appendable file
+
+File layout:
+    - header: `MAGIC`
+    - records: each a `RECORD_HEADER` (kind, frame, timestamp, payload size) followed by its payload
+    - index record and trailer: written on close, and truncated again when appending
+
+Every session starts with a `SESSION` record, followed by a `KEYFRAME`.
+Frames are stored as either a zlib compressed `KEYFRAME`, or a `DIFF` of cell runs against the previous frame.
+Attribute ids and multi-character cell codes are only valid within a session, so their values are stored as
+`ATTRIBUTES` and `CELLS` records before the first frame using them.
+Every value known so far is repeated right before each keyframe, so that reading can start at any keyframe
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+import bisect
+import queue
+import struct
+import threading
+import zlib
+from array import array
+from typing import TYPE_CHECKING, BinaryIO, Iterator, NamedTuple
+
+from .framebuffer import Framebuffer, encode_cell, decode_cell, encode_attribute, decode_attribute, _EXTENDED_START
+
+if TYPE_CHECKING:
+    from .clock import Clock
+    from .screen import AsciiScreen
+
+MAGIC = b"DLREC\x00\x01\x00" # format version 1
+TRAILER_MAGIC = b"DLRECIDX"
+RECORD_HEADER = struct.Struct("<BIdI") # kind, frame, timestamp, payload size
+TRAILER = struct.Struct("<8sQ") # magic, offset of index record
+INDEX_HEADER = struct.Struct("<Qd") # frame count, duration
+INDEX_ENTRY = struct.Struct("<QQd") # frame, offset, timestamp
+# record kinds
+SESSION = 0
+KEYFRAME = 1
+DIFF = 2
+ATTRIBUTES = 3
+CELLS = 4
+INDEX = 5
+
+
+class Keyframe(NamedTuple):
+    """Entry of the keyframe index
+    """
+    frame: int
+    offset: int # file offset of the record
+    timestamp: float
+
+
+class RecordHeader(NamedTuple):
+    kind: int
+    frame: int
+    timestamp: float
+    size: int
+
+
+def _to_bytes(values: array[int]) -> bytes:
+    """Converts an array to little endian bytes
+    """
+    if sys.byteorder == "big":
+        values = array("I", values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_bytes(data: bytes) -> array[int]:
+    """Converts little endian bytes to an array
+    """
+    values = array("I")
+    values.frombytes(data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def _pack_strings(entries: list[tuple[int, str]]) -> bytes:
+    """Packs (id, string) pairs used by `ATTRIBUTES` and `CELLS` records
+    """
+    parts = []
+    for key, value in entries:
+        encoded = value.encode("utf-8")
+        parts.append(struct.pack("<II", key, len(encoded)))
+        parts.append(encoded)
+    return b"".join(parts)
+
+
+def _unpack_strings(data: bytes) -> list[tuple[int, str]]:
+    """Unpacks (id, string) pairs from an `ATTRIBUTES` or `CELLS` record
+    """
+    entries = []
+    position = 0
+    while position < len(data):
+        key, size = struct.unpack_from("<II", data, position)
+        position += 8
+        entries.append((key, data[position:position + size].decode("utf-8")))
+        position += size
+    return entries
+
+
+def read_record_header(file: BinaryIO) -> RecordHeader | None:
+    """Reads the header of the next record
+
+    Args:
+        file (BinaryIO): file positioned at the start of a record
+
+    Returns:
+        RecordHeader | None: header, or None at the end of the file or at a partially written record
+    """
+    data = file.read(RECORD_HEADER.size)
+    if len(data) != RECORD_HEADER.size:
+        return None
+    return RecordHeader(*RECORD_HEADER.unpack(data))
+
+
+def read_index(file: BinaryIO) -> tuple[list[Keyframe], int, float, int] | None:
+    """Reads the keyframe index from the trailer of a closed recording
+
+    Args:
+        file (BinaryIO): recording opened for reading
+
+    Returns:
+        tuple[list[Keyframe], int, float, int] | None: keyframes, frame count, duration and offset of the index record,
+        or None if the recording was not closed properly
+    """
+    file.seek(0, os.SEEK_END)
+    end = file.tell()
+    if end < len(MAGIC) + TRAILER.size:
+        return None
+    file.seek(end - TRAILER.size)
+    magic, offset = TRAILER.unpack(file.read(TRAILER.size))
+    if magic != TRAILER_MAGIC:
+        return None
+    file.seek(offset)
+    header = read_record_header(file)
+    if header is None or header.kind != INDEX:
+        return None
+    data = file.read(header.size)
+    frame_count, duration = INDEX_HEADER.unpack_from(data)
+    keyframes = [Keyframe(*entry) for entry in INDEX_ENTRY.iter_unpack(data[INDEX_HEADER.size:])]
+    return keyframes, frame_count, duration, offset
+
+
+def scan_index(file: BinaryIO) -> tuple[list[Keyframe], int, float, int]:
+    """Rebuilds the keyframe index by reading every record header.
+    Used when a recording was not closed properly
+
+    Args:
+        file (BinaryIO): recording opened for reading
+
+    Returns:
+        tuple[list[Keyframe], int, float, int]: keyframes, frame count, duration and offset where complete records end
+    """
+    keyframes: list[Keyframe] = []
+    frame_count = 0
+    duration = 0.0
+    file.seek(0, os.SEEK_END)
+    end = file.tell()
+    offset = len(MAGIC)
+    group_offset = -1 # where the values repeated before a keyframe start
+    file.seek(offset)
+    while True:
+        header = read_record_header(file)
+        if header is None or header.kind == INDEX or offset + RECORD_HEADER.size + header.size > end:
+            break
+        if header.kind in (ATTRIBUTES, CELLS):
+            if group_offset == -1:
+                group_offset = offset
+        else:
+            if header.kind == KEYFRAME:
+                keyframes.append(Keyframe(header.frame, offset if group_offset == -1 else group_offset, header.timestamp))
+            group_offset = -1
+        if header.kind in (KEYFRAME, DIFF):
+            frame_count = header.frame + 1
+            duration = header.timestamp
+        offset += RECORD_HEADER.size + header.size
+        file.seek(offset)
+    return keyframes, frame_count, duration, offset
+
+
+class Recorder:
+    """`Recorder` that streams frames of an `AsciiScreen` to disk from a background thread
+
+    Frames are encoded and written by the background thread, so that recording adds
+    little more than queueing a snapshot to the frame time. No frame is dropped.
+    An existing recording is appended to, as a new session continuing its timeline
+    """
+    keyframe_interval: int = 64 # frames between keyframes, which bounds the diffs applied when seeking
+    compression_level: int = 1
+
+    def __init__(self, screen: AsciiScreen, file_path: str, /, *, clock: Clock | None = None) -> None:
+        """Opens the recording, and starts a new session at its end
+
+        Args:
+            screen (AsciiScreen): screen whose frames are recorded
+            file_path (str): path to the recording, which is created if missing
+            clock (Clock | None, optional): clock providing timestamps. Defaults to time since the recorder was created.
+
+        Raises:
+            ValueError: the file exists, but is not a recording
+        """
+        self.file_path = file_path
+        self.clock = clock
+        self._start_time = time.perf_counter()
+        self._file = open(file_path, "a+b")
+        self._file.seek(0, os.SEEK_END)
+        if self._file.tell() == 0:
+            self._file.write(MAGIC)
+            self._keyframes: list[Keyframe] = []
+            self._frame_count = 0
+            self._base_time = 0.0
+        else:
+            self._file.seek(0)
+            if self._file.read(len(MAGIC)) != MAGIC:
+                self._file.close()
+                raise ValueError(f"file '{file_path}' is not a recording")
+            index = read_index(self._file)
+            if index is None: # not closed properly, so only keep complete records
+                index = scan_index(self._file)
+            self._keyframes, self._frame_count, self._base_time, end = index
+            self._file.truncate(end) # remove the old index, which is written again on close
+        self._file.seek(0, os.SEEK_END)
+        self._offset = self._file.tell()
+        self._write_record(SESSION, self._frame_count, self._base_time, struct.pack("<d", time.time()))
+        self._cell_options = _pack_strings([(0, screen.cell_transparant), (1, screen.cell_default)])
+        self._last_frame: Framebuffer | None = None
+        self._last_timestamp = self._base_time
+        self._attribute_count = 1 # attribute 0 means no attribute, and is never stored
+        self._cell_count = 0
+        self._queue: queue.SimpleQueue[tuple[Framebuffer, float] | None] = queue.SimpleQueue()
+        self._error: BaseException | None = None
+        self._thread: threading.Thread | None = threading.Thread(target=self._run, name="Recorder", daemon=True)
+        self._thread.start()
+
+    @property
+    def frame_count(self) -> int:
+        """Returns the amount of frames written, including previous sessions
+
+        Returns:
+            int: frame count
+        """
+        return self._frame_count
+
+    def get_timestamp(self) -> float:
+        """Returns the time of the current session, from the clock if set
+
+        Returns:
+            float: seconds since the session started
+        """
+        if self.clock is not None:
+            return self.clock.elapsed_time
+        return time.perf_counter() - self._start_time
+
+    def submit(self, frame: Framebuffer) -> None:
+        """Queues a frame to be written
+
+        Args:
+            frame (Framebuffer): snapshot of the screen, which is only read from now on
+
+        Raises:
+            RuntimeError: the recorder is closed
+            BaseException: the recorder thread failed while writing a previous frame
+        """
+        if self._error is not None:
+            raise self._error
+        if self._thread is None:
+            raise RuntimeError("recorder is closed")
+        self._queue.put((frame, self._base_time + self.get_timestamp()))
+
+    def close(self) -> None:
+        """Writes the queued frames and the keyframe index, and closes the file
+
+        Raises:
+            BaseException: the recorder thread failed while writing a frame
+        """
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+        if self._error is None:
+            index_offset = self._offset
+            entries = b"".join(INDEX_ENTRY.pack(*keyframe) for keyframe in self._keyframes)
+            self._write_record(INDEX, self._frame_count, self._last_timestamp,
+                               INDEX_HEADER.pack(self._frame_count, self._last_timestamp) + entries)
+            self._file.write(TRAILER.pack(TRAILER_MAGIC, index_offset))
+        self._file.close()
+        if self._error is not None:
+            raise self._error
+
+    def _run(self) -> None:
+        """Encodes and writes queued frames, until `None` is received
+        """
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            try:
+                self._write_frame(*item)
+            except BaseException as error: # re-raised on the main thread
+                self._error = error
+                break
+        self._file.flush()
+
+    def _write_record(self, kind: int, frame: int, timestamp: float, payload: bytes) -> None:
+        self._file.write(RECORD_HEADER.pack(kind, frame, timestamp, len(payload)))
+        self._file.write(payload)
+        self._offset += RECORD_HEADER.size + len(payload)
+
+    def _write_frame(self, frame: Framebuffer, timestamp: float) -> None:
+        """Writes the values of new attributes and cells, followed by a keyframe or diff
+
+        Args:
+            frame (Framebuffer): frame to write
+            timestamp (float): time of the frame, on the timeline of the whole recording
+        """
+        cells = frame.cells
+        colors = frame.colors
+        attribute_start = self._attribute_count
+        cell_start = self._cell_count
+        self._attribute_count = max(attribute_start, max(colors, default=0) + 1)
+        self._cell_count = max(cell_start, max(cells, default=0) + 1 - _EXTENDED_START)
+        last = self._last_frame
+        is_keyframe = (last is None or self._frame_count - self._keyframes[-1].frame >= self.keyframe_interval
+                       or last.width != frame.width or last.height != frame.height)
+        if is_keyframe: # repeat every value known so far
+            self._keyframes.append(Keyframe(self._frame_count, self._offset, timestamp))
+            attribute_start = 1
+            cell_start = 0
+        if self._attribute_count > attribute_start:
+            entries = [(attribute, decode_attribute(attribute)) for attribute in range(attribute_start, self._attribute_count)]
+            self._write_record(ATTRIBUTES, self._frame_count, timestamp, _pack_strings(entries))
+        if self._cell_count > cell_start:
+            entries = [(_EXTENDED_START + idx, decode_cell(_EXTENDED_START + idx)) for idx in range(cell_start, self._cell_count)]
+            self._write_record(CELLS, self._frame_count, timestamp, _pack_strings(entries))
+        if is_keyframe:
+            payload = (struct.pack("<III", frame.width, frame.height, len(self._cell_options)) + self._cell_options
+                       + _to_bytes(cells) + _to_bytes(colors))
+            self._write_record(KEYFRAME, self._frame_count, timestamp, zlib.compress(payload, self.compression_level))
+        else:
+            self._write_record(DIFF, self._frame_count, timestamp, self._encode_diff(last, frame))
+        self._last_frame = frame
+        self._last_timestamp = timestamp
+        self._frame_count += 1
+
+    def _encode_diff(self, last: Framebuffer, frame: Framebuffer) -> bytes:
+        """Encodes the runs of cells that changed between two frames of the same size
+
+        Args:
+            last (Framebuffer): previous frame
+            frame (Framebuffer): current frame
+
+        Returns:
+            bytes: compressed runs, or empty if nothing changed
+        """
+        stride = frame.stride
+        runs = array("I") # start and length pairs
+        run_cells = array("I")
+        run_colors = array("I")
+        for start in range(0, len(frame.cells), stride):
+            end = start + stride
+            line = frame.cells[start:end]
+            line_colors = frame.colors[start:end]
+            if line == last.cells[start:end] and line_colors == last.colors[start:end]:
+                continue
+            x = 0
+            while x < stride: # runs of cells where either the cell or its color changed
+                if line[x] == last.cells[start + x] and line_colors[x] == last.colors[start + x]:
+                    x += 1
+                    continue
+                run_start = x
+                while x < stride and (line[x] != last.cells[start + x] or line_colors[x] != last.colors[start + x]):
+                    x += 1
+                runs.append(start + run_start)
+                runs.append(x - run_start)
+                run_cells.extend(line[run_start:x])
+                run_colors.extend(line_colors[run_start:x])
+        if not runs:
+            return b""
+        payload = struct.pack("<I", len(runs) // 2) + _to_bytes(runs) + _to_bytes(run_cells) + _to_bytes(run_colors)
+        return zlib.compress(payload, self.compression_level)
+
+
+def iter_records(file: BinaryIO, offset: int, /) -> Iterator[tuple[RecordHeader, bytes]]:
+    """Iterates records and their payloads, starting at the given offset
+
+    Args:
+        file (BinaryIO): recording opened for reading
+        offset (int): offset of the first record
+
+    Yields:
+        tuple[RecordHeader, bytes]: header and payload, until the index or the end of complete records
+    """
+    file.seek(offset)
+    while True:
+        header = read_record_header(file)
+        if header is None or header.kind == INDEX:
+            return
+        payload = file.read(header.size)
+        if len(payload) != header.size: # partially written
+            return
+        yield header, payload
+
+
+class RecordedFrame(NamedTuple):
+    """Frame read from a recording, with cells and colors encoded for the current process
+    """
+    frame: int
+    timestamp: float
+    framebuffer: Framebuffer
+    cell_transparant: str
+    cell_default: str
+
+
+class Recording:
+    """`Recording` for reading frames from a file written by `Recorder`
+
+    Seeking starts at the closest keyframe before the target, found in the keyframe index,
+    so that at most `Recorder.keyframe_interval` diffs are applied
+    """
+    keyframes: list[Keyframe]
+    frame_count: int
+    duration: float # timestamp of the last frame
+
+    def __init__(self, file_path: str, /) -> None:
+        """Opens a recording and loads its keyframe index, which is rebuilt if the recording was not closed properly
+
+        Args:
+            file_path (str): path to the recording
+
+        Raises:
+            ValueError: the file is not a recording
+        """
+        self.file_path = file_path
+        self._file = open(file_path, "rb")
+        if self._file.read(len(MAGIC)) != MAGIC:
+            self._file.close()
+            raise ValueError(f"file '{file_path}' is not a recording")
+        index = read_index(self._file)
+        if index is None:
+            index = scan_index(self._file)
+        self.keyframes, self.frame_count, self.duration, _ = index
+        self._keyframe_frames = [keyframe.frame for keyframe in self.keyframes]
+        self._keyframe_timestamps = [keyframe.timestamp for keyframe in self.keyframes]
+        self._offset = len(MAGIC) # next record to read
+        self._frame = -1 # last frame read
+        self._timestamp = 0.0
+        self._width = 0
+        self._height = 0
+        self._cells = array("I") # codes as stored in the file
+        self._colors = array("I")
+        self._cell_options = (" ", " ")
+        self._cell_table: dict[int, int] = {} # code in file -> code in this process
+        self._attribute_table: dict[int, int] = {0: 0}
+
+    def __enter__(self) -> Recording:
+        return self
+
+    def __exit__(self, *_exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def read(self) -> RecordedFrame | None:
+        """Reads the next frame
+
+        Returns:
+            RecordedFrame | None: next frame, or None at the end of the recording
+        """
+        if not self._advance():
+            return None
+        return self._get_frame()
+
+    def seek(self, frame: int, /) -> RecordedFrame:
+        """Reads the given frame. Later frames may then be read in order with `.read()`
+
+        Args:
+            frame (int): frame number, where negative numbers count from the end
+
+        Raises:
+            IndexError: frame is not in the recording
+
+        Returns:
+            RecordedFrame: the frame
+        """
+        if frame < 0:
+            frame += self.frame_count
+        if not (self.frame_count > frame >= 0):
+            raise IndexError(f"frame {frame} is not in range of {self.frame_count} frames")
+        keyframe_idx = bisect.bisect_right(self._keyframe_frames, frame) - 1
+        if not (self._frame < frame and self._frame >= self._keyframe_frames[keyframe_idx]): # cannot continue from the last frame
+            self._offset = self.keyframes[keyframe_idx].offset
+            self._frame = -1
+            self._cell_table = {}
+            self._attribute_table = {0: 0}
+        while self._frame < frame:
+            if not self._advance():
+                break
+        if self._frame != frame:
+            raise IndexError(f"frame {frame} is missing from the recording")
+        return self._get_frame()
+
+    def find_frame(self, timestamp: float, /) -> int:
+        """Finds the last frame shown at the given time. Only record headers are read
+
+        Args:
+            timestamp (float): seconds since the start of the recording
+
+        Returns:
+            int: frame number, or 0 if before the first frame
+        """
+        keyframe_idx = max(0, bisect.bisect_right(self._keyframe_timestamps, timestamp) - 1)
+        if not self.keyframes:
+            return 0
+        found = self.keyframes[keyframe_idx].frame
+        self._file.seek(self.keyframes[keyframe_idx].offset)
+        while True:
+            header = read_record_header(self._file)
+            if header is None or header.kind == INDEX:
+                break
+            if header.kind in (KEYFRAME, DIFF):
+                if header.timestamp > timestamp:
+                    break
+                found = header.frame
+            self._file.seek(header.size, os.SEEK_CUR)
+        return found
+
+    def _advance(self) -> bool:
+        """Applies records until the next frame is complete
+
+        Returns:
+            bool: whether a frame was read
+        """
+        self._file.seek(self._offset)
+        while True:
+            header = read_record_header(self._file)
+            if header is None or header.kind == INDEX:
+                return False
+            payload = self._file.read(header.size)
+            if len(payload) != header.size: # partially written
+                return False
+            self._offset += RECORD_HEADER.size + header.size
+            if header.kind == SESSION: # ids of the previous session are no longer valid
+                self._cell_table = {}
+                self._attribute_table = {0: 0}
+            elif header.kind == ATTRIBUTES:
+                for attribute, value in _unpack_strings(payload):
+                    self._attribute_table[attribute] = encode_attribute(value)
+            elif header.kind == CELLS:
+                for code, value in _unpack_strings(payload):
+                    self._cell_table[code] = encode_cell(value)
+            elif header.kind == KEYFRAME:
+                data = zlib.decompress(payload)
+                self._width, self._height, options_size = struct.unpack_from("<III", data)
+                position = 12
+                options = dict(_unpack_strings(data[position:position + options_size]))
+                self._cell_options = (options[0], options[1])
+                position += options_size
+                size = self._width * self._height * 4
+                self._cells = _from_bytes(data[position:position + size])
+                self._colors = _from_bytes(data[position + size:position + size * 2])
+            elif header.kind == DIFF:
+                if payload: # empty when nothing changed
+                    data = zlib.decompress(payload)
+                    run_count = struct.unpack_from("<I", data)[0]
+                    runs = _from_bytes(data[4:4 + run_count * 8])
+                    changed = (len(data) - 4 - run_count * 8) // 8
+                    run_cells = _from_bytes(data[4 + run_count * 8:4 + run_count * 8 + changed * 4])
+                    run_colors = _from_bytes(data[4 + run_count * 8 + changed * 4:])
+                    position = 0
+                    for idx in range(0, len(runs), 2):
+                        start = runs[idx]
+                        length = runs[idx + 1]
+                        self._cells[start:start + length] = run_cells[position:position + length]
+                        self._colors[start:start + length] = run_colors[position:position + length]
+                        position += length
+            if header.kind in (KEYFRAME, DIFF):
+                self._frame = header.frame
+                self._timestamp = header.timestamp
+                return True
+
+    def _get_frame(self) -> RecordedFrame:
+        """Creates a frame from the current state, with codes translated to this process
+
+        Returns:
+            RecordedFrame: current frame
+        """
+        transparent, default = self._cell_options
+        framebuffer = Framebuffer(self._width, self._height, transparent)
+        if self._cell_table and max(self._cells, default=0) >= _EXTENDED_START:
+            cell_table = self._cell_table
+            framebuffer.cells = array("I", [cell_table.get(code, code) for code in self._cells])
+        else:
+            framebuffer.cells = array("I", self._cells)
+        if self._colors.count(0) != len(self._colors):
+            framebuffer.colors = array("I", map(self._attribute_table.__getitem__, self._colors))
+        return RecordedFrame(self._frame, self._timestamp, framebuffer, transparent, default)
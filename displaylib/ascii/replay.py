@@ -0,0 +1,145 @@
+"""### Replay module
+
+Plays back recordings written by `Recorder`, or dumps selected frames as text
+
+Usage:
+    python -m displaylib.ascii.replay <file> [--speed SPEED] [--start SECONDS]
+    python -m displaylib.ascii.replay <file> --dump FRAMES [--color]
+    python -m displaylib.ascii.replay <file> --info
+
+Where FRAMES is a comma separated list of frame numbers and ranges, like `0,100-110,-1`,
+or `every:N` for every Nth frame, or `at:SECONDS` for the frame shown at a time
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+import argparse
+from typing import TextIO
+
+from .screen import AsciiScreen
+from .recording import Recording
+
+
+def play(recording: Recording, /, screen: AsciiScreen | None = None, *, speed: float = 1.0, start: float = 0.0, max_lag: float = 0.1) -> None:
+    """Plays a recording through an `AsciiScreen`, at the pace of its timestamps
+
+    Args:
+        recording (Recording): recording to play
+        screen (AsciiScreen | None, optional): screen to show frames on. Defaults to a new `AsciiScreen` with `.diff_output`.
+        speed (float, optional): playback speed, where 2.0 is twice as fast. Defaults to 1.0.
+        start (float, optional): time to start at, in seconds. Defaults to 0.0.
+        max_lag (float, optional): frames are skipped while playback is behind by more than this, in seconds. Defaults to 0.1.
+    """
+    if not recording.frame_count:
+        return
+    if screen is None:
+        screen = AsciiScreen()
+        screen.diff_output = True
+    recorded = recording.seek(recording.find_frame(start))
+    start_timestamp = recorded.timestamp
+    start_time = time.perf_counter()
+    while recorded is not None:
+        lag = (time.perf_counter() - start_time) - (recorded.timestamp - start_timestamp) / speed
+        if lag < 0:
+            time.sleep(-lag)
+        if lag < max_lag:
+            screen.cell_transparant = recorded.cell_transparant
+            screen.cell_default = recorded.cell_default
+            screen.width = recorded.framebuffer.width
+            screen.height = recorded.framebuffer.height
+            screen.framebuffer = recorded.framebuffer
+            screen.show()
+        recorded = recording.read()
+
+
+def parse_frames(spec: str, recording: Recording, /) -> list[int]:
+    """Parses a selection of frames
+
+    Args:
+        spec (str): comma separated frame numbers and ranges, `every:N` or `at:SECONDS`
+        recording (Recording): recording to select from
+
+    Raises:
+        ValueError: invalid selection
+
+    Returns:
+        list[int]: selected frame numbers, in order
+    """
+    frame_count = recording.frame_count
+    if spec.startswith("every:"):
+        return list(range(0, frame_count, int(spec[len("every:"):])))
+    if spec.startswith("at:"):
+        return [recording.find_frame(float(timestamp)) for timestamp in spec[len("at:"):].split(",")]
+    frames: list[int] = []
+    for part in spec.split(","):
+        first, separator, last = part.partition("-")
+        if separator and first: # range
+            frames.extend(range(int(first), int(last) + 1))
+        else: # single frame, which may be negative
+            frame = int(part)
+            frames.append(frame + frame_count if frame < 0 else frame)
+    return [frame for frame in frames if frame_count > frame >= 0]
+
+
+def dump(recording: Recording, frames: list[int], /, *, styled: bool = False, file: TextIO = sys.stdout) -> None:
+    """Writes the selected frames as text, without a terminal
+
+    Args:
+        recording (Recording): recording to read from
+        frames (list[int]): frame numbers
+        styled (bool, optional): whether to include color escape sequences. Defaults to False.
+        file (TextIO, optional): output. Defaults to sys.stdout.
+    """
+    for frame in frames:
+        recorded = recording.seek(frame)
+        file.write(f"--- frame {recorded.frame} at {recorded.timestamp:.3f}s ---\n")
+        for line in recorded.framebuffer.get_lines(recorded.cell_transparant, recorded.cell_default, styled=styled):
+            file.write(line + "\n")
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point of `python -m displaylib.ascii.replay`
+
+    Args:
+        argv (list[str] | None, optional): arguments. Defaults to sys.argv[1:].
+
+    Returns:
+        int: exit code
+    """
+    parser = argparse.ArgumentParser(prog="python -m displaylib.ascii.replay", description="Play back a displaylib recording")
+    parser.add_argument("file", help="recording to read")
+    parser.add_argument("--speed", type=float, default=1.0, help="playback speed (default: 1.0)")
+    parser.add_argument("--start", type=float, default=0.0, help="time to start playing at, in seconds")
+    parser.add_argument("--dump", metavar="FRAMES", help="write selected frames as text, instead of playing")
+    parser.add_argument("--color", action="store_true", help="include colors when dumping")
+    parser.add_argument("--info", action="store_true", help="show frame count, duration and keyframes")
+    args = parser.parse_args(argv)
+    try:
+        recording = Recording(args.file)
+    except (OSError, ValueError) as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 1
+    with recording:
+        if args.info:
+            print(f"frames: {recording.frame_count}")
+            print(f"duration: {recording.duration:.3f}s")
+            print(f"keyframes: {len(recording.keyframes)}")
+        elif args.dump is not None:
+            try:
+                frames = parse_frames(args.dump, recording)
+            except ValueError:
+                print(f"error: invalid frame selection '{args.dump}'", file=sys.stderr)
+                return 1
+            dump(recording, frames, styled=args.color)
+        else:
+            try:
+                play(recording, speed=args.speed, start=args.start)
+            except KeyboardInterrupt:
+                pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,17 +1,60 @@
 from __future__ import annotations
 
 import math
-from typing import TYPE_CHECKING, Iterable
+import time
+from typing import TYPE_CHECKING, ClassVar, Iterable, NamedTuple, Sequence
 
 import sys
 
 from ..math import Vec2
-from . import text
 from .camera import AsciiCamera
-from .texture import Texture
+from .texture import Texture, CompiledTexture, _PLAIN_FINAL_TEXTURES
+from .framebuffer import Framebuffer, FramebufferRow, RotatedRaster, encode_cell, encode_attribute, rasterize_rotated
 
 if TYPE_CHECKING:
     from .type_hints import ValidTextureNode
+    from .writer import FrameWriter
+    from .recording import Recorder
+    from .governor import OutputGovernor
+
+_NO_OFFSET = Vec2(0, 0) # offset of nodes without one
+
+class _RenderItem(NamedTuple):
+    """Node collected for drawing, with its screen space transform
+    """
+    node: ValidTextureNode
+    texture: Sequence[Sequence[str]]
+    color: int
+    x: float # top left corner, or pivot when rotated
+    y: float
+    rotation: float
+    raster: RotatedRaster | None # set when rotated
+    static: bool
+
+
+class _StaticLayer:
+    """Pre-rendered content of consecutive static nodes.
+    Members with the `Texture` component invalidate the layer when they change, other members are compared by signature
+    """
+    __slots__ = ("nodes", "transforms", "framebuffer", "runs", "is_valid")
+
+    def __init__(self, nodes: tuple[ValidTextureNode, ...], transforms: tuple[tuple[object, ...], ...], framebuffer: Framebuffer, runs: list[tuple[int, int]]) -> None:
+        self.nodes = nodes # kept, so that their ids are not reused while cached
+        self.transforms = transforms # screen space transform of each member, which the members cannot report themselves
+        self.framebuffer = framebuffer
+        self.runs = runs # opaque runs of `.framebuffer`
+        self.is_valid = True
+        Texture._set_render_tracking(True)
+        for node in nodes:
+            if isinstance(node, Texture):
+                node._static_layer = self
+
+    def release(self) -> None:
+        """Stops members from invalidating the layer, once it is no longer cached
+        """
+        for node in self.nodes:
+            if isinstance(node, Texture) and node._static_layer is self:
+                node._static_layer = None
 
 
 class AsciiScreen:
@@ -19,9 +62,26 @@ class AsciiScreen:
 
     Behaves like a surface. Has the option to write its content to the terminal
     """
+    is_terminal: ClassVar[bool] = True # whether output goes to a terminal, that may be resized and cleared
     cell_transparant: str = " " # symbol used to indicate that a cell is transparent
     cell_default: str = " " # the default look of an empty cell
-    texture: list[list[str]]
+    diff_output: bool = False # only write cells that changed since the last frame
+    diff_gap: int = 4 # unchanged cells rewritten instead of moving the cursor
+    color_depth: int = 24 # bits per color in the output, where 8 (256 colors) and 4 (16 colors) use shorter escape sequences
+    rotation_buckets: int = 720 # rotations are snapped to this many steps per full turn, to cache rotated textures
+    dirty_tracking: bool = False # keep content between frames, and only redraw regions that changed. Requires `.invalidate_texture()` after mutating `.texture` in place
+    static_layers: set[int] # z_index values where nodes are cached as pre-rendered layers
+    framebuffer: Framebuffer
+    culled: int = 0 # nodes rejected by viewport culling during the last render
+    writer: FrameWriter | None = None # when set, frames are written from its background thread
+    recorder: Recorder | None = None # when set, every frame shown is recorded
+    governor: OutputGovernor | None = None # measures each write, and degrades the output when the terminal is too slow
+    _last_frame: Framebuffer | None = None # last frame written, used by `.diff_output`
+    _clear_terminal: bool = False # requested by `.clear_terminal()`
+    _node_states: dict[int, tuple[ValidTextureNode, tuple[object, ...], tuple[int, int, int, int]]] | None = None # used by `.dirty_tracking`
+    _viewport: tuple[object, ...] = ()
+    _static_cache: dict[tuple[int, ...], _StaticLayer] # static layers, by the ids of their nodes
+    _texture_rows: tuple[Framebuffer, int, int, list[FramebufferRow]] | None = None # row views of `.texture`, with the framebuffer, stride and height they were made for
 
     def __init__(self, width: int = 16, height: int = 8) -> None:
         """Initialize surface from nodes given inside the given boundaries
@@ -32,7 +92,43 @@ class AsciiScreen:
         """
         self.width = width
         self.height = height
-        self.texture = [[self.cell_transparant for _ in range(self.width)] for _ in range(self.height)] # 2D array
+        self.framebuffer = Framebuffer(width, height, fill=self.cell_transparant)
+        self.static_layers = set()
+        self._static_cache = {}
+
+    @property
+    def texture(self) -> list[FramebufferRow]:
+        """Returns a view of the screen content as rows of cells, indexed like `.texture[y][x]`
+
+        Kept for compatibility, as the content is stored in `.framebuffer`.
+        The row views are cached until the framebuffer is replaced or resized
+
+        Returns:
+            list[FramebufferRow]: mutable rows, in a new list
+        """
+        framebuffer = self.framebuffer
+        cache = self._texture_rows
+        if cache is None or cache[0] is not framebuffer or cache[1] != framebuffer.stride or cache[2] != framebuffer.height:
+            rows = [FramebufferRow(framebuffer, y) for y in range(framebuffer.height)]
+            cache = self._texture_rows = (framebuffer, framebuffer.stride, framebuffer.height, rows)
+        return cache[3].copy() # assigning to the list does not affect the cached views
+
+    @texture.setter
+    def texture(self, value: list[list[str]]) -> None:
+        """Replaces the screen content, resizing the screen to fit
+
+        Args:
+            value (list[list[str]]): new content
+        """
+        self.height = len(value)
+        self.width = len(max(value, key=len)) if value else 0
+        self.framebuffer.resize(self.width, self.height)
+        self.framebuffer.fill(self.cell_transparant)
+        cells = self.framebuffer.cells
+        for y, line in enumerate(value):
+            start = y * self.framebuffer.stride
+            for x, char in enumerate(line):
+                cells[start + x] = encode_cell(char)
 
     def render(self, textured_nodes: Iterable[ValidTextureNode] = [], /) -> None:
         """Renders the textured nodes onto the screen (they have the `Texture` component)
@@ -40,28 +136,16 @@ class AsciiScreen:
         Args:
             textured_nodes (Iterable[ValidTextureNode], optional): nodes to rende. Defaults to [].
         """
-        if AsciiCamera.current is None: # should never be None
-            raise TypeError("'AsciiCamera.current' cannot be of type 'None' while rendering")
-        camera: AsciiCamera = AsciiCamera.current
+        camera = self._get_camera()
         half_size = Vec2(self.width, self.height) / 2
         # camera_rotation = camera.get_global_rotation()
         # cos_camera_rotation = math.cos(-camera_rotation)
         # sin_camera_rotation = math.sin(-camera_rotation)
-        viewport_global_position = camera.get_global_position()
-        # include half size of camera parent when including size
-        if camera.mode & AsciiCamera.INCLUDE_SIZE:
-            if camera.parent is not None and isinstance(camera.parent, Texture):
-                viewport_global_position += camera.parent.size() // 2 # adds half of camera's parent's texture dimensions
+        viewport_global_position = self._get_viewport_global_position(camera)
 
+        self.culled = 0
+        items: list[_RenderItem] = []
         for textured in textured_nodes:
-            if not textured.is_globally_visible():
-                continue
-            texture = textured._get_final_texture() # may apply color
-            if not texture: # check if has not empty texture
-                continue
-            if not any(texture): # check if has first row
-                continue
-            
             # compute screen space transform
             position = textured._get_texture_global_position() - viewport_global_position
             rotation = textured.get_global_rotation()
@@ -73,6 +157,24 @@ class AsciiScreen:
             if camera.mode & AsciiCamera.CENTERED:
                 position += half_size
 
+            # reject nodes outside the viewport before doing any per cell work
+            is_plain = type(textured)._get_final_texture in _PLAIN_FINAL_TEXTURES
+            if is_plain and self._is_outside(textured, position, rotation):
+                self.culled += 1
+                continue
+            if not textured.is_globally_visible():
+                continue
+            if is_plain: # color is stored in its own plane, instead of colorizing each cell
+                texture = textured.texture
+                color = encode_attribute(textured._get_final_color())
+            else:
+                texture = textured._get_final_texture()
+                color = 0
+            if not texture: # check if has not empty texture
+                continue
+            if not any(texture): # check if has first row
+                continue
+
             # if rotation != 0 and camera_rotation != 0: # node and camera rotation
             #     cos_rotation = math.cos(-rotation)
             #     sin_rotation = math.sin(-rotation)
@@ -93,22 +195,15 @@ class AsciiScreen:
 
             # elif rotation != 0: # node rotation
             if rotation != 0: # node rotation
-                cos_rotation = math.cos(-rotation)
-                sin_rotation = math.sin(-rotation)
-                y_offset = (len(texture) // 2 if textured.centered else 0) - textured.offset.y
-                x_offset = (len(max(texture, key=len)) // 2 if textured.centered else 0) - textured.offset.x
-                for h, line in enumerate(texture):
-                    for w, char in enumerate(line):
-                        x_diff = w - x_offset
-                        y_diff = h - y_offset
-                        x_position = round(x_offset + position.x + cos_rotation * x_diff - sin_rotation * y_diff)
-                        y_position = round(y_offset + position.y + sin_rotation * x_diff + cos_rotation * y_diff)
-                        if not ((self.height) > y_position >= 0): # out of screen
-                            continue
-                        if not ((self.width) > x_position >= 0): # out of screen
-                            continue
-                        if char != self.cell_transparant:
-                            self.texture[y_position][x_position] = text.rotate(char, rotation)
+                centered = getattr(textured, "centered", False) # nodes without `Texture` may be rendered as well
+                offset = getattr(textured, "offset", _NO_OFFSET)
+                y_offset = (len(texture) // 2 if centered else 0) - offset.y
+                x_offset = (len(max(texture, key=len)) // 2 if centered else 0) - offset.x
+                texture_key = textured._get_texture_key() if is_plain else None # cached on the node
+                raster = rasterize_rotated(texture, rotation, x_offset, y_offset, self.cell_transparant,
+                                           buckets=self.rotation_buckets, texture_key=texture_key)
+                items.append(_RenderItem(textured, texture, color, x_offset + position.x, y_offset + position.y, rotation, raster,
+                                         self._is_static(textured)))
             
             # elif camera_rotation != 0: # camera rotation
             #     for h, line in enumerate(texture):
@@ -125,30 +220,443 @@ class AsciiScreen:
             #                 self.texture[y_position][x_position] = text.rotate(char, camera_rotation)
 
             else: # no rotation
-                for h, line in enumerate(texture):
-                    y_position = int(h + position.y)
-                    if not ((self.height) > y_position >= 0): # out of screen
-                        continue
-                    for w, char in enumerate(line):
-                        x_position = int(w + position.x)
-                        if not ((self.width) > x_position >= 0): # out of screen
-                            continue
-                        if char != self.cell_transparant:
-                            self.texture[y_position][x_position] = char
+                items.append(_RenderItem(textured, texture, color, position.x, position.y, 0, None,
+                                         self._is_static(textured)))
+
+        if self.dirty_tracking:
+            viewport = (viewport_global_position.x, viewport_global_position.y, camera.mode, self.cell_transparant)
+            self._compose_dirty(items, viewport)
+        else:
+            self._draw_all(items)
+
+    def get_viewport_rect(self) -> tuple[Vec2, Vec2]:
+        """Computes the area of the world shown by the screen, using the current camera
+
+        Returns:
+            tuple[Vec2, Vec2]: start and end corner, in world space
+        """
+        camera = self._get_camera()
+        start = self._get_viewport_global_position(camera)
+        if camera.mode & AsciiCamera.CENTERED:
+            start -= Vec2(self.width, self.height) / 2
+        return (start, start + Vec2(self.width, self.height))
+
+    def _get_camera(self) -> AsciiCamera:
+        if AsciiCamera.current is None: # should never be None
+            raise TypeError("'AsciiCamera.current' cannot be of type 'None' while rendering")
+        return AsciiCamera.current
+
+    def _get_viewport_global_position(self, camera: AsciiCamera) -> Vec2:
+        """Computes the world space position shown at the top left corner, or center when `AsciiCamera.CENTERED`
+
+        Args:
+            camera (AsciiCamera): camera used for rendering
+
+        Returns:
+            Vec2: global position of the viewport
+        """
+        viewport_global_position = camera.get_global_position()
+        # include half size of camera parent when including size
+        if camera.mode & AsciiCamera.INCLUDE_SIZE:
+            if camera.parent is not None and isinstance(camera.parent, Texture):
+                viewport_global_position += camera.parent.size() // 2 # adds half of camera's parent's texture dimensions
+        return viewport_global_position
+
+    def _is_static(self, textured: ValidTextureNode) -> bool:
+        """Checks whether a node is drawn as part of a static layer
+
+        Args:
+            textured (ValidTextureNode): node in `Texture._instances`, which may lack the `Texture` component
+
+        Returns:
+            bool: whether its z_index is in `.static_layers`, or it or an ancestor is flagged `.static`
+        """
+        if textured.z_index in self.static_layers:
+            return True
+        is_globally_static = getattr(textured, "is_globally_static", None)
+        return is_globally_static is not None and is_globally_static()
+
+    def _draw_all(self, items: list[_RenderItem]) -> None:
+        """Draws collected nodes onto the framebuffer in order,
+        where consecutive static nodes are copied from their cached layer in one step
+
+        Args:
+            items (list[_RenderItem]): collected nodes, in z-order
+        """
+        layers: dict[tuple[int, ...], _StaticLayer] = {}
+        idx = 0
+        while idx < len(items):
+            if not items[idx].static:
+                self._draw(items[idx])
+                idx += 1
+                continue
+            end = idx + 1
+            while end < len(items) and items[end].static:
+                end += 1
+            group = items[idx:end]
+            key = tuple(id(item.node) for item in group)
+            transforms = tuple(map(_get_layer_transform, group))
+            layer = self._static_cache.pop(key, None)
+            if layer is not None and (not layer.is_valid or layer.transforms != transforms # a member changed or moved
+                                      or layer.framebuffer.width != self.width or layer.framebuffer.height != self.height
+                                      or layer.framebuffer._fill_code != encode_cell(self.cell_transparant)):
+                layer.release()
+                layer = None
+            if layer is None:
+                framebuffer = Framebuffer(self.width, self.height, self.cell_transparant)
+                for item in group:
+                    self._draw(item, framebuffer=framebuffer)
+                layer = _StaticLayer(tuple(item.node for item in group), transforms, framebuffer,
+                                     framebuffer.get_opaque_runs(self.cell_transparant))
+            layers[key] = layer
+            self.framebuffer.paste(layer.framebuffer, layer.runs)
+            idx = end
+        for layer in self._static_cache.values(): # layers not used this frame
+            layer.release()
+        self._static_cache = layers
+
+    def _draw(self, item: _RenderItem, clip: tuple[int, int, int, int] | None = None, *, framebuffer: Framebuffer | None = None) -> None:
+        """Draws a collected node onto the framebuffer
+
+        Args:
+            item (_RenderItem): node to draw, with its screen space transform
+            clip (tuple[int, int, int, int] | None, optional): only draw inside (left, top, right, bottom). Defaults to None.
+            framebuffer (Framebuffer | None, optional): target instead of `.framebuffer`. Defaults to None.
+        """
+        if framebuffer is None:
+            framebuffer = self.framebuffer
+        if item.raster is not None:
+            framebuffer.blit_rotated(item.raster, item.x, item.y, item.color, clip=clip)
+        else:
+            framebuffer.blit(item.texture, item.x, item.y, self.cell_transparant, item.color, clip=clip)
+
+    def _compose_dirty(self, items: list[_RenderItem], viewport: tuple[object, ...]) -> None:
+        """Clears and redraws only the regions of the screen that changed since the last render.
+        A region is dirty where a node appeared, disappeared, or changed its position, rotation, texture, color or order
+
+        Args:
+            items (list[_RenderItem]): collected nodes, in z-order
+            viewport (tuple[object, ...]): camera state, where any change requires a full redraw
+        """
+        framebuffer = self.framebuffer
+        if self._node_states is None: # first frame is drawn in full, so changes before enabling are irrelevant
+            Texture._set_render_tracking(True)
+        full = (self._node_states is None or self._viewport != viewport
+                or framebuffer.width != self.width or framebuffer.height != self.height)
+        old_states = self._node_states or {}
+        states: dict[int, tuple[ValidTextureNode, tuple[object, ...], tuple[int, int, int, int]]] = {}
+        rects = [_get_rect(item) for item in items]
+        dirty: list[tuple[int, int, int, int]] = []
+        for item, rect in zip(items, rects):
+            node = item.node
+            signature = _get_signature(item)
+            states[id(node)] = (node, signature, rect) # the node is kept, so that its id is not reused while tracked
+            old_state = old_states.pop(id(node), None)
+            if old_state is None: # appeared
+                dirty.append(rect)
+            elif old_state[1] != signature: # changed
+                dirty.append(old_state[2])
+                dirty.append(rect)
+        for _node, _signature, rect in old_states.values(): # disappeared
+            dirty.append(rect)
+        self._node_states = states
+        self._viewport = viewport
+
+        if not full:
+            dirty = _merge_rects(_clip_rect(rect, self.width, self.height) for rect in dirty)
+            area = sum((right - left) * (bottom - top) for left, top, right, bottom in dirty)
+            full = area * 2 >= self.width * self.height # cheaper to redraw everything
+        if full:
+            if framebuffer.width != self.width or framebuffer.height != self.height:
+                framebuffer.resize(self.width, self.height)
+            framebuffer.fill(self.cell_transparant)
+            self._draw_all(items)
+            return
+        for clip in dirty:
+            framebuffer.fill_rect(clip, self.cell_transparant)
+            for item, rect in zip(items, rects):
+                if _rects_overlap(rect, clip):
+                    self._draw(item, clip)
+
+    def _is_outside(self, textured: ValidTextureNode, position: Vec2, rotation: float) -> bool:
+        """Checks whether the bounding box of a node's texture is outside the screen,
+        using the cached texture size
+
+        Args:
+            textured (ValidTextureNode): node with `Texture` component
+            position (Vec2): screen space position of the texture's top left corner
+            rotation (float): global rotation of the node
+
+        Returns:
+            bool: whether the texture is guaranteed to not be visible
+        """
+        width, height = textured._get_texture_size()
+        if rotation == 0: # cells are placed at `int(position + index)`
+            return (position.x >= self.width or position.x + width <= 0
+                    or position.y >= self.height or position.y + height <= 0)
+        # the texture rotates around a pivot, so use the farthest corner as reach
+        x_offset = (width // 2 if textured.centered else 0) - textured.offset.x
+        y_offset = (height // 2 if textured.centered else 0) - textured.offset.y
+        reach = math.hypot(max(abs(x_offset), abs(width - x_offset)), max(abs(y_offset), abs(height - y_offset))) + 1
+        pivot_x = position.x + x_offset
+        pivot_y = position.y + y_offset
+        return (pivot_x - reach >= self.width or pivot_x + reach < 0
+                or pivot_y - reach >= self.height or pivot_y + reach < 0)
 
     def clear(self) -> None:
         """Clears the screen by filling it with `AsciiSurface.cell_transparant`
+
+        The framebuffer is filled in place, and only reallocated when `.width` or `.height` has changed
         """
-        self.texture = [[self.cell_transparant for _ in range(self.width)] for _ in range(self.height)] # 2D array
+        if self.framebuffer.width != self.width or self.framebuffer.height != self.height:
+            self.framebuffer.resize(self.width, self.height)
+        self.framebuffer.fill(self.cell_transparant)
+        self._node_states = None # next dirty tracked render has to redraw everything
     
     def show(self) -> None:
         """Prints the screen to the terminal
+
+        When `.diff_output` is enabled, only the cell runs that changed since the last frame are written.
+        A full redraw is done after a resize, or when the diff would be larger than a full frame
+        """
+        frame = self.framebuffer.copy()
+        clear = self._clear_terminal
+        self._clear_terminal = False
+        if self.recorder is not None:
+            self.recorder.submit(frame)
+        if self.writer is not None: # hand the frame over, and return without waiting for the terminal
+            self.writer.submit(frame, clear)
+            return
+        self._write_frame(frame, clear)
+
+    def clear_terminal(self) -> None:
+        """Clears the terminal using an escape sequence, right before the next frame is written in full
         """
-        out = ""
-        lines = len(self.texture)
-        for idx, line in enumerate(self.texture):
-            rendered = "".join(letter if letter != self.cell_transparant else self.cell_default for letter in (line))
-            out += (rendered + " " + ("\n" if idx != lines else ""))
-        out += ("\u001b[A" * len(self.texture) + "\r") # "\u001b[A" is ANSI code for UP
+        self._clear_terminal = True
+
+    def _write_frame(self, frame: Framebuffer, clear: bool = False) -> None:
+        """Writes a frame to the terminal, either in full or as a diff against the last frame written
+
+        Args:
+            frame (Framebuffer): snapshot of the framebuffer, which is kept as the last frame written
+            clear (bool, optional): whether to clear the terminal first. Defaults to False.
+        """
+        if clear:
+            out = "\u001b[2J\u001b[H" + self._get_full_output(frame) # clear the terminal and move the cursor to the top left corner
+        elif self.diff_output and self._last_frame is not None:
+            diff = self._get_diff_output(frame, self._last_frame)
+            if diff is None: # resized
+                out = self._get_full_output(frame)
+            elif len(diff) < _get_min_full_size(frame, self.cell_default): # the full output is only built when it might be shorter
+                out = diff
+            else:
+                out = self._get_full_output(frame)
+                if len(diff) < len(out):
+                    out = diff
+        else:
+            out = self._get_full_output(frame)
+        self._last_frame = frame
+        if not out: # nothing changed
+            if self.governor is not None:
+                self.governor.record(0.0, 0)
+            return
+        start = time.perf_counter()
         sys.stdout.write(out)
-        sys.stdout.flush()
+        sys.stdout.flush() # blocks while the terminal is behind
+        if self.governor is not None:
+            self.governor.record(time.perf_counter() - start, len(out))
+
+    def _get_full_output(self, framebuffer: Framebuffer) -> str:
+        """Builds the output that redraws the whole screen.
+        Color escape sequences are only emitted where the color changes along a line
+
+        Args:
+            framebuffer (Framebuffer): frame to output
+
+        Returns:
+            str: full frame, with the cursor moved back to the top left corner
+        """
+        lines = framebuffer.get_lines(self.cell_transparant, self.cell_default, styled=True, color_depth=self.color_depth)
+        return "".join(line + " \n" for line in lines) + "\u001b[A" * len(lines) + "\r" # "\u001b[A" is ANSI code for UP
+
+    def _get_diff_output(self, framebuffer: Framebuffer, last_frame: Framebuffer) -> str | None:
+        """Builds the output that only redraws cells changed since `last_frame`
+
+        Args:
+            framebuffer (Framebuffer): frame to output
+            last_frame (Framebuffer): frame that was last written
+
+        Returns:
+            str | None: partial frame, or None if a full redraw is required
+        """
+        last_cells = last_frame.cells
+        last_colors = last_frame.colors
+        last_stride = last_frame.stride
+        cells = framebuffer.cells
+        colors = framebuffer.colors
+        stride = framebuffer.stride
+        if len(last_cells) != len(cells) or last_stride != stride:
+            return None # resized
+        out: list[str] = []
+        cursor_y = 0 # cursor is at the top left corner between frames
+        for y in range(framebuffer.height):
+            start = y * stride
+            end = start + stride
+            last_line = last_cells[start:end]
+            line = cells[start:end]
+            last_line_colors = last_colors[start:end]
+            line_colors = colors[start:end]
+            if line == last_line and line_colors == last_line_colors:
+                continue
+            if y != cursor_y:
+                out.append(f"\u001b[{y - cursor_y}B") # move down
+                cursor_y = y
+            if line_colors.count(0) != stride or last_line_colors.count(0) != stride: # compare color along with cell
+                runs = _changed_runs(list(zip(last_line, last_line_colors)), list(zip(line, line_colors)), self.diff_gap)
+            else:
+                runs = _changed_runs(last_line, line, self.diff_gap)
+            for run_start, run_end in runs:
+                out.append(f"\u001b[{run_start + 1}G") # move to column (1-indexed)
+                out.append(framebuffer.decode(start + run_start, start + run_end, self.cell_transparant, self.cell_default,
+                                              styled=True, color_depth=self.color_depth))
+        if cursor_y:
+            out.append(f"\u001b[{cursor_y}A") # move back up
+        if out:
+            out.append("\r")
+        return "".join(out)
+
+
+def _get_min_full_size(framebuffer: Framebuffer, default: str) -> int:
+    """Estimates the length of `AsciiScreen._get_full_output()` from below, without building it.
+    Every cell takes at least one character, unless transparent cells are written as an empty `default`,
+    and every line ends with " \\n" and moves the cursor up by "\\u001b[A"
+
+    Args:
+        framebuffer (Framebuffer): frame to output
+        default (str): replacement for transparent cells
+
+    Returns:
+        int: lower bound of the length of the full output
+    """
+    cell_size = 1 if default else 0
+    return (framebuffer.width * cell_size + 5) * framebuffer.height + 1
+
+
+def _changed_runs(old: Sequence[object], new: Sequence[object], gap: int) -> list[tuple[int, int]]:
+    """Finds the runs of cells that differ between two lines of equal length.
+    Runs separated by `gap` or fewer unchanged cells are merged,
+    since rewriting a few cells is cheaper than moving the cursor
+
+    Args:
+        old (Sequence[object]): previous line of cells
+        new (Sequence[object]): current line of cells
+        gap (int): largest amount of unchanged cells to merge across
+
+    Returns:
+        list[tuple[int, int]]: runs as (start, end), where end is exclusive
+    """
+    runs: list[tuple[int, int]] = []
+    start = -1
+    end = -1
+    for idx, (old_cell, new_cell) in enumerate(zip(old, new)):
+        if old_cell == new_cell:
+            continue
+        if start == -1:
+            start = idx
+        elif idx - end > gap:
+            runs.append((start, end))
+            start = idx
+        end = idx + 1
+    if start != -1:
+        runs.append((start, end))
+    return runs
+
+
+def _get_signature(item: _RenderItem) -> tuple[object, ...]:
+    """Snapshots everything about a collected node that affects what it draws.
+    Changes to its texture and order are counted by `._render_version`, so only the screen space transform is copied
+
+    Args:
+        item (_RenderItem): collected node
+
+    Returns:
+        tuple[object, ...]: signature, that compares equal as long as the drawn content is the same
+    """
+    node = item.node
+    version = getattr(node, "_render_version", None)
+    if version is not None and item.texture is node.texture: # plain texture
+        return (version, item.x, item.y, item.rotation, item.color)
+    # content comes from `_get_final_texture` of a subclass, or a node without the `Texture` component
+    texture = item.texture if isinstance(item.texture, CompiledTexture) else tuple(map(tuple, item.texture)) # compiled is hashed once
+    return (node.z_index, node.process_priority, item.x, item.y, item.rotation, item.color, texture)
+
+
+def _get_layer_transform(item: _RenderItem) -> tuple[object, ...]:
+    """Snapshots what a member of a static layer cannot report by invalidating the layer itself
+
+    Args:
+        item (_RenderItem): collected node
+
+    Returns:
+        tuple[object, ...]: screen space transform, or the full signature for nodes that do not count their changes
+    """
+    if item.texture is getattr(item.node, "texture", None) and isinstance(item.node, Texture): # plain texture
+        return (item.x, item.y, item.rotation)
+    return _get_signature(item)
+
+
+def _get_rect(item: _RenderItem) -> tuple[int, int, int, int]:
+    """Computes a bounding rectangle covering every cell a collected node may draw to
+
+    Args:
+        item (_RenderItem): collected node
+
+    Returns:
+        tuple[int, int, int, int]: rectangle as (left, top, right, bottom), where right and bottom are exclusive
+    """
+    if item.raster is not None:
+        raster = item.raster
+        return (round(item.x) + raster.left, round(item.y) + raster.top,
+                round(item.x) + raster.right + 1, round(item.y) + raster.bottom + 1)
+    left = math.floor(item.x)
+    top = math.floor(item.y)
+    if item.texture is getattr(item.node, "texture", None): # plain texture, with its size cached
+        width, height = item.node._get_texture_size()
+    else:
+        width, height = max(map(len, item.texture)), len(item.texture)
+    return (left, top, left + width + 1, top + height + 1)
+
+
+def _clip_rect(rect: tuple[int, int, int, int], width: int, height: int) -> tuple[int, int, int, int]:
+    left, top, right, bottom = rect
+    return (max(0, left), max(0, top), min(width, right), min(height, bottom))
+
+
+def _rects_overlap(rect: tuple[int, int, int, int], other: tuple[int, int, int, int]) -> bool:
+    return rect[0] < other[2] and other[0] < rect[2] and rect[1] < other[3] and other[1] < rect[3]
+
+
+def _merge_rects(rects: Iterable[tuple[int, int, int, int]]) -> list[tuple[int, int, int, int]]:
+    """Merges overlapping rectangles into their bounding rectangles, and drops empty ones
+
+    Args:
+        rects (Iterable[tuple[int, int, int, int]]): rectangles as (left, top, right, bottom)
+
+    Returns:
+        list[tuple[int, int, int, int]]: rectangles that do not overlap
+    """
+    merged: list[tuple[int, int, int, int]] = []
+    for rect in rects:
+        if rect[0] >= rect[2] or rect[1] >= rect[3]: # empty
+            continue
+        overlapping = True
+        while overlapping:
+            overlapping = False
+            for idx, other in enumerate(merged):
+                if _rects_overlap(rect, other):
+                    rect = (min(rect[0], other[0]), min(rect[1], other[1]), max(rect[2], other[2]), max(rect[3], other[3]))
+                    del merged[idx]
+                    overlapping = True
+                    break
+        merged.append(rect)
+    return merged
@@ -0,0 +1,307 @@
+from __future__ import annotations
+
+import math
+import itertools
+from typing import TYPE_CHECKING
+
+from ..math import Vec2
+from ..template.transform import Transform2D
+from .texture import Texture, _PLAIN_FINAL_TEXTURES
+
+if TYPE_CHECKING:
+    from .type_hints import ValidTextureNode
+
+
+class _Entry:
+    __slots__ = ("node", "sequence", "bounds", "cells", "version", "transform", "placement")
+
+    def __init__(self, node: ValidTextureNode, sequence: int) -> None:
+        self.node = node
+        self.sequence = sequence # insertion order, used to break ties when sorting results
+        self.bounds: tuple[float, float, float, float] | None = None # None when unbounded
+        self.cells: tuple[int, int, int, int] | None = None # covered grid cells, inclusive
+        self.version = -1 # `._render_version` of the node when `.placement` was computed
+        self.transform: tuple[float, ...] = () # positions and rotations of the node and its ancestors when the bounds were computed
+        self.placement: tuple[float, float, int, int, int, int] | None = None # from `_get_placement()`
+
+
+class SpatialGrid:
+    """`SpatialGrid` for finding textured nodes by region, using a uniform grid hash over their global bounding boxes
+
+    Nodes are rehashed by `.update()`, or by `.refresh()` when the position or rotation of the node
+    or an ancestor changed, or when the texture changed as counted by `._render_version`.
+    Mutating `.texture` or `.offset` in place therefore requires calling `.invalidate_texture()` on the node.
+    Nodes only move between grid cells when the range of cells they cover changes.
+    Nodes whose bounds cannot be known, like ones overriding `_get_final_texture`
+    or ones without the `Texture` component, are returned by every query.
+
+    Since `.refresh()` compares every node, the grid only pays off in scenes where most nodes are still.
+    When more than `.busy_ratio` of the nodes moved or rotated in a refresh, `.is_busy` is set,
+    and the engine renders without the grid for the next `.busy_frames` frames
+    """
+    busy_ratio: float = 0.25 # share of nodes moving in a refresh, above which the scene counts as mostly moving
+    busy_frames: int = 30 # frames rendered without the grid after a busy refresh, before refreshing it again
+    is_busy: bool = False # whether more than `.busy_ratio` of the nodes moved or rotated in the last refresh
+
+    def __init__(self, cell_size: int = 16) -> None:
+        """Initializes an empty grid
+
+        Args:
+            cell_size (int, optional): width and height of each grid cell, in world units. Defaults to 16.
+        """
+        self.cell_size = cell_size
+        self._entries: dict[int, _Entry] = {} # id(node) -> entry
+        self._cells: dict[tuple[int, int], set[int]] = {} # grid cell -> ids of nodes
+        self._unbounded: set[int] = set()
+        self._bounded: dict[int, _Entry] = {} # entries with known bounds, checked for changes by `.refresh()`
+        self._sequence = itertools.count()
+        Texture._set_render_tracking(True) # `._render_version` tells which nodes changed texture
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, node: object) -> bool:
+        return id(node) in self._entries
+
+    def insert(self, node: ValidTextureNode) -> None:
+        """Adds a node to the grid
+
+        Args:
+            node (ValidTextureNode): node with `Texture` component
+        """
+        if id(node) in self._entries:
+            self.update(node)
+            return
+        self._entries[id(node)] = _Entry(node, next(self._sequence))
+        self.update(node)
+
+    def remove(self, node: ValidTextureNode) -> None:
+        """Removes a node from the grid, if present
+
+        Args:
+            node (ValidTextureNode): node to remove
+        """
+        entry = self._entries.pop(id(node), None)
+        if entry is None:
+            return
+        self._bounded.pop(id(node), None)
+        self._unlink(id(node), entry)
+
+    def update(self, node: ValidTextureNode) -> bool:
+        """Recomputes the bounds of a node, after it moved or changed texture
+
+        Args:
+            node (ValidTextureNode): node in the grid
+
+        Returns:
+            bool: whether the node moved to other grid cells
+        """
+        entry = self._entries.get(id(node))
+        if entry is None:
+            return False
+        entry.placement = _get_placement(node)
+        if entry.placement is None:
+            self._bounded.pop(id(node), None)
+            return self._rehash(entry, ())
+        self._bounded[id(node)] = entry
+        entry.version = node._render_version
+        return self._rehash(entry, _get_transform_key(node))
+
+    def refresh(self, *, force: bool = False) -> int:
+        """Updates the bounds of nodes that moved, rotated or changed texture since their last update,
+        which is done once per frame by the engine
+
+        Args:
+            force (bool, optional): whether to update every node, even if unchanged. Defaults to False.
+
+        Returns:
+            int: amount of nodes that moved to other grid cells
+        """
+        if force:
+            self.is_busy = False
+            return sum(self.update(entry.node) for entry in tuple(self._entries.values()))
+        moved = 0
+        moving = 0 # nodes that moved or rotated
+        for entry in tuple(self._bounded.values()):
+            node = entry.node
+            if entry.version != node._render_version: # texture changed
+                moved += self.update(node)
+                continue
+            transform = _get_transform_key(node)
+            if transform != entry.transform:
+                moving += 1
+                moved += self._rehash(entry, transform)
+        self.is_busy = moving > len(self._bounded) * self.busy_ratio
+        return moved
+
+    def query_rect(self, rect: tuple[Vec2, Vec2]) -> list[ValidTextureNode]:
+        """Finds the nodes whose bounds overlap the given rectangle
+
+        Args:
+            rect (tuple[Vec2, Vec2]): start and end corner, in world space
+
+        Returns:
+            list[ValidTextureNode]: nodes, in the order of `z_index`, `process_priority` and insertion
+        """
+        start, end = rect
+        size = self.cell_size
+        left = math.floor(start.x / size)
+        top = math.floor(start.y / size)
+        right = math.floor(end.x / size)
+        bottom = math.floor(end.y / size)
+        found: set[int] = set(self._unbounded)
+        if (right - left + 1) * (bottom - top + 1) > len(self._cells): # fewer occupied cells than covered
+            for (x, y), ids in self._cells.items():
+                if left <= x <= right and top <= y <= bottom:
+                    found.update(ids)
+        else:
+            for cell in itertools.product(range(left, right + 1), range(top, bottom + 1)):
+                ids = self._cells.get(cell)
+                if ids:
+                    found.update(ids)
+        entries = self._entries
+        results = [
+            entries[uid] for uid in found
+            if entries[uid].bounds is None or _overlaps(entries[uid].bounds, start, end) # type: ignore
+        ]
+        results.sort(key=_sort_key)
+        return [entry.node for entry in results]
+
+    def query_point(self, point: Vec2) -> list[ValidTextureNode]:
+        """Finds the nodes whose bounds contain the given point
+
+        Args:
+            point (Vec2): point in world space
+
+        Returns:
+            list[ValidTextureNode]: nodes, in the order of `z_index`, `process_priority` and insertion
+        """
+        return self.query_rect((point, point))
+
+    def _rehash(self, entry: _Entry, transform: tuple[float, ...]) -> bool:
+        """Recomputes the bounds of an entry from its `.placement`, and moves it to the grid cells it covers
+
+        Args:
+            entry (_Entry): entry of the node
+            transform (tuple[float, ...]): current transform key of the node
+
+        Returns:
+            bool: whether the node moved to other grid cells
+        """
+        node = entry.node
+        placement = entry.placement
+        entry.transform = transform
+        if placement is None:
+            bounds = None
+        elif len(transform) == 3 and transform[2] == 0: # unrotated node without `Transform2D` parent, same as `_get_texture_global_position()`
+            x_offset, y_offset, x_center, y_center, width, height = placement
+            left = transform[0] + x_offset - x_center
+            top = transform[1] + y_offset - y_center
+            bounds = (left, top, left + width, top + height)
+        else:
+            bounds = _get_bounds(node, transform, placement)
+        entry.bounds = bounds
+        if bounds is None:
+            cells = None
+        else:
+            size = self.cell_size
+            cells = (math.floor(bounds[0] / size), math.floor(bounds[1] / size),
+                     math.floor(bounds[2] / size), math.floor(bounds[3] / size))
+        if cells == entry.cells and (cells is not None or id(node) in self._unbounded):
+            return False
+        self._unlink(id(node), entry)
+        entry.cells = cells
+        if cells is None:
+            self._unbounded.add(id(node))
+        else:
+            left, top, right, bottom = cells
+            for cell in itertools.product(range(left, right + 1), range(top, bottom + 1)):
+                self._cells.setdefault(cell, set()).add(id(node))
+        return True
+
+    def _unlink(self, uid: int, entry: _Entry) -> None:
+        """Removes a node from the grid cells it covers
+        """
+        self._unbounded.discard(uid)
+        if entry.cells is None:
+            return
+        left, top, right, bottom = entry.cells
+        for cell in itertools.product(range(left, right + 1), range(top, bottom + 1)):
+            ids = self._cells.get(cell)
+            if ids is not None:
+                ids.discard(uid)
+                if not ids:
+                    del self._cells[cell]
+        entry.cells = None
+
+
+def _sort_key(entry: _Entry) -> tuple[int, int, int]:
+    return entry.node.z_index, entry.node.process_priority, entry.sequence
+
+
+def _overlaps(bounds: tuple[float, float, float, float], start: Vec2, end: Vec2) -> bool:
+    return bounds[0] <= end.x and start.x <= bounds[2] and bounds[1] <= end.y and start.y <= bounds[3]
+
+
+def _get_transform_key(node: ValidTextureNode) -> tuple[float, ...]:
+    """Collects what the global transform of a node depends on, which is cheaper to compare than recomputing its bounds
+
+    Args:
+        node (ValidTextureNode): node with `Transform2D` component
+
+    Returns:
+        tuple[float, ...]: position and rotation of the node and each `Transform2D` ancestor
+    """
+    position = node.position
+    parent = node.parent
+    if parent is None or not isinstance(parent, Transform2D): # most common case
+        return (position.x, position.y, node.rotation)
+    key = [position.x, position.y, node.rotation]
+    while parent is not None and isinstance(parent, Transform2D):
+        position = parent.position
+        key += (position.x, position.y, parent.rotation)
+        parent = parent.parent
+    return tuple(key)
+
+
+def _get_placement(node: ValidTextureNode) -> tuple[float, float, int, int, int, int] | None:
+    """Collects where the texture of a node is placed relative to its position, which only changes along with `._render_version`
+
+    Args:
+        node (ValidTextureNode): node to compute the placement of
+
+    Returns:
+        tuple[float, float, int, int, int, int] | None: offset, centering shift and size of the texture,
+        or None if the node does not draw its `.texture` directly
+    """
+    if getattr(type(node), "_get_final_texture", None) not in _PLAIN_FINAL_TEXTURES:
+        return None
+    width, height = node._get_texture_size()
+    if node.centered:
+        return (node.offset.x, node.offset.y, width // 2, height // 2, width, height)
+    return (node.offset.x, node.offset.y, 0, 0, width, height)
+
+
+def _get_bounds(node: ValidTextureNode, transform: tuple[float, ...], placement: tuple[float, float, int, int, int, int]) -> tuple[float, float, float, float]:
+    """Computes a conservative bounding box of the cells a node may draw to
+
+    Args:
+        node (ValidTextureNode): node with `Texture` component
+        transform (tuple[float, ...]): transform key of the node, from `_get_transform_key()`
+        placement (tuple[float, float, int, int, int, int]): placement of the texture, from `_get_placement()`
+
+    Returns:
+        tuple[float, float, float, float]: bounds as (left, top, right, bottom) in world space
+    """
+    x_offset, y_offset, x_center, y_center, width, height = placement
+    position = node._get_texture_global_position()
+    rotation = transform[2] if len(transform) == 3 else sum(transform[2::3]) # global rotation
+    if rotation == 0:
+        return (position.x, position.y, position.x + width, position.y + height)
+    # the texture rotates around a pivot, so use the farthest corner as reach
+    x_pivot = x_center - x_offset
+    y_pivot = y_center - y_offset
+    reach = math.hypot(max(abs(x_pivot), abs(width - x_pivot)), max(abs(y_pivot), abs(height - y_pivot))) + 1
+    pivot_x = position.x + x_pivot
+    pivot_y = position.y + y_pivot
+    return (pivot_x - reach, pivot_y - reach, pivot_x + reach, pivot_y + reach)
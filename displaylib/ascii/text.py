@@ -21,6 +21,11 @@ from math import pi as _PI
 
 
 class Conversion: # holds the translate information
+    """Databases of how symbols change when flipped or rotated
+
+    Lookup tables are precomputed from the databases. Use `.extend()` to add symbols,
+    or call `.rebuild()` after changing the databases directly
+    """
     horizontal: dict[str, str] = { # horizontal flip
         "/": "\\",
         "(": ")",
@@ -44,6 +49,71 @@ class Conversion: # holds the translate information
         "|": ["|", "\\", "-", "/", "|", "\\", "-", "/"],
         ".": [".", "'"]
     }
+    # precomputed by `.rebuild()`
+    _version: int = 0 # incremented on every rebuild, so that caches of rotated glyphs can be invalidated
+    _horizontal_table: dict[int, str] | None = None # for `str.translate`, None if a symbol is not a single character
+    _vertical_table: dict[int, str] | None = None
+    _rotations: dict[str, tuple[int, tuple[str, ...]]] = {} # symbol -> (amount of options, result by rounded angle)
+
+    @classmethod
+    def extend(cls, *, horizontal: dict[str, str] | None = None, vertical: dict[str, str] | None = None, rotational: dict[str, list[str]] | None = None) -> None:
+        """Adds symbols to the databases, and rebuilds the lookup tables. Flips are mirrored, like the builtin ones
+
+        Args:
+            horizontal (dict[str, str] | None, optional): horizontal flips. Defaults to None.
+            vertical (dict[str, str] | None, optional): vertical flips. Defaults to None.
+            rotational (dict[str, list[str]] | None, optional): symbols with their options when rotating. Defaults to None.
+        """
+        for key, value in (horizontal or {}).items():
+            cls.horizontal[key] = value
+            cls.horizontal[value] = key
+        for key, value in (vertical or {}).items():
+            cls.vertical[key] = value
+            cls.vertical[value] = key
+        for key, options in (rotational or {}).items():
+            cls.rotational[key] = list(options)
+        cls.rebuild()
+
+    @classmethod
+    def rebuild(cls) -> None:
+        """Precomputes the lookup tables used by the module functions from the databases
+        """
+        cls._horizontal_table = _make_table(cls.horizontal)
+        cls._vertical_table = _make_table(cls.vertical)
+        rotations: dict[str, tuple[int, tuple[str, ...]]] = {}
+        for options in cls.rotational.values(): # symbols found among the options of a key, where the first key wins
+            length = len(options)
+            if not length:
+                continue
+            for symbol in options:
+                if symbol not in rotations:
+                    where = options.index(symbol)
+                    rotations[symbol] = (length, tuple(options[index - where] for index in range(length // 2 + 1)))
+        for key, options in cls.rotational.items(): # keys themselves take precedence
+            if not options:
+                continue
+            rotations[key] = (len(options), tuple(options[index] for index in range(len(options) // 2 + 1)))
+        cls._rotations = rotations
+        cls._version += 1
+
+
+def _make_table(database: dict[str, str]) -> dict[int, str] | None:
+    """Creates a table for `str.translate`, if every symbol and replacement is a single character
+    """
+    if not all(len(key) == 1 and len(value) == 1 for key, value in database.items()):
+        return None
+    return str.maketrans(database)
+
+
+def _join_cells(line: str | _Iterable[str]) -> str | None:
+    """Joins a line of cells, if every cell is a single character
+    """
+    if isinstance(line, str):
+        return line
+    cells = line if isinstance(line, (list, tuple)) else list(line)
+    joined = "".join(cells)
+    return joined if len(joined) == len(cells) else None
+
 
 # mirror database
 for _key, _value in tuple(Conversion.horizontal.items()):
@@ -56,6 +126,7 @@ for _key, _value in tuple(Conversion.vertical.items()):
 #         new_key = options[idx]
 #         new_options = options[idx:] + options[:idx]
 #         Conversion.rotational[new_key] = new_options
+Conversion.rebuild()
 
 # module functions
 def lookuph(symbol: str) -> str:
@@ -91,6 +162,13 @@ def fliph(line: str | _Iterable[str]) -> str:
     Returns:
         str: line flipped horizontally
     """
+    table = Conversion._horizontal_table
+    if table is not None:
+        if not isinstance(line, str):
+            line = list(line) # may be consumed by `_join_cells`
+        joined = _join_cells(line)
+        if joined is not None:
+            return joined.translate(table)[::-1]
     return "".join(Conversion.horizontal.get(letter, letter) for letter in line)[::-1]
 
 
@@ -103,6 +181,13 @@ def flipv(line: str | _Iterable[str]) -> str:
     Returns:
         str: line flipped vertically
     """
+    table = Conversion._vertical_table
+    if table is not None:
+        if not isinstance(line, str):
+            line = list(line) # may be consumed by `_join_cells`
+        joined = _join_cells(line)
+        if joined is not None:
+            return joined.translate(table)
     return "".join(Conversion.vertical.get(letter, letter) for letter in line)
 
 
@@ -115,7 +200,17 @@ def mapfliph(content: _Iterable[str | _Iterable[str]]) -> list[list[str]]:
     Returns:
         list[list[str]]: lists with lines flipped horizontally
     """
-    return [[Conversion.horizontal.get(letter, letter) for letter in line][::-1] for line in content]
+    table = Conversion._horizontal_table
+    result: list[list[str]] = []
+    for line in content:
+        if not isinstance(line, str):
+            line = list(line)
+        joined = _join_cells(line) if table is not None else None
+        if joined is not None:
+            result.append(list(joined.translate(table)[::-1])) # type: ignore[arg-type]
+        else:
+            result.append([Conversion.horizontal.get(letter, letter) for letter in line][::-1])
+    return result
 
 
 def mapflipv(content: _Iterable[str | _Iterable[str]]) -> list[list[str]]:
@@ -127,7 +222,17 @@ def mapflipv(content: _Iterable[str | _Iterable[str]]) -> list[list[str]]:
     Returns:
         list[list[str]]: lists with lines flipped vertically
     """
-    return [[Conversion.vertical.get(letter, letter) for letter in line] for line in content]
+    table = Conversion._vertical_table
+    result: list[list[str]] = []
+    for line in content:
+        if not isinstance(line, str):
+            line = list(line)
+        joined = _join_cells(line) if table is not None else None
+        if joined is not None:
+            result.append(list(joined.translate(table))) # type: ignore[arg-type]
+        else:
+            result.append([Conversion.vertical.get(letter, letter) for letter in line])
+    return result
 
 
 def rotate(symbol: str, angle: float) -> str:
@@ -140,19 +245,8 @@ def rotate(symbol: str, angle: float) -> str:
     Returns:
         str: rotated symbol or original symbol
     """
-    if symbol in Conversion.rotational:
-        options = len(Conversion.rotational[symbol])
-        index = round(((angle % _PI) / (2*_PI)) * options)
-        return Conversion.rotational[symbol][index]
-    
-    for idx, options in enumerate(Conversion.rotational.values()):
-        if symbol in options:
-            break
-    else: # nobreak
+    rotation = Conversion._rotations.get(symbol)
+    if rotation is None:
         return symbol
-    key = list(Conversion.rotational.keys())[idx]
-    options = Conversion.rotational[key]
-    where = options.index(symbol)
-    length = len(options)
-    index = round(((angle % _PI) / (2*_PI)) * length) -where
-    return Conversion.rotational[key][index]
+    options, results = rotation
+    return results[round(((angle % _PI) / (2*_PI)) * options)]
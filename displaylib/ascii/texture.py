@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import re
 import copy
 import functools
-from typing import TYPE_CHECKING, ClassVar, cast
+from array import array
+from typing import TYPE_CHECKING, ClassVar, Sequence, Iterator, cast
 
 from ..math import Vec2, Vec2i
 from . import text
+from .colored import Color
 from ..template import Transform2D
 from ..template.type_hints import MroNext, NodeType, NodeMixin
 from .type_hints import ValidTextureNode, TextureSelf
@@ -13,6 +16,13 @@ from .type_hints import ValidTextureNode, TextureSelf
 if TYPE_CHECKING:
     import io
     from .type_hints import TextureSelf
+    from .color import ColorValue
+    from .spatial import SpatialGrid
+    from .screen import _StaticLayer
+
+# attributes that change what a textured node draws, where its texture is placed relative to `.position`, or in what order.
+# `.position` and `.rotation` are left out, since vectors are mutated in place, so they are compared by the users instead
+_RENDER_ATTRIBUTES = frozenset(("texture", "color", "offset", "centered", "parent", "z_index", "process_priority", "visible"))
 
 
 class Texture: # Component (mixin class)
@@ -23,12 +33,17 @@ class Texture: # Component (mixin class)
     """
     _instances: ClassVar[list[ValidTextureNode]] = [] # references to nodes with Texture component
     _request_z_index_sort: ClassVar[bool] = False # requests Engine to sort
+    _spatial_index: ClassVar[SpatialGrid | None] = None # set by the engine, when enabled
     default_z_index: ClassVar[int]
-    texture: list[list[str]]
+    texture: list[list[str]] | CompiledTexture
     offset: Vec2
     centered: bool
+    static: bool = False # content is cached as a pre-rendered layer, along with every descendant
+    _render_version: int = 0 # counts changes to `_RENDER_ATTRIBUTES` while render tracking is enabled, and calls to `.invalidate_texture()`
+    _render_tracking: ClassVar[bool] = False # set by `Texture._set_render_tracking()`
+    _static_layer: _StaticLayer | None = None # cached layer the node is drawn in, invalidated along with `._render_version`
 
-    def __new__(cls: type[NodeType], *args, texture: list[list[str]] = [], offset: Vec2 = Vec2(0, 0), centered = None, z_index: int = 0, force_sort: bool = True, **kwargs) -> NodeType: # borrowing: `force_sort`
+    def __new__(cls: type[NodeType], *args, texture: list[list[str]] | CompiledTexture = [], offset: Vec2 = Vec2(0, 0), centered = None, z_index: int = 0, force_sort: bool = True, **kwargs) -> NodeType: # borrowing: `force_sort`
         mro_next = cast(MroNext[ValidTextureNode], super())
         instance = mro_next.__new__(cls, *args, force_sort=force_sort, **kwargs) # `force_sort` is passed to Node eventually
         # override -> class value -> default
@@ -51,8 +66,55 @@ class Texture: # Component (mixin class)
             instance._z_index = 0
         if force_sort:
             Texture._request_z_index_sort = True
-        Texture._instances.append(instance)
+        Texture._add_instance(instance)
         return cast(NodeType, instance)
+
+    @staticmethod
+    def _set_render_tracking(enabled: bool) -> None:
+        """Starts or stops counting changes to `_RENDER_ATTRIBUTES` in `._render_version` of every textured node.
+        Enabled by the users of `._render_version`, which are the spatial grid, dirty tracking and static layers,
+        so that attribute assignment is not hooked otherwise
+
+        Args:
+            enabled (bool): whether to count changes
+        """
+        if enabled == Texture._render_tracking:
+            return
+        Texture._render_tracking = enabled
+        if enabled:
+            Texture.__setattr__ = _tracked_setattr # type: ignore
+        else:
+            del Texture.__setattr__
+
+    def _mark_render_changed(self) -> None:
+        """Counts a change to what the node draws, and invalidates the static layer it is drawn in
+        """
+        self._render_version += 1
+        if self._static_layer is not None:
+            self._static_layer.is_valid = False
+
+    @staticmethod
+    def _add_instance(node: ValidTextureNode) -> None:
+        """Registers a node to be rendered, also for nodes that draw without the `Texture` component
+
+        Args:
+            node (ValidTextureNode): node to render
+        """
+        Texture._instances.append(node)
+        if Texture._spatial_index is not None:
+            Texture._spatial_index.insert(node)
+
+    @staticmethod
+    def _remove_instance(node: ValidTextureNode) -> None:
+        """Stops rendering a node registered with `Texture._add_instance()`
+
+        Args:
+            node (ValidTextureNode): node to stop rendering
+        """
+        if node in Texture._instances:
+            Texture._instances.remove(node)
+        if Texture._spatial_index is not None:
+            Texture._spatial_index.remove(node)
     
     @property
     def z_index(self) -> int:
@@ -95,17 +157,72 @@ class Texture: # Component (mixin class)
         Returns:
             Vec2i: size of the content
         """
+        if type(self)._get_final_texture in _PLAIN_FINAL_TEXTURES: # same dimensions as `.texture`
+            return Vec2i(*self._get_texture_size())
         final_texture = self._get_final_texture()
         longest = len(max(final_texture, key=len))
         lines = len(final_texture)
         return Vec2i(longest, lines)
 
+    def is_globally_static(self) -> bool:
+        """Checks whether the node or any of its ancestors are flagged `.static`
+
+        Returns:
+            bool: global static flag
+        """
+        node = self
+        while node is not None:
+            if getattr(node, "static", False):
+                return True
+            node = node.parent
+        return False
+
+    def invalidate_texture(self) -> None:
+        """Discards the cached size of `.texture`, and counts it as a change. Call this after mutating `.texture` in place,
+        as only reassigning `.texture` is detected automatically
+        """
+        self._texture_size_cache = None
+        self._texture_key_cache = None
+        self._mark_render_changed()
+
+    def _get_texture_size(self) -> tuple[int, int]:
+        """Returns the width and height of `.texture`, cached until `.texture` is reassigned or its amount of lines changes,
+        or `.invalidate_texture()` is called
+
+        Returns:
+            tuple[int, int]: width and height
+        """
+        self = cast(ValidTextureNode, self) # fixes type hints
+        texture = self.texture
+        cache = getattr(self, "_texture_size_cache", None)
+        if cache is not None and cache[0] is texture and cache[2] == len(texture):
+            return cache[1], cache[2]
+        width = max(map(len, texture), default=0)
+        height = len(texture)
+        self._texture_size_cache = (texture, width, height)
+        return width, height
+
+    def _get_texture_key(self) -> tuple[Sequence[str], ...]:
+        """Returns `.texture` as a hashable tuple of rows, used to cache its rotated rasters.
+        Cached until `.texture` is reassigned or `.invalidate_texture()` is called
+
+        Returns:
+            tuple[Sequence[str], ...]: rows of the texture as tuples
+        """
+        self = cast(ValidTextureNode, self) # fixes type hints
+        texture = self.texture
+        cache = getattr(self, "_texture_key_cache", None)
+        if cache is not None and cache[0] is texture:
+            return cache[1]
+        key = texture.rows if isinstance(texture, CompiledTexture) else tuple(map(tuple, texture))
+        self._texture_key_cache = (texture, key)
+        return key
+
     def queue_free(self) -> None:
         """Decrements the reference of the node by removing it from `Texture._instances`
         and then adds it to the deletion queue of the engine
         """
-        if self in Texture._instances:
-            Texture._instances.remove(self)
+        Texture._remove_instance(cast(ValidTextureNode, self))
         mro_next = cast(NodeMixin, super())
         mro_next.queue_free()
     
@@ -118,8 +235,9 @@ class Texture: # Component (mixin class)
         self = cast(ValidTextureNode, self) # fixes type hints
         global_position = self.position + self.offset
         if self.centered: # subtract hald size of the texture
-            global_position.x -= len(max(self.texture, key=len)) // 2
-            global_position.y -= len(self.texture) // 2
+            width, height = self._get_texture_size()
+            global_position.x -= width // 2
+            global_position.y -= height // 2
         parent = self.parent
         while parent is not None and isinstance(parent, Transform2D): # global position
             global_position = parent.position + global_position.rotated(parent.rotation)
@@ -137,6 +255,126 @@ class Texture: # Component (mixin class)
             return super_implementation() # usually the Color component implementation
         return self.texture
 
+    def _get_final_color(self) -> ColorValue | None:
+        """Some components may override this implementation, for example the Color component.
+        Used by `AsciiScreen` to store color separately from `.texture`
+
+        Returns:
+            ColorValue | None: here, there is no color
+        """
+        super_implementation = getattr(super(), "_get_final_color", None)
+        if super_implementation is not None:
+            return super_implementation() # usually the Color component implementation
+        return None
+
+
+_object_setattr = object.__setattr__
+
+
+def _tracked_setattr(self: Texture, name: str, value: object) -> None:
+    """Sets an attribute, counting the change in `._render_version` if it affects what the node draws.
+    Installed as `Texture.__setattr__` while render tracking is enabled
+
+    Args:
+        name (str): attribute name
+        value (object): new value
+    """
+    _object_setattr(self, name, value)
+    if name in _RENDER_ATTRIBUTES:
+        self._mark_render_changed()
+
+
+class CompiledTexture(Sequence[str]):
+    """`CompiledTexture` is an immutable texture, where rows are strings and the opaque spans of each row are precomputed
+
+    Can be used anywhere a texture is read, and is drawn by copying each opaque span as a whole.
+    Every cell has to be a single character
+    """
+    __slots__ = ("rows", "spans", "codes", "width", "height", "transparent", "_hash")
+    rows: tuple[str, ...]
+    spans: tuple[tuple[tuple[int, int], ...], ...] # per row, as (start, end) where end is exclusive
+    codes: tuple[tuple[array[int], ...], ...] # per span, cell codes ready to be copied into a `Framebuffer`
+    width: int
+    height: int
+    transparent: str
+
+    def __init__(self, texture: Sequence[Sequence[str]], /, transparent: str = " ") -> None:
+        """Compiles a texture
+
+        Args:
+            texture (Sequence[Sequence[str]]): rows of cells
+            transparent (str, optional): content marking a transparent cell. Defaults to " ".
+
+        Raises:
+            ValueError: a cell was not a single character
+        """
+        rows = tuple(line if isinstance(line, str) else "".join(line) for line in texture)
+        for line, row in zip(texture, rows):
+            if len(row) != len(line):
+                raise ValueError("every cell of a compiled texture has to be a single character")
+        if len(transparent) == 1:
+            pattern = re.compile(f"[^{re.escape(transparent)}]+")
+            spans = tuple(tuple(match.span() for match in pattern.finditer(row)) for row in rows)
+        else: # no single character can be transparent
+            spans = tuple(((0, len(row)),) if row else () for row in rows)
+        codes = tuple(
+            tuple(array("I", map(ord, row[start:end])) for start, end in row_spans)
+            for row, row_spans in zip(rows, spans)
+        )
+        object.__setattr__(self, "rows", rows)
+        object.__setattr__(self, "spans", spans)
+        object.__setattr__(self, "codes", codes)
+        object.__setattr__(self, "width", max(map(len, rows), default=0))
+        object.__setattr__(self, "height", len(rows))
+        object.__setattr__(self, "transparent", transparent)
+        object.__setattr__(self, "_hash", hash((rows, transparent)))
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"'{type(self).__name__}' is immutable")
+
+    def __reduce__(self) -> tuple[type[CompiledTexture], tuple[tuple[str, ...], str]]:
+        return (CompiledTexture, (self.rows, self.transparent))
+
+    def __copy__(self) -> CompiledTexture:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, object]) -> CompiledTexture:
+        return self
+
+    def __len__(self) -> int:
+        return self.height
+
+    def __getitem__(self, index: int) -> str: # type: ignore[override]
+        return self.rows[index]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.rows)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, CompiledTexture):
+            return NotImplemented
+        return self._hash == other._hash and self.rows == other.rows and self.transparent == other.transparent
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self.rows)!r}, transparent={self.transparent!r})"
+
+    def to_lists(self) -> list[list[str]]:
+        """Converts back to a mutable texture
+
+        Returns:
+            list[list[str]]: rows of cells
+        """
+        return [list(row) for row in self.rows]
+
+
+# nodes using these implementations have a final texture equal to `.texture` colorized by `._get_final_color()`
+_PLAIN_FINAL_TEXTURES = (Texture._get_final_texture, Color._get_final_texture)
+
 
 @functools.cache
 def _load_texture(file_path: str, /, *, fill: bool = True, filler: str = " ", fliph: bool = False, flipv: bool = False, transparent: str = " ", default: str = " ") -> list[list[str]]:
@@ -163,7 +401,12 @@ def _load_texture(file_path: str, /, *, fill: bool = True, filler: str = " ", fl
     return texture
 
 
-def load_texture(file_path: str, /, *, fill: bool = True, filler: str = " ", fliph: bool = False, flipv: bool = False, transparent: str = " ", default: str = " ") -> list[list[str]]:
+@functools.cache
+def _load_compiled_texture(file_path: str, /, *, fill: bool = True, filler: str = " ", fliph: bool = False, flipv: bool = False, transparent: str = " ", default: str = " ") -> CompiledTexture:
+    return CompiledTexture(_load_texture(file_path, fill=fill, filler=filler, fliph=fliph, flipv=flipv, transparent=transparent, default=default))
+
+
+def load_texture(file_path: str, /, *, fill: bool = True, filler: str = " ", fliph: bool = False, flipv: bool = False, transparent: str = " ", default: str = " ", compiled: bool = False) -> list[list[str]] | CompiledTexture:
     """Loads a texture from either disk or cache. File has to use `UTF-8 encoding`, and should be a `.txt` file
 
     Args:
@@ -174,9 +417,12 @@ def load_texture(file_path: str, /, *, fill: bool = True, filler: str = " ", fli
         flipv (bool, optional): whether to flip texture vertically. Defaults to False.
         transparent (str, optional): transparancy material. Defaults to " ".
         default (str, optional): replacement material for transparant cells. Defaults to " ".
+        compiled (bool, optional): whether to return an immutable `CompiledTexture`, which is faster to draw. Defaults to False.
 
     Returns:
-        list[list[str]]: texture loaded (a nested list)
+        list[list[str]] | CompiledTexture: texture loaded (a nested list, or compiled)
     """
     # TODO: remove ".." and such before truly loading
+    if compiled:
+        return _load_compiled_texture(file_path, fill=fill, filler=filler, fliph=fliph, flipv=flipv, transparent=transparent, default=default)
     return _load_texture(file_path, fill=fill, filler=filler, fliph=fliph, flipv=flipv, transparent=transparent, default=default)
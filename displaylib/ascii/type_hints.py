@@ -1,13 +1,14 @@
 from __future__ import annotations as _annotations
 
-from typing import TYPE_CHECKING, TypeVar, Protocol
+from typing import TYPE_CHECKING, TypeVar, Protocol, Sequence
 
 from ..template.type_hints import NodeMixin, Transform2DMixin
 
 if TYPE_CHECKING:
     from ..math import Vec2, Vec2i
     from .engine import AsciiEngine
-    from .color import ColorValue
+    from .color import ColorValue, ColorId
+    from .texture import CompiledTexture
 
 TextureSelf = TypeVar("TextureSelf", bound="TextureMixin")
 AsciiCameraSelf = TypeVar("AsciiCameraSelf", bound="AsciiCameraProtocol")
@@ -23,9 +24,9 @@ class TextureMixin(Protocol):
     @root.setter
     def root(self, value: AsciiEngine) -> None: ...
     @property
-    def texture(self) -> list[list[str]]: ...
+    def texture(self) -> list[list[str]] | CompiledTexture: ...
     @texture.setter
-    def texture(self, value: list[list[str]]) -> None: ...
+    def texture(self, value: list[list[str]] | CompiledTexture) -> None: ...
     @property
     def offset(self) -> Vec2: ...
     @offset.setter
@@ -39,21 +40,34 @@ class TextureMixin(Protocol):
     @z_index.setter
     def z_index(self, value: int) -> None: ...
     @property
+    def static(self) -> bool: ...
+    @static.setter
+    def static(self, value: bool) -> None: ...
+    @property
     def _z_index(self) -> int: ...
     @_z_index.setter
     def _z_index(self, value: int) -> None: ...
+    @property
+    def _render_version(self) -> int: ...
+    @_render_version.setter
+    def _render_version(self, value: int) -> None: ...
     def make_unique(self) -> None: ...
     def as_unique(self: TextureSelf) -> TextureSelf: ...
     def size(self) -> Vec2i: ...
+    def is_globally_static(self) -> bool: ...
+    def invalidate_texture(self) -> None: ...
+    def _get_texture_size(self) -> tuple[int, int]: ...
+    def _get_texture_key(self) -> tuple[Sequence[str], ...]: ...
     def _get_final_texture(self) -> list[list[str]]: ...
+    def _get_final_color(self) -> ColorValue | None: ...
     def _get_texture_global_position(self) -> Vec2: ...
 
 class ColorMixin(Protocol):
     def __new__(cls, *args, **kwargs) -> ValidColorNode: ...
     @property
-    def color(self) -> ColorValue: ...
+    def color(self) -> ColorValue | ColorId: ...
     @color.setter
-    def color(self, value: ColorValue) -> None: ...
+    def color(self, value: ColorValue | ColorId) -> None: ...
 
 class ValidTextureNode(TextureMixin, Transform2DMixin, NodeMixin, Protocol): ...
 
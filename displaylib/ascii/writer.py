@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .screen import AsciiScreen
+    from .framebuffer import Framebuffer
+
+
+class FrameWriter:
+    """`FrameWriter` for writing the frames of an `AsciiScreen` to the terminal from a background thread
+
+    Only the newest frame is kept waiting to be written.
+    If a new frame is submitted before the waiting one was picked up, the waiting frame is dropped
+    """
+    frames_submitted: int # frames handed over by `AsciiScreen.show`
+    frames_written: int # frames that were encoded and written
+    frames_dropped: int # frames replaced before being written
+
+    def __init__(self, screen: AsciiScreen) -> None:
+        """Initializes the writer for the given screen. The thread is started on the first submitted frame
+
+        Args:
+            screen (AsciiScreen): screen whose frames are written
+        """
+        self.screen = screen
+        self.frames_submitted = 0
+        self.frames_written = 0
+        self.frames_dropped = 0
+        self._pending: Framebuffer | None = None # single slot mailbox
+        self._pending_clear = False
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._is_running = False
+        self._error: BaseException | None = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None
+
+    def start(self) -> None:
+        """Starts the writer thread, if not already running
+        """
+        if self._thread is not None:
+            return
+        self._is_running = True
+        self._thread = threading.Thread(target=self._run, name="FrameWriter", daemon=True)
+        self._thread.start()
+
+    def submit(self, frame: Framebuffer, clear: bool = False) -> None:
+        """Hands a frame over to the writer thread, replacing the waiting frame if any
+
+        Args:
+            frame (Framebuffer): snapshot of the screen, owned by the writer from now on
+            clear (bool, optional): whether to clear the terminal before writing the frame. Defaults to False.
+
+        Raises:
+            BaseException: the writer thread failed while writing a previous frame
+        """
+        self._raise_error()
+        if self._thread is None:
+            self.start()
+        with self._condition:
+            if self._pending is not None: # writer fell behind
+                self.frames_dropped += 1
+            self._pending = frame
+            self._pending_clear = self._pending_clear or clear # kept, even if the frame requesting it is dropped
+            self.frames_submitted += 1
+            self._condition.notify()
+
+    def stop(self) -> None:
+        """Writes the waiting frame, if any, and stops the writer thread
+
+        Raises:
+            BaseException: the writer thread failed while writing a frame
+        """
+        thread = self._thread
+        if thread is not None:
+            with self._condition:
+                self._is_running = False
+                self._condition.notify()
+            thread.join()
+            self._thread = None
+        self._raise_error()
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            error = self._error
+            self._error = None
+            raise error
+
+    def _run(self) -> None:
+        """Writes frames as they arrive, until stopped
+        """
+        while True:
+            with self._condition:
+                while self._pending is None and self._is_running:
+                    self._condition.wait()
+                frame = self._pending
+                clear = self._pending_clear
+                self._pending = None
+                self._pending_clear = False
+            if frame is None: # stopped, with nothing left to write
+                return
+            try:
+                self.screen._write_frame(frame, clear)
+            except BaseException as error: # re-raised on the main thread
+                self._error = error
+                with self._condition:
+                    self._is_running = False
+                    self._pending = None
+                    self._thread = None # started again by the next submitted frame
+                return
+            self.frames_written += 1
@@ -16,7 +16,7 @@ class PygameEngine(Engine):
     """ # TODO: add hook for screen size changed
     bg_color = (255, 255, 255) # white
 
-    def __init__(self, window_name: str = "DisplayLib Window", tps: int = 60, width: int = 512, height: int = 256, icon_path: str | None = None, flags: int = DEFAULT) -> None:
+    def __init__(self, window_name: str = "DisplayLib Window", tps: int = 60, width: int = 512, height: int = 256, icon_path: str | None = None, flags: int = DEFAULT, frame_timing: bool = False, profile_nodes: bool = False) -> None:
         """Initializes and starts the engine (only 1 instance should exist)
 
         Args:
@@ -26,6 +26,8 @@ class PygameEngine(Engine):
             height (int, optional): screen height. Defaults to 256px.
             icon_path (str | None, optional): optional icon path for setting custom icon. Defaults to None.
             flags (int, optional): pygame flags. Defaults to DEFAULT.
+            frame_timing (bool, optional): measure the phases of each frame in `.frame_timer`. Defaults to False.
+            profile_nodes (bool, optional): measure `_update` of each node in `.node_profiler`, reported at exit. Defaults to False.
         """
         self._window_name = window_name
         pygame.display.set_caption(window_name)
@@ -42,6 +44,7 @@ class PygameEngine(Engine):
         
         self.is_running = True
         self._main_loop()
+        self._report_node_profile()
     
     @property
     def window_name(self) -> str:
@@ -99,36 +102,55 @@ class PygameEngine(Engine):
     def _main_loop(self) -> None:
         """Overriden main loop spesific for `displaylib.pygame` mode
         """
-        Node.nodes = {uid: node for uid, node in sorted(Node.nodes.items(), key=self.sort_function_for_process_priority)}
         clock = pygame.time.Clock()
         delta = 1.0 / self.tps # initial delta time (optimal)
         # update one time at the very start
         self.screen.fill(self.bg_color)
         pygame.display.flip()
+        timer = self.frame_timer # every phase is only marked when enabled
+        profiler = self.node_profiler
+        if timer is not None:
+            timer.begin_frame()
         while self.is_running:
             self.screen.fill(self.bg_color)
+            if timer is not None:
+                timer.mark("clear")
             
             for event in pygame.event.get():
                 self._input(event)
-                for node in Node.nodes.values():
+                for node in Node.get_process_order():
                     if isinstance(node, PygameNode2D):
                         node._input(event)
+            if timer is not None:
+                timer.mark("events")
             
             self._update(delta)
-            for node in tuple(Node.nodes.values()):
-                node._update(delta)
+            if timer is not None:
+                timer.mark("update")
+            if profiler is None:
+                for node in Node.get_process_order():
+                    node._update(delta)
+            else:
+                profiler.update_nodes(Node.get_process_order(), delta)
+            if timer is not None:
+                timer.mark("nodes")
 
-            if Node._request_process_priority_sort: # only sort once per frame if needed
-                Node._request_process_priority_sort = False
-                for uid in Node._queued_nodes:
-                    del Node.nodes[uid]
-                Node._queued_nodes.clear()
-                Node.nodes = {uid: node for uid, node in sorted(Node.nodes.items(), key=self.sort_function_for_process_priority)}
+            if Node._queued_nodes: # process order is kept up to date by `Node`, so only freed nodes are handled here
+                Node._free_queued_nodes()
+            if timer is not None:
+                timer.mark("sort")
             
-            for node in Node.nodes.values(): # render nodes onto the display
+            for node in Node.get_process_order(): # render nodes onto the display
                 if isinstance(node, PygameNode2D):
                     node._render(self.screen)
             self._render(self.screen) # engine render on top
+            if timer is not None:
+                timer.mark("render")
             
             pygame.display.flip()
+            if timer is not None:
+                timer.mark("show")
             delta = clock.tick(self.tps) / MILLISECOND # milliseconds -> seconds
+            if timer is not None:
+                timer.mark("sleep")
+                timer.end_frame()
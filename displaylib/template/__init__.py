@@ -20,6 +20,8 @@ __all__ = [
     "Node",             # (class)
     "Node2D",           # (class)
     "Engine",           # (class)
+    "FrameTimer",       # (class)
+    "NodeProfiler",     # (class)
     # mixin components
     "Transform2D",      # (component)
     # networking
@@ -38,6 +40,8 @@ from .node import Node as BaseNode
 from .node import Node
 from .node2d import Node2D
 from .engine import Engine
+from .timing import FrameTimer
+from .profiling import NodeProfiler
 # mixin components
 from .transform import Transform2D
 # networking
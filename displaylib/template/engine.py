@@ -2,8 +2,11 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, cast
 import atexit
+import sys
 
 from .node import Node
+from .timing import FrameTimer
+from .profiling import NodeProfiler
 from .type_hints import MroNext, EngineType
 
 if TYPE_CHECKING:
@@ -40,13 +43,17 @@ class Engine(metaclass=EngineMixinSortMeta):
     tps: int
     is_running: bool
     per_frame_tasks: list[Callable[..., Any]]
+    frame_timer: FrameTimer | None # measures the phases of each frame, when enabled
+    node_profiler: NodeProfiler | None # measures `_update` of each node, when enabled
 
-    def __new__(cls: type[EngineType], *, tps: int = 16, **_overflow) -> EngineType:
+    def __new__(cls: type[EngineType], *, tps: int = 16, frame_timing: bool = False, profile_nodes: bool = False, **_overflow) -> EngineType:
         """Sets `Node.root` when an `Engine instance` is initialized 
 
         Args:
             cls (type[EngineType]): engine object to be `.root`.
             tps (int, optional): ticks per second. Defaults to 16.
+            frame_timing (bool, optional): whether to measure the phases of each frame in `.frame_timer`. Defaults to False.
+            profile_nodes (bool, optional): whether to measure `_update` of each node in `.node_profiler`. Defaults to False.
 
         Returns:
             EngineType: the engine to be used in the program
@@ -57,6 +64,9 @@ class Engine(metaclass=EngineMixinSortMeta):
         instance.tps = tps
         instance.is_running = False
         instance.per_frame_tasks = []
+        instance.frame_timer = FrameTimer() if frame_timing else None
+        instance.node_profiler = NodeProfiler() if profile_nodes else None
+        NodeProfiler.current = instance.node_profiler
         return cast(EngineType, instance)
 
     def __init__(self, tps: int = 16, **_overflow) -> None:
@@ -70,6 +80,7 @@ class Engine(metaclass=EngineMixinSortMeta):
         self.is_running = True
         self._main_loop()
         self._on_exit()
+        self._report_node_profile()
 
     def _on_start(self) -> None:
         """Called after the engine has been created
@@ -93,27 +104,52 @@ class Engine(metaclass=EngineMixinSortMeta):
         """
         ...
     
+    def _report_node_profile(self) -> None:
+        """Prints the report of `.node_profiler` to stderr, if enabled and `NodeProfiler.report_at_exit` is set
+        """
+        if self.node_profiler is not None and self.node_profiler.report_at_exit:
+            print(self.node_profiler.report(), file=sys.stderr)
+    
     @staticmethod
     def sort_function_for_process_priority(elements: tuple[str, AnyNode]) -> int:
+        """Deprecated: nodes are no longer sorted by the engine. Use `Node.get_process_order()` instead
+
+        Args:
+            elements (tuple[str, AnyNode]): uid and node, as an item of `Node.nodes`
+
+        Returns:
+            int: process priority of the node
+        """
         return elements[1].process_priority
     
     def _main_loop(self) -> None:
         """Base implementation for `displaylib.template` mode
         """
-        Node.nodes = {uid: node for uid, node in sorted(Node.nodes.items(), key=self.sort_function_for_process_priority)}
+        timer = self.frame_timer
+        profiler = self.node_profiler
+        if timer is not None:
+            timer.begin_frame()
         while self.is_running:
             for task in self.per_frame_tasks:
                 task() # type: ignore
+            if timer is not None:
+                timer.mark("tasks")
 
             # TODO: add clock with delta, but no sleep
             delta = 1.0 / self.tps # static delta
             self._update(delta)
-            for node in tuple(Node.nodes.values()):
-                node._update(delta)
-
-            if Node._request_process_priority_sort: # only sort once per frame if needed
-                Node._request_process_priority_sort = False
-                for uid in Node._queued_nodes: # list should not contain duplicants
-                    del Node.nodes[uid]
-                Node._queued_nodes.clear()
-                Node.nodes = {uid: node for uid, node in sorted(Node.nodes.items(), key=self.sort_function_for_process_priority)}
+            if timer is not None:
+                timer.mark("update")
+            if profiler is None:
+                for node in Node.get_process_order():
+                    node._update(delta)
+            else:
+                profiler.update_nodes(Node.get_process_order(), delta)
+            if timer is not None:
+                timer.mark("nodes")
+
+            if Node._queued_nodes: # process order is kept up to date by `Node`, so only freed nodes are handled here
+                Node._free_queued_nodes()
+            if timer is not None:
+                timer.mark("sort")
+                timer.end_frame()
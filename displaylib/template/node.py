@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import bisect
+import itertools
 from typing import TYPE_CHECKING, ClassVar, cast
 
 from .type_hints import MroNext, NodeType, AnyNode, Self
@@ -25,28 +27,34 @@ class Node(metaclass=NodeMixinSortMeta):
     """`Node` base class
 
     Automatically keeps track of alive Node(s) by reference.
-    An Engine subclass may access it's nodes through the `.nodes` class attribute
+    An Engine subclass may access it's nodes through the `.nodes` class attribute,
+    and the order they are processed in through `Node.get_process_order()`
 
     Hooks:
         - `_update(self, delta: float) -> None`
     """
-    nodes: ClassVar[dict[str, AnyNode]] = {} # all nodes that are alive
+    nodes: ClassVar[dict[str, AnyNode]] = {} # all nodes that are alive, in the order they were created
     _uid_counter: ClassVar[int] = 0 # is read and increments for each generated uid
-    _request_process_priority_sort: ClassVar[bool] = False # requests Engine to sort
+    _process_buckets: ClassVar[dict[int, dict[str, AnyNode]]] = {} # process priority -> nodes with that priority, in the order they were created
+    _process_priorities: ClassVar[list[int]] = [] # keys of `._process_buckets`, kept sorted
+    _process_order: ClassVar[tuple[AnyNode, ...] | None] = None # cached result of `.get_process_order()`, None when outdated
+    _creation_counter: ClassVar[itertools.count[int]] = itertools.count() # orders nodes within a process priority
     _queued_nodes: ClassVar[set[str]] = set() # uses <Node>.queue_free() to ask Engine to delete a node based on UID
+    _request_process_priority_sort: ClassVar[bool] = False # deprecated: ignored, as the process order is kept up to date by `Node`
     default_process_priority: ClassVar[int]
     root: Engine # set from a Engine subclass
     uid: str
     parent: AnyNode | None = None
+    _creation_index: int
 
     def __new__(cls: type[NodeType], *parent_as_positional: AnyNode | None, parent: AnyNode | None = None, force_sort: bool = True, **_overflow) -> NodeType:
         """Assigns the node a `unique ID`, stores its `reference` to keep it from being garbage collected and
-        may request the engine to `sort` nodes based on '.process_priority'
+        places it in the process order based on '.process_priority'
 
         Args:
             cls (type[NodeType]): original class that will be created
             parent_as_positional/parent (AnyNode | None, optional): parent of the node. Defaults to None.
-            force_sort (bool, optional): whether to request the engine to sort nodes based on '.process_priority'. Defaults to True.
+            force_sort (bool, optional): unused, as nodes are always placed in the process order right away. Defaults to True.
 
         Raises:
             ValueError: passed more than 1 positional argument, meant to be 'parent' argument
@@ -64,6 +72,7 @@ class Node(metaclass=NodeMixinSortMeta):
         instance = mro_next.__new__(cls)
         uid = cast(Node, cls).generate_uid()
         instance.uid = uid
+        instance._creation_index = next(Node._creation_counter)
         # positional -> keyword/default
         parent_ref = parent_as_positional[0] if parent_as_positional and isinstance(parent_as_positional[0], Node) else parent
         instance.parent = parent_ref
@@ -74,8 +83,7 @@ class Node(metaclass=NodeMixinSortMeta):
         else:
             instance._process_priority = 0
         Node.nodes[uid] = instance # store reference
-        if force_sort: # if True, requests sort every frame a new node is created
-            Node._request_process_priority_sort = True # otherwise, depend on a `process_priority` change
+        Node._insert_process_order(instance)
         return cast(NodeType, instance)
 
     @classmethod
@@ -89,6 +97,68 @@ class Node(metaclass=NodeMixinSortMeta):
         Node._uid_counter += 1
         return str(uid)
 
+    @staticmethod
+    def get_process_order() -> tuple[AnyNode, ...]:
+        """Returns the alive nodes in the order they are processed by the engine,
+        by `.process_priority` and then by the order they were created
+
+        The result is cached until a node is created, freed or changes `.process_priority`
+
+        Returns:
+            tuple[AnyNode, ...]: nodes in process order
+        """
+        order = Node._process_order
+        if order is None:
+            buckets = Node._process_buckets
+            order = tuple(itertools.chain.from_iterable(buckets[priority].values() for priority in Node._process_priorities))
+            Node._process_order = order
+        return order
+
+    @staticmethod
+    def _insert_process_order(node: AnyNode) -> None:
+        """Adds a node to the bucket of its `.process_priority`, keeping the bucket in creation order
+        """
+        priority = node._process_priority
+        bucket = Node._process_buckets.get(priority)
+        if bucket is None: # first node with this priority
+            bucket = Node._process_buckets[priority] = {}
+            bisect.insort(Node._process_priorities, priority)
+        if bucket and next(reversed(bucket.values()))._creation_index > node._creation_index: # older than the newest, after a priority change
+            nodes = list(bucket.values())
+            nodes.insert(bisect.bisect(nodes, node._creation_index, key=_get_creation_index), node)
+            Node._process_buckets[priority] = {bucket_node.uid: bucket_node for bucket_node in nodes}
+        else: # new nodes are the newest
+            bucket[node.uid] = node
+        Node._process_order = None
+
+    @staticmethod
+    def _remove_process_order(node: AnyNode) -> bool:
+        """Removes a node from the bucket of its `.process_priority`
+
+        Returns:
+            bool: whether the node was in the process order
+        """
+        priority = node._process_priority
+        bucket = Node._process_buckets.get(priority)
+        if bucket is None or bucket.pop(node.uid, None) is None:
+            return False
+        if not bucket: # last node with this priority
+            del Node._process_buckets[priority]
+            priorities = Node._process_priorities
+            del priorities[bisect.bisect_left(priorities, priority)]
+        Node._process_order = None
+        return True
+
+    @staticmethod
+    def _free_queued_nodes() -> None:
+        """Deletes the nodes queued by `.queue_free()`. Called by the engine after every node has been updated
+        """
+        for uid in Node._queued_nodes:
+            node = Node.nodes.pop(uid, None)
+            if node is not None:
+                Node._remove_process_order(node)
+        Node._queued_nodes.clear()
+
     def __init__(self, parent: AnyNode | None = None, *, force_sort: bool = True) -> None:
         """Initializes the base node
 
@@ -128,9 +198,11 @@ class Node(metaclass=NodeMixinSortMeta):
 
     @process_priority.setter
     def process_priority(self, value: int) -> None:
-        if self._process_priority != value: # if changed
+        if self._process_priority != value: # if changed, move to the other bucket
+            is_alive = Node._remove_process_order(self)
             self._process_priority = value
-            Node._request_process_priority_sort = True
+            if is_alive:
+                Node._insert_process_order(self)
 
     def where(self: Self, **attributes: ...) -> Self:
         """Sets/overrides the given attributes of the node instance
@@ -165,6 +237,8 @@ class Node(metaclass=NodeMixinSortMeta):
         every node has been called `_update` on
         """
         if self.uid in Node.nodes:
-            Node._request_process_priority_sort = True
-            if self.uid not in Node._queued_nodes:
-                Node._queued_nodes.add(self.uid)
+            Node._queued_nodes.add(self.uid)
+
+
+def _get_creation_index(node: AnyNode) -> int:
+    return node._creation_index
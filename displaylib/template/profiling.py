@@ -0,0 +1,128 @@
+from __future__ import annotations as _annotations
+
+import time as _time
+from typing import TYPE_CHECKING as _TYPE_CHECKING, ClassVar as _ClassVar, Iterable as _Iterable, Literal as _Literal, NamedTuple as _NamedTuple
+
+if _TYPE_CHECKING:
+    from .type_hints import NodeMixin as _NodeMixin
+
+
+class NodeTiming(_NamedTuple):
+    """Accumulated time spent in `_update` of a node class or a single node, in seconds
+    """
+    name: str # class name, or uid followed by the class name
+    calls: int
+    total: float
+    mean: float
+    max: float
+
+
+class NodeProfiler:
+    """`NodeProfiler` that measures how long `_update` of each node takes, grouped by node class and by uid
+
+    Time reported by update wrappers, like the animation step of `AnimationPlayer`,
+    is subtracted from the node and counted under its own name, `"<class name>.<wrapper name>"`
+    """
+    current: _ClassVar[NodeProfiler | None] = None # profiler of the running engine, used by update wrappers
+    report_at_exit: bool = True # whether the engine prints `.report()` when exiting
+
+    def __init__(self) -> None:
+        """Initializes an empty profiler
+        """
+        self._by_class: dict[str, list[float]] = {} # name -> [calls, total, max]
+        self._by_uid: dict[str, list[float]] = {}
+        self._class_names: dict[str, str] = {} # uid -> class name
+        self._wrapped = 0.0 # wrapper time reported during the current `_update` call
+
+    def update_nodes(self, nodes: _Iterable[_NodeMixin], delta: float) -> None:
+        """Calls `_update` of every node, measuring each call. Used by the engine instead of calling them directly
+
+        Args:
+            nodes (Iterable[NodeMixin]): nodes to update, in order
+            delta (float): delta time passed to the nodes
+        """
+        perf_counter = _time.perf_counter
+        for node in nodes:
+            self._wrapped = 0.0
+            start = perf_counter()
+            node._update(delta)
+            elapsed = perf_counter() - start - self._wrapped
+            name = type(node).__qualname__
+            _add(self._by_class, name, elapsed)
+            _add(self._by_uid, node.uid, elapsed)
+            self._class_names[node.uid] = name
+
+    def record_wrapper(self, node: _NodeMixin, name: str, seconds: float) -> None:
+        """Counts time spent by an update wrapper separately from the node being updated
+
+        Args:
+            node (NodeMixin): node whose `_update` is wrapped
+            name (str): name of the wrapper
+            seconds (float): time spent in the wrapper itself, excluding the wrapped `_update`
+        """
+        self._wrapped += seconds
+        _add(self._by_class, f"{type(node).__qualname__}.{name}", seconds)
+
+    def get_top(self, n: int = 10, *, by: _Literal["class", "uid"] = "class") -> list[NodeTiming]:
+        """Returns the entries where the most time was spent
+
+        Args:
+            n (int, optional): maximum amount of entries. Defaults to 10.
+            by (Literal["class", "uid"], optional): whether to group by node class or by single node. Defaults to "class".
+
+        Raises:
+            ValueError: `by` is neither "class" nor "uid"
+
+        Returns:
+            list[NodeTiming]: entries sorted by total time, highest first
+        """
+        if by == "class":
+            names = {name: name for name in self._by_class}
+            stats = self._by_class
+        elif by == "uid":
+            names = {uid: f"{uid} ({self._class_names[uid]})" for uid in self._by_uid}
+            stats = self._by_uid
+        else:
+            raise ValueError(f"argument 'by' has to be either 'class' or 'uid', not {by!r}")
+        top = sorted(stats.items(), key=lambda item: item[1][1], reverse=True)[:n]
+        return [NodeTiming(names[key], int(calls), total, total / calls, maximum) for key, (calls, total, maximum) in top]
+
+    def reset(self) -> None:
+        """Forgets every measurement
+        """
+        self._by_class.clear()
+        self._by_uid.clear()
+        self._class_names.clear()
+
+    def report(self, n: int = 10) -> str:
+        """Formats the top entries, both by class and by uid, as tables in milliseconds
+
+        Args:
+            n (int, optional): maximum amount of rows per table. Defaults to 10.
+
+        Returns:
+            str: two tables, separated by an empty line
+        """
+        tables: list[str] = []
+        for by in ("class", "uid"):
+            timings = self.get_top(n, by=by)
+            width = max([len(by)] + [len(timing.name) for timing in timings]) + 2
+            lines = [f"{by:<{width}}{'calls':>9}{'total':>11}{'mean':>9}{'max':>9}"]
+            for timing in timings:
+                lines.append(f"{timing.name:<{width}}{timing.calls:>9}{timing.total * 1000:>11.3f}"
+                             f"{timing.mean * 1000:>9.3f}{timing.max * 1000:>9.3f}")
+            tables.append("\n".join(lines))
+        return "\n\n".join(tables)
+
+
+def _add(stats: dict[str, list[float]], key: str, seconds: float) -> None:
+    """Adds a measurement to the [calls, total, max] entry of a key
+    """
+    entry = stats.get(key)
+    if entry is None:
+        stats[key] = [1, seconds, seconds]
+        return
+    entry[0] += 1
+    entry[1] += seconds
+    if seconds > entry[2]:
+        entry[2] = seconds
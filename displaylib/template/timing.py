@@ -0,0 +1,151 @@
+from __future__ import annotations as _annotations
+
+import math as _math
+import time as _time
+from array import array as _array
+from typing import NamedTuple as _NamedTuple
+
+
+class PhaseTiming(_NamedTuple):
+    """Statistics of a phase over the recent frames, in seconds
+    """
+    p50: float
+    p95: float
+    p99: float
+    mean: float
+    max: float
+
+
+class FrameTimer:
+    """`FrameTimer` that measures how long each phase of a frame takes, for a ring buffer of recent frames
+
+    A phase lasts from the previous mark, or from the start of the frame, until it is marked.
+    Phases are created the first time they are marked
+    """
+    TOTAL: str = "total" # name of the pseudo phase covering the whole frame
+
+    def __init__(self, capacity: int = 240) -> None:
+        """Initializes the timer, with room for the given amount of frames
+
+        Args:
+            capacity (int, optional): amount of recent frames kept. Defaults to 240.
+        """
+        self.capacity = capacity
+        self.frame_count = 0 # frames measured in total, including those overwritten
+        self._samples: dict[str, _array[float]] = {FrameTimer.TOTAL: _array("d", [0.0]) * capacity}
+        self._frame: dict[str, float] = {} # phases of the current frame
+        self._frame_start = _time.perf_counter()
+        self._last_mark = self._frame_start
+
+    @property
+    def phases(self) -> list[str]:
+        """Returns the names of the phases measured so far, in the order they were first marked
+
+        Returns:
+            list[str]: phase names, without `FrameTimer.TOTAL`
+        """
+        return [phase for phase in self._samples if phase != FrameTimer.TOTAL]
+
+    def begin_frame(self) -> None:
+        """Starts measuring a frame. Only needed before the first frame, as `.end_frame()` starts the next
+        """
+        self._frame.clear()
+        self._frame_start = _time.perf_counter()
+        self._last_mark = self._frame_start
+
+    def mark(self, phase: str) -> None:
+        """Ends a phase, adding the time since the previous mark to it
+
+        Args:
+            phase (str): name of the phase
+        """
+        now = _time.perf_counter()
+        self._frame[phase] = self._frame.get(phase, 0.0) + (now - self._last_mark)
+        self._last_mark = now
+
+    def end_frame(self) -> None:
+        """Stores the phases of the current frame in the ring buffer, and starts measuring the next frame
+        """
+        now = _time.perf_counter()
+        index = self.frame_count % self.capacity
+        frame = self._frame
+        for phase in frame:
+            if phase not in self._samples: # first time marked
+                self._samples[phase] = _array("d", [0.0]) * self.capacity
+        for phase, samples in self._samples.items():
+            samples[index] = frame.get(phase, 0.0)
+        self._samples[FrameTimer.TOTAL][index] = now - self._frame_start
+        self.frame_count += 1
+        frame.clear()
+        self._frame_start = now
+        self._last_mark = now
+
+    def get_samples(self, phase: str) -> list[float]:
+        """Returns the durations of a phase in the recent frames, oldest first
+
+        Args:
+            phase (str): name of the phase, or `FrameTimer.TOTAL`
+
+        Raises:
+            KeyError: phase was never marked
+
+        Returns:
+            list[float]: durations in seconds
+        """
+        samples = self._samples[phase]
+        if self.frame_count < self.capacity:
+            return samples[:self.frame_count].tolist()
+        index = self.frame_count % self.capacity
+        return samples[index:].tolist() + samples[:index].tolist()
+
+    def get_percentile(self, phase: str, percentile: float) -> float:
+        """Returns a percentile of a phase over the recent frames, using the nearest rank
+
+        Args:
+            phase (str): name of the phase, or `FrameTimer.TOTAL`
+            percentile (float): percentile between 0 and 100
+
+        Raises:
+            KeyError: phase was never marked
+
+        Returns:
+            float: duration in seconds, or 0.0 if no frame was measured
+        """
+        samples = sorted(self.get_samples(phase))
+        if not samples:
+            return 0.0
+        return _nearest_rank(samples, percentile)
+
+    def get_timings(self) -> dict[str, PhaseTiming]:
+        """Returns statistics of every phase over the recent frames
+
+        Returns:
+            dict[str, PhaseTiming]: statistics by phase, where `FrameTimer.TOTAL` is the last entry
+        """
+        timings: dict[str, PhaseTiming] = {}
+        for phase in self.phases + [FrameTimer.TOTAL]:
+            samples = sorted(self.get_samples(phase))
+            if not samples:
+                timings[phase] = PhaseTiming(0.0, 0.0, 0.0, 0.0, 0.0)
+                continue
+            timings[phase] = PhaseTiming(_nearest_rank(samples, 50), _nearest_rank(samples, 95), _nearest_rank(samples, 99),
+                                         sum(samples) / len(samples), samples[-1])
+        return timings
+
+    def report(self) -> str:
+        """Formats the statistics of every phase as a table, in milliseconds
+
+        Returns:
+            str: table with a row per phase
+        """
+        lines = [f"{'phase':<12}{'p50':>9}{'p95':>9}{'p99':>9}{'mean':>9}{'max':>9}"]
+        for phase, timing in self.get_timings().items():
+            lines.append(f"{phase:<12}" + "".join(f"{value * 1000:>9.3f}" for value in timing))
+        return "\n".join(lines)
+
+
+def _nearest_rank(samples: list[float], percentile: float) -> float:
+    """Picks a percentile from sorted samples, using the nearest rank
+    """
+    rank = max(1, _math.ceil(percentile / 100 * len(samples)))
+    return samples[min(rank, len(samples)) - 1]
@@ -65,6 +65,10 @@ class AnyNode(Protocol):
     def _process_priority(self) -> int: ...
     @_process_priority.setter
     def _process_priority(self, value: int) -> None: ...
+    @property
+    def _creation_index(self) -> int: ...
+    @_creation_index.setter
+    def _creation_index(self, value: int) -> None: ...
     def where(self: Self, **attributes) -> Self: ...
     def _update(self, delta: float) -> None: ...
     def queue_free(self) -> None: ...
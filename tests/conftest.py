@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import pytest
+
+from displaylib.template import Node
+from displaylib.template.profiling import NodeProfiler
+from displaylib.ascii.node import Ascii
+from displaylib.ascii.texture import Texture
+from displaylib.ascii.camera import AsciiCamera
+from displaylib.ascii.prototypes.texture_collider import TextCollider
+
+
+@pytest.fixture(autouse=True)
+def reset_globals():
+    """Forgets nodes and registries kept as class attributes, since every test builds its own scene
+    """
+    Node.nodes = {}
+    Node._process_buckets = {}
+    Node._process_priorities = []
+    Node._process_order = None
+    Node._queued_nodes = set()
+    Texture._instances = []
+    Texture._request_z_index_sort = False
+    Texture._spatial_index = None
+    Texture._set_render_tracking(False)
+    Ascii._resize_listeners = {}
+    TextCollider._colliders = []
+    NodeProfiler.current = None
+    if "current" in vars(AsciiCamera): # engines only create the default camera when missing
+        del AsciiCamera.current
+    yield
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import pytest
+
+from displaylib.ascii import color
+from displaylib.ascii.color import get_color, intern_color, quantize_color
+from displaylib.ascii.framebuffer import Framebuffer, encode_attribute
+from displaylib.ascii.screen import AsciiScreen
+
+
+def quantize(value: str, depth: int) -> str:
+    return get_color(quantize_color(intern_color(value), depth))
+
+
+@pytest.mark.parametrize("rgb, index", [
+    ((0, 0, 0), 16), # cube corners
+    ((255, 0, 0), 196),
+    ((0, 255, 0), 46),
+    ((0, 0, 255), 21),
+    ((255, 255, 255), 231),
+    ((95, 135, 175), 67), # exact cube levels
+    ((100, 140, 170), 67), # nearest cube levels
+    ((18, 18, 18), 233), # grays
+    ((128, 128, 128), 244),
+    ((238, 238, 238), 255),
+])
+def test_256_colors(rgb: tuple[int, int, int], index: int) -> None:
+    assert quantize(color.rgb_color(*rgb), 8) == f"\x1b[38;5;{index}m"
+
+
+@pytest.mark.parametrize("value, code", [
+    (color.rgb_color(0, 0, 0), 30), # basic colors
+    (color.rgb_color(205, 0, 0), 31),
+    (color.rgb_color(0, 205, 0), 32),
+    (color.rgb_color(229, 229, 229), 37),
+    (color.rgb_color(127, 127, 127), 90), # bright colors
+    (color.rgb_color(255, 0, 0), 91),
+    (color.rgb_color(255, 255, 255), 97),
+    (color.rgb_color(250, 10, 5), 91), # nearest
+    ("\x1b[38;5;196m", 91), # from the 256 color palette
+    ("\x1b[38;5;4m", 34),
+    ("\x1b[38;5;244m", 90),
+])
+def test_16_colors(value: str, code: int) -> None:
+    assert quantize(value, 4) == f"\x1b[{code}m"
+
+
+def test_backgrounds_and_styles_are_kept() -> None:
+    value = "\x1b[38;2;255;0;0m\x1b[48;2;0;0;238m\x1b[1m"
+    assert quantize(value, 8) == "\x1b[38;5;196m\x1b[48;5;21m\x1b[1m" # 238 is nearest to the cube level 255
+    assert quantize(value, 4) == "\x1b[91m\x1b[44m\x1b[1m"
+    assert quantize("\x1b[38;5;196m", 8) == "\x1b[38;5;196m" # already 256 colors
+    assert quantize("\x1b[1m", 4) == "\x1b[1m" # no color
+
+
+def test_quantize_color_depths() -> None:
+    red = intern_color(color.RED)
+    assert quantize_color(red, 24) == red
+    assert quantize_color(0, 4) == 0
+    assert quantize_color(red, 8) == quantize_color(red, 8) # cached
+    with pytest.raises(ValueError):
+        quantize_color(red, 6)
+
+
+@pytest.mark.parametrize("depth, sequence", [(24, color.RED), (8, "\x1b[38;5;196m"), (4, "\x1b[91m")])
+def test_each_depth_writes_its_sequences(depth: int, sequence: str) -> None:
+    framebuffer = Framebuffer(4, 1)
+    framebuffer.blit([[*"ab"]], 1, 0, color=encode_attribute(color.RED))
+    assert framebuffer.get_lines(styled=True, color_depth=depth) == [" " + sequence + "ab" + color.RESET + " "]
+    screen = AsciiScreen(4, 1)
+    screen.color_depth = depth
+    assert sequence + "ab" in screen._get_full_output(framebuffer)
+
+
+@pytest.mark.parametrize("bg", [None, 4])
+def test_color_ignores_background_without_a_style(bg: int | None) -> None:
+    assert color.color(196, bg) == "\x1b[38;5;196m"
+    assert color.color("196", bg) == "\x1b[38;5;196m"
+
+
+@pytest.mark.parametrize("flags, style", [
+    ({"bold": True}, "\x1b[1m"),
+    ({"underline": True}, "\x1b[4m"),
+    ({"reverse": True}, "\x1b[7m"),
+    ({"bold": True, "underline": True, "reverse": True}, "\x1b[1m\x1b[4m\x1b[7m"),
+])
+def test_color_applies_background_with_a_style(flags: dict[str, bool], style: str) -> None:
+    assert color.color(196, 4, **flags) == "\x1b[38;5;196m\x1b[48;5;4m" + style
+    assert color.color(196, **flags) == "\x1b[38;5;196m" + style
+
+
+def test_color_as_id() -> None:
+    color_id = color.color(196, 4, bold=True, as_id=True)
+    assert isinstance(color_id, int)
+    assert get_color(color_id) == color.color(196, 4, bold=True)
+    assert color.color(196, 4, bold=True, as_id=True) == color_id # interned once
+    assert get_color(color.color(196, 4, as_id=True)) == "\x1b[38;5;196m"
+
+
+def test_hex_color_applies_background() -> None:
+    assert color.hex_color("#f00", "0000ee") == "\x1b[38;2;255;0;0m\x1b[48;2;0;0;238m"
+    assert color.hex_color("ff0000", bold=True) == "\x1b[38;2;255;0;0m\x1b[1m"
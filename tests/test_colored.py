@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import math
+import types
+
+import pytest
+
+import displaylib.ascii as dl
+from displaylib.ascii import color
+from displaylib.ascii.screen import AsciiScreen
+from displaylib.template import Node
+
+
+@pytest.fixture(autouse=True)
+def screen(monkeypatch: pytest.MonkeyPatch) -> AsciiScreen:
+    screen = AsciiScreen(4, 2)
+    monkeypatch.setattr(Node, "root", types.SimpleNamespace(screen=screen), raising=False)
+    return screen
+
+
+def test_final_texture_colorizes_opaque_cells() -> None:
+    sprite = dl.Sprite(texture=[[*"a b"]], color=color.RED)
+    assert sprite._get_final_texture() == [[color.RED + "a" + color.RESET, " ", color.RED + "b" + color.RESET]]
+    assert sprite._get_final_color() == color.RED
+
+
+def test_final_texture_follows_in_place_changes() -> None:
+    sprite = dl.Sprite(texture=[[*"ab"]], color=color.intern_color(color.RED)) # color by palette id
+    sprite._get_final_texture()
+    sprite.texture[0][1] = "c" # without calling `.invalidate_texture()`
+    assert sprite._get_final_texture()[0][1] == color.RED + "c" + color.RESET
+
+
+def test_white_is_no_color() -> None:
+    sprite = dl.Sprite(texture=[[*"ab"]], color=color.WHITE)
+    assert sprite._get_final_texture() is sprite.texture
+    assert sprite._get_final_color() is None
+
+
+def test_rotated_colored_sprite_rotates_glyphs(screen: AsciiScreen) -> None:
+    dl.Camera().as_current()
+    sprite = dl.Sprite(x=1, y=1, texture=[[*"|-"]], color=color.RED)
+    sprite.rotation = math.pi / 2
+    screen.render([sprite])
+    assert screen.framebuffer.get_lines() == [" |  ", " -  "] # glyphs are rotated, since color is stored apart from them
+    assert screen.framebuffer.get_lines(styled=True) == [" " + color.RED + "|" + color.RESET + "  ",
+                                                         " " + color.RED + "-" + color.RESET + "  "]
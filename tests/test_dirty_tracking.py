@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from typing import Callable
+
+import pytest
+
+import displaylib.ascii as dl
+from displaylib.ascii.screen import AsciiScreen
+from displaylib.ascii.texture import Texture
+
+
+def render(screen: AsciiScreen) -> list[str]:
+    if not screen.dirty_tracking:
+        screen.clear()
+    screen.render(sorted(Texture._instances, key=lambda node: (node.z_index, node.process_priority)))
+    return screen.framebuffer.get_lines(styled=True)
+
+
+def assert_same_as_full_redraw(steps: list[Callable[[], None]]) -> None:
+    full = AsciiScreen(20, 8)
+    dirty = AsciiScreen(20, 8)
+    dirty.dirty_tracking = True
+    assert render(dirty) == render(full)
+    for step in steps:
+        step()
+        assert render(dirty) == render(full)
+
+
+@pytest.fixture(autouse=True)
+def camera() -> dl.Camera:
+    return dl.Camera().as_current()
+
+
+def test_moving_and_rotating_nodes() -> None:
+    sprite = dl.Sprite(x=2, y=1, texture=[[*"ab"], [*"cd"]])
+    spinner = dl.Sprite(x=10, y=4, texture=[[*"-=-"]], centered=True)
+    def move() -> None:
+        sprite.position.x += 1 # mutated in place
+    def rotate() -> None:
+        spinner.rotation += 0.7
+    assert_same_as_full_redraw([move, rotate, move, rotate, move])
+
+
+def test_texture_color_and_order_changes() -> None:
+    below = dl.Sprite(x=3, y=2, texture=[[*"####"]])
+    above = dl.Sprite(x=4, y=2, texture=[[*"oo"]], z_index=1)
+    def reassign_texture() -> None:
+        below.texture = [[*"$$$$$"], [*"$$$$$"]]
+    def mutate_texture() -> None:
+        below.texture[1][0] = "!"
+        below.invalidate_texture()
+    def recolor() -> None:
+        above.color = dl.color.RED
+    def swap_order() -> None:
+        above.z_index = -1
+    assert_same_as_full_redraw([reassign_texture, mutate_texture, recolor, swap_order])
+
+
+def test_hidden_and_freed_nodes() -> None:
+    parent = dl.Node2D(x=5, y=3)
+    dl.Sprite(parent, texture=[[*"child"]])
+    other = dl.Sprite(x=0, y=0, texture=[[*"other"]])
+    def hide_parent() -> None:
+        parent.visible = False
+    def show_parent() -> None:
+        parent.visible = True
+    def move_parent() -> None:
+        parent.position.y += 1
+    def free() -> None:
+        other.queue_free()
+    assert_same_as_full_redraw([hide_parent, show_parent, move_parent, free])
+
+
+def test_render_tracking_is_enabled_by_the_first_dirty_render() -> None:
+    sprite = dl.Sprite(texture=[["#"]])
+    sprite.texture = [["@"]]
+    assert "__setattr__" not in vars(Texture) # plain assignment while nothing reads versions
+    assert sprite._render_version == 0
+    screen = AsciiScreen(4, 2)
+    screen.dirty_tracking = True
+    render(screen)
+    sprite.texture = [["#"]]
+    assert sprite._render_version == 1
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import math
+
+import pytest
+
+import displaylib.ascii as dl
+from displaylib.ascii import CompiledTexture, text
+from displaylib.ascii.framebuffer import Framebuffer, _get_translation_table, encode_cell, rasterize_rotated
+from displaylib.ascii.screen import AsciiScreen
+
+TEXTURE = [
+    [*"ab c"],
+    [*"d ef"],
+    [*"ghi"],
+]
+
+
+def reference_blit(width: int, height: int, texture: list[list[str]], x: float, y: float,
+                   clip: tuple[int, int, int, int] | None = None) -> list[str]:
+    """Places each opaque cell at `int(x + column)` and `int(y + row)`, like the original per cell loop
+    """
+    left, top, right, bottom = (0, 0, width, height) if clip is None else clip
+    rows = [[" "] * width for _ in range(height)]
+    for h, line in enumerate(texture):
+        for w, char in enumerate(line):
+            x_position = int(x + w)
+            y_position = int(y + h)
+            if char != " " and right > x_position >= max(0, left) and bottom > y_position >= max(0, top):
+                rows[y_position][x_position] = char
+    return ["".join(row) for row in rows]
+
+
+
+def reference_blit_rotated(width: int, height: int, texture: list[list[str]], angle: float, x: float, y: float) -> list[str]:
+    """Places each opaque cell at `round(x) + round(offset)`, where the offset is rotated around the pivot at (x, y)
+    """
+    rows = [[" "] * width for _ in range(height)]
+    for h, line in enumerate(texture):
+        for w, char in enumerate(line):
+            x_position = round(x) + round(math.cos(-angle) * w - math.sin(-angle) * h)
+            y_position = round(y) + round(math.sin(-angle) * w + math.cos(-angle) * h)
+            if char != " " and width > x_position >= 0 and height > y_position >= 0:
+                rows[y_position][x_position] = text.rotate(char, angle)
+    return ["".join(row) for row in rows]
+
+
+@pytest.mark.parametrize("x", [-4.0, -2.5, -1.0, -0.5, -0.25, 0.0, 0.5, 3.25, 5.75, 8.0])
+@pytest.mark.parametrize("y", [-1.5, -0.5, 0.0, 1.5, 3.0])
+def test_blit_matches_per_cell_placement(x: float, y: float) -> None:
+    framebuffer = Framebuffer(7, 4)
+    framebuffer.blit(TEXTURE, x, y)
+    assert framebuffer.get_lines() == reference_blit(7, 4, TEXTURE, x, y)
+
+
+@pytest.mark.parametrize("x", [-2.5, -0.5, 0.0, 1.5, 5.0])
+def test_blit_compiled_texture_matches_plain(x: float) -> None:
+    plain = Framebuffer(7, 4)
+    plain.blit(TEXTURE, x, 1)
+    compiled = Framebuffer(7, 4)
+    compiled.blit(CompiledTexture(TEXTURE), x, 1)
+    assert compiled.get_lines() == plain.get_lines()
+
+
+@pytest.mark.parametrize("x", [-0.5, 0.0, 1.5])
+def test_blit_only_copies_inside_clip(x: float) -> None:
+    clip = (1, 1, 4, 3)
+    framebuffer = Framebuffer(7, 4)
+    framebuffer.blit(TEXTURE, x, 0.5, clip=clip)
+    assert framebuffer.get_lines() == reference_blit(7, 4, TEXTURE, x, 0.5, clip)
+
+
+def test_blit_keeps_cells_under_transparent_ones() -> None:
+    framebuffer = Framebuffer(4, 1, fill=".")
+    framebuffer.blit([[*"x y"]], 0, 0, transparent=" ")
+    assert framebuffer.get_lines() == ["x.y."]
+
+
+def test_blit_stores_color_per_cell() -> None:
+    framebuffer = Framebuffer(4, 1)
+    framebuffer.blit([[*"a b"]], 1, 0, color=3)
+    assert list(framebuffer.colors) == [0, 3, 0, 3]
+
+
+def test_texture_rows_are_cached_until_resize() -> None:
+    screen = AsciiScreen(6, 3)
+    rows = screen.texture
+    assert screen.texture[0] is rows[0]
+    assert screen.texture is not rows # a new list, holding the same views
+    screen.framebuffer.resize(4, 2)
+    resized = screen.texture
+    assert len(resized) == 2
+    assert len(resized[0]) == 4
+    assert resized[0] is not rows[0]
+
+
+def test_row_slices_read_and_write_cells() -> None:
+    screen = AsciiScreen(6, 2)
+    row = screen.texture[1]
+    row[1:4] = "abc"
+    assert row[:] == [" ", "a", "b", "c", " ", " "]
+    assert row[-3:] == ["c", " ", " "]
+    assert row[::2] == [" ", "b", " "]
+    assert screen.framebuffer.get_lines()[1] == " abc  "
+
+
+def test_row_slice_assignment_keeps_row_length() -> None:
+    row = AsciiScreen(6, 1).texture[0]
+    with pytest.raises(ValueError):
+        row[0:2] = ["x"]
+
+
+@pytest.mark.parametrize("bucket", [1, 90, 180, 300, 500])
+@pytest.mark.parametrize("x, y", [(3, 3), (3.4, 2.6), (3.5, 2.5), (0.25, 0.0), (6.75, 5.0), (-1.0, 2.0)])
+def test_blit_rotated_matches_per_cell_placement(bucket: int, x: float, y: float) -> None:
+    angle = bucket / 720 * math.tau
+    framebuffer = Framebuffer(7, 6)
+    framebuffer.blit_rotated(rasterize_rotated(TEXTURE, angle, 0, 0), x, y)
+    assert framebuffer.get_lines() == reference_blit_rotated(7, 6, TEXTURE, angle, x, y)
+
+
+def test_rotated_raster_offsets_are_reused_per_stride() -> None:
+    raster = rasterize_rotated(TEXTURE, 1.0, 1, 1)
+    assert all(isinstance(offset, int) for offset in raster.xs + raster.ys)
+    assert rasterize_rotated(TEXTURE, 1.0, 1, 1) is raster # cached by content
+    framebuffer = Framebuffer(7, 6)
+    framebuffer.blit_rotated(raster, 3, 3)
+    indices = raster.indices[framebuffer.stride]
+    framebuffer.blit_rotated(raster, 4, 2)
+    assert raster.indices[framebuffer.stride] is indices
+
+
+def test_texture_key_is_cached_until_texture_changes() -> None:
+    sprite = dl.Sprite(texture=[[*"ab"], [*"cd"]])
+    key = sprite._get_texture_key()
+    assert key == (("a", "b"), ("c", "d"))
+    assert sprite._get_texture_key() is key
+    sprite.texture[0][0] = "x"
+    sprite.invalidate_texture()
+    assert sprite._get_texture_key() == (("x", "b"), ("c", "d"))
+    sprite.texture = [[*"yz"]]
+    assert sprite._get_texture_key() == (("y", "z"),)
+
+
+def test_rotated_sprite_shows_texture_changes() -> None:
+    dl.Camera().as_current()
+    screen = AsciiScreen(8, 6)
+    sprite = dl.Sprite(x=3, y=2, texture=[[*"ab"], [*"cd"]])
+    sprite.rotation = math.pi
+    def render() -> list[str]:
+        screen.clear()
+        screen.render([sprite])
+        return screen.framebuffer.get_lines()
+    assert render()[1:3] == ["  dc    ", "  ba    "]
+    sprite.texture[0][0] = "x"
+    sprite.invalidate_texture()
+    assert render()[1:3] == ["  dc    ", "  bx    "]
+    sprite.texture = [[*"yz"]]
+    assert render()[1:3] == ["        ", "  zy    "]
+
+
+def test_translation_table_is_rebuilt_when_cells_are_interned() -> None:
+    table = _get_translation_table(" ", ".")
+    assert _get_translation_table(" ", ".") is table
+    code = encode_cell("<new cell>")
+    rebuilt = _get_translation_table(" ", ".")
+    assert rebuilt is not table
+    assert rebuilt[code] == "<new cell>"
+    assert rebuilt[ord(" ")] == "."
+    framebuffer = Framebuffer(3, 1)
+    framebuffer.blit([["<new cell>"]], 1, 0)
+    assert framebuffer.get_lines(" ", ".") == [".<new cell>."]
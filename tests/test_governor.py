@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from displaylib.ascii.governor import OutputGovernor
+from displaylib.ascii.screen import AsciiScreen
+
+TPS = 10 # 0.1 seconds per tick, so writing may take 0.05 seconds per rendered frame, and recovers below 0.02
+
+
+@pytest.fixture
+def governor() -> OutputGovernor:
+    return OutputGovernor(AsciiScreen(8, 4), TPS)
+
+
+def feed(governor: OutputGovernor, seconds: float, size: int = 100) -> int:
+    """Records a batch of frames, and lets the governor decide once. Returns the new level
+    """
+    for _ in range(governor.patience):
+        governor.record(seconds, size)
+    governor.should_render()
+    return governor.level
+
+
+def test_levels_degrade_one_at_a_time(governor: OutputGovernor) -> None:
+    states = []
+    for _ in range(6):
+        feed(governor, 0.09)
+        state = governor.state
+        states.append((state.level, state.render_interval, state.diff_output, state.color_depth))
+    assert states == [
+        (1, 1, True, 24), # diff output
+        (2, 1, True, 8), # 256 colors
+        (3, 1, True, 4), # 16 colors
+        (4, 2, True, 4), # every 2nd tick, where 0.09 seconds fits the budget of 0.1
+        (4, 2, True, 4),
+        (4, 2, True, 4),
+    ]
+
+
+def test_levels_recover_to_the_original_settings(governor: OutputGovernor) -> None:
+    governor.screen.color_depth = 8
+    governor = OutputGovernor(governor.screen, TPS)
+    levels = [feed(governor, 2.0) for _ in range(governor.max_level + 1)]
+    assert levels[-2:] == [governor.max_level, governor.max_level]
+    assert governor.render_interval == governor.max_render_interval
+    levels = [feed(governor, 0.001) for _ in range(governor.max_level)]
+    assert levels == list(range(governor.max_level - 1, -1, -1))
+    assert (governor.screen.diff_output, governor.screen.color_depth, governor.render_interval) == (False, 8, 1)
+
+
+def test_levels_hold_between_the_thresholds(governor: OutputGovernor) -> None:
+    assert feed(governor, 0.09) == 1
+    assert [feed(governor, 0.03) for _ in range(4)] == [1, 1, 1, 1] # fits the budget, but is above the recover threshold
+    assert feed(governor, 0.01) == 0
+
+
+def test_decisions_wait_for_enough_frames(governor: OutputGovernor) -> None:
+    for _ in range(governor.patience - 1):
+        governor.record(0.09, 100)
+    governor.should_render()
+    assert governor.level == 0
+    governor.record(0.09, 100)
+    governor.should_render()
+    assert governor.level == 1
+
+
+def test_render_interval_skips_ticks(governor: OutputGovernor) -> None:
+    assert [feed(governor, 0.09) for _ in range(4)][-1] == 4
+    assert [governor.should_render() for _ in range(6)].count(True) == 3
+
+
+def test_output_limit_degrades_like_slow_writes(governor: OutputGovernor) -> None:
+    governor.max_bytes_per_second = 10_000 # 500 bytes per frame within budget at 10 tps
+    assert feed(governor, 0.0, size=400) == 0
+    assert feed(governor, 0.0, size=2000) == 1
+
+
+def test_reset_restores_full_quality(governor: OutputGovernor) -> None:
+    feed(governor, 0.09)
+    feed(governor, 0.09)
+    governor.reset()
+    assert governor.state == (0, 1, False, 24, 0.0, 0.0)
+
+
+def test_measurements_from_another_thread_wait_for_the_lock(governor: OutputGovernor) -> None:
+    with governor._lock: # held like during a decision
+        writer = threading.Thread(target=governor.record, args=(0.5, 10))
+        writer.start()
+        writer.join(timeout=0.05)
+        assert writer.is_alive()
+        assert governor.write_time == 0.0
+    writer.join()
+    assert governor.state.write_time == 0.5
+    for _ in range(governor.patience - 1):
+        governor.record(0.5, 10)
+    with governor._lock: # held like during a measurement
+        engine = threading.Thread(target=governor.should_render)
+        engine.start()
+        engine.join(timeout=0.05)
+        assert engine.is_alive()
+        assert governor.level == 0
+    engine.join()
+    assert governor.level == 1
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import pytest
+
+import displaylib.ascii as dl
+from displaylib.ascii import color
+
+
+def run(screen_type: type[dl.MemoryScreen] | type[dl.NullScreen], frames: int = 5) -> dl.Engine:
+    engines: list[dl.Engine] = []
+
+    class Engine(dl.Engine):
+        def _on_start(self) -> None:
+            engines.append(self)
+            self.sprite = dl.Sprite(x=1, y=0, texture=[[*"ab"]], color=color.RED)
+            self.frame = 0
+
+        def _update(self, delta: float) -> None:
+            self.frame += 1
+            self.sprite.position.x = self.frame
+            if self.frame == frames:
+                self.is_running = False
+
+    Engine(tps=1_000_000, width=8, height=2, screen_type=screen_type, auto_resize_screen=True, initial_clear=True)
+    return engines[0]
+
+
+def test_memory_screen_keeps_the_last_frame(capsys: pytest.CaptureFixture[str]) -> None:
+    engine = run(dl.MemoryScreen)
+    screen = engine.screen
+    assert isinstance(screen, dl.MemoryScreen)
+    assert screen.frames_shown == 6 # every tick, and the final frame
+    assert screen.get_lines() == [" " * 5 + "ab" + " ", " " * 8]
+    assert screen.get_lines(styled=True)[0] == " " * 5 + color.RED + "ab" + color.RESET + " "
+    screen.color_depth = 4
+    assert screen.get_lines(styled=True)[0] == " " * 5 + "\x1b[91m" + "ab" + color.RESET + " "
+    assert (screen.width, screen.height) == (8, 2) # not resized to a terminal
+    assert capsys.readouterr().out == "" # nothing is written, not even to clear the terminal
+
+
+def test_memory_screen_before_the_first_frame() -> None:
+    screen = dl.MemoryScreen(4, 2)
+    assert screen.get_lines() == []
+    assert screen.last_frame is None
+
+
+def test_memory_screen_frames_are_snapshots() -> None:
+    screen = dl.MemoryScreen(2, 1)
+    screen.framebuffer.blit([["x"]], 0, 0)
+    screen.show()
+    screen.framebuffer.blit([["y"]], 0, 0)
+    assert screen.get_lines() == ["x "]
+
+
+def test_null_screen_skips_composition(capsys: pytest.CaptureFixture[str]) -> None:
+    engine = run(dl.NullScreen)
+    screen = engine.screen
+    assert isinstance(screen, dl.NullScreen)
+    assert screen.frames_shown == 6
+    assert screen.framebuffer.get_lines() == [" " * 8, " " * 8] # nothing was drawn
+    assert capsys.readouterr().out == ""
+
+
+def test_null_screen_resizes_on_clear() -> None:
+    screen = dl.NullScreen(4, 2)
+    screen.width = 6
+    screen.clear()
+    assert (screen.framebuffer.width, screen.framebuffer.height) == (6, 2)
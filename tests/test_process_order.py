@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import displaylib.template as dl
+from displaylib.template import Node
+
+
+class Priority(dl.Node):
+    default_process_priority = 5
+
+
+def order() -> list[str]:
+    return [node.uid for node in Node.get_process_order()]
+
+
+def test_creation_order_within_priorities() -> None:
+    first = dl.Node()
+    late = Priority()
+    second = dl.Node()
+    early = dl.Node().where(process_priority=-1)
+    assert order() == [early.uid, first.uid, second.uid, late.uid]
+
+
+def test_priority_changes_keep_creation_order() -> None:
+    a, b, c = dl.Node(), dl.Node(), dl.Node()
+    b.process_priority = 1 # later
+    assert order() == [a.uid, c.uid, b.uid]
+    b.process_priority = 0 # back between the others
+    assert order() == [a.uid, b.uid, c.uid]
+    c.process_priority = -1 # earlier
+    a.process_priority = -1
+    assert order() == [a.uid, c.uid, b.uid]
+    a.process_priority = 0
+    c.process_priority = 0
+    assert order() == [a.uid, b.uid, c.uid]
+    assert list(Node._process_buckets) == [0] # empty priorities are removed
+    assert Node._process_priorities == [0]
+
+
+def test_freed_nodes_leave_the_process_order() -> None:
+    a, b, c = dl.Node(), dl.Node(), dl.Node()
+    b.queue_free()
+    assert order() == [a.uid, b.uid, c.uid] # only freed once every node was updated
+    Node._free_queued_nodes()
+    assert order() == [a.uid, c.uid]
+    b.process_priority = 3 # freed nodes are not added again
+    assert order() == [a.uid, c.uid]
+
+
+def test_process_order_is_cached_until_changed() -> None:
+    a = dl.Node()
+    cached = Node.get_process_order()
+    assert Node.get_process_order() is cached
+    a.process_priority = 0 # unchanged
+    assert Node.get_process_order() is cached
+    b = dl.Node() # created
+    assert Node.get_process_order() == (a, b)
+    a.process_priority = 1 # changed
+    assert Node.get_process_order() == (b, a)
+    b.queue_free() # freed
+    Node._free_queued_nodes()
+    assert Node.get_process_order() == (a,)
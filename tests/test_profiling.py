@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+
+import displaylib.ascii as dl
+from displaylib.ascii.animation import AnimationPlayer, EmptyAnimation, EmptyAnimationFrame
+from displaylib.template.profiling import NodeProfiler
+
+WRAPPER = "Player._animation_player_update_wrapper"
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Player(AnimationPlayer):
+    clock: Clock
+
+    def _update(self, delta: float) -> None:
+        self.clock.now += 1.0 # time spent by the node
+
+    def _advance_animation(self) -> None:
+        self.clock.now += 0.25 # time spent by the wrapper
+        super()._advance_animation()
+
+
+def make_animation(*textures: list[list[str]]) -> EmptyAnimation:
+    animation = EmptyAnimation()
+    for texture in textures:
+        frame = EmptyAnimationFrame()
+        frame.texture = texture
+        animation.frames.append(frame)
+    return animation
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(time, "perf_counter", clock)
+    monkeypatch.setattr(Player, "clock", clock, raising=False)
+    return clock
+
+
+def test_animation_step_is_counted_apart_from_the_node(clock: Clock) -> None:
+    sprite = dl.Sprite(texture=[["a"]])
+    player = Player(sprite, walk=make_animation([["b"]], [["c"]]))
+    player.play("walk")
+    profiler = NodeProfiler()
+    NodeProfiler.current = profiler
+    for _ in range(2):
+        profiler.update_nodes([player], 0.1)
+    assert sprite.texture == [["c"]] # the animation was stepped
+    timings = {timing.name: timing for timing in profiler.get_top(by="class")}
+    assert set(timings) == {"Player", WRAPPER}
+    assert (timings["Player"].calls, timings["Player"].total, timings["Player"].max) == (2, 2.0, 1.0)
+    assert (timings[WRAPPER].calls, timings[WRAPPER].total) == (2, 0.5)
+    [by_uid] = profiler.get_top(by="uid")
+    assert by_uid.name == f"{player.uid} (Player)"
+    assert by_uid.total == 2.0 # wrapper time is not counted for the node
+
+
+def test_animation_step_without_profiler(clock: Clock) -> None:
+    sprite = dl.Sprite(texture=[["a"]])
+    player = Player(sprite, walk=make_animation([["b"]], [["c"]]))
+    player.play("walk")
+    player._update(0.1)
+    player._update(0.1)
+    assert sprite.texture == [["c"]]
+    assert clock.now == 2.5
+
+
+def test_engine_profiles_animation_players(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(NodeProfiler, "report_at_exit", False)
+    engines: list[dl.Engine] = []
+
+    class Engine(dl.Engine):
+        def _on_start(self) -> None:
+            engines.append(self)
+            self.sprite = dl.Sprite(texture=[["a"]])
+            self.player = AnimationPlayer(self.sprite, walk=make_animation([["b"]], [["c"]]))
+            self.player.play("walk")
+            self.frame = 0
+
+        def _update(self, delta: float) -> None:
+            self.frame += 1
+            if self.frame == 3:
+                self.is_running = False
+
+    Engine(tps=1_000_000, width=4, height=2, screen_type=dl.NullScreen, profile_nodes=True)
+    profiler = engines[0].node_profiler
+    assert profiler is not None and NodeProfiler.current is profiler
+    timings = {timing.name: timing for timing in profiler.get_top(by="class")}
+    assert timings["AnimationPlayer"].calls == 3
+    assert timings["AnimationPlayer._animation_player_update_wrapper"].calls == 3
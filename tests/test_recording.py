@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+import displaylib.ascii as dl
+
+from displaylib.ascii.framebuffer import Framebuffer, encode_attribute
+from displaylib.ascii.recording import TRAILER, Recorder, Recording, read_index
+from displaylib.ascii.screen import AsciiScreen
+
+
+class FakeClock:
+    elapsed_time = 0.0
+
+
+def make_frames(count: int, width: int = 10, height: int = 4) -> list[Framebuffer]:
+    red = encode_attribute("\x1b[31m")
+    frames: list[Framebuffer] = []
+    framebuffer = Framebuffer(width, height)
+    for index in range(count):
+        framebuffer.blit([[*f"{index:>3}"]], index % width, index % height)
+        framebuffer.blit([["<>"]], 0, 3, color=red if index % 2 else 0) # multi-character cell
+        frames.append(framebuffer.copy())
+    return frames
+
+
+def record(path: Path, frames: list[Framebuffer], *, start: float = 0.0, keyframe_interval: int = 64) -> None:
+    clock = FakeClock()
+    recorder = Recorder(AsciiScreen(10, 4), str(path), clock=clock) # type: ignore
+    recorder.keyframe_interval = keyframe_interval
+    for index, frame in enumerate(frames):
+        clock.elapsed_time = start + index * 0.1
+        recorder.submit(frame)
+    recorder.close()
+
+
+def lines(framebuffer: Framebuffer) -> list[str]:
+    return framebuffer.get_lines(styled=True)
+
+
+def test_frames_round_trip(tmp_path: Path) -> None:
+    path = tmp_path / "session.dlrec"
+    frames = make_frames(20)
+    record(path, frames, keyframe_interval=8)
+    with Recording(str(path)) as recording:
+        assert recording.frame_count == 20
+        read = []
+        while (frame := recording.read()) is not None:
+            read.append(frame)
+    assert [frame.frame for frame in read] == list(range(20))
+    assert [lines(frame.framebuffer) for frame in read] == [lines(frame) for frame in frames]
+    assert [frame.timestamp for frame in read] == pytest.approx([index * 0.1 for index in range(20)])
+
+
+def test_appending_continues_the_timeline(tmp_path: Path) -> None:
+    path = tmp_path / "session.dlrec"
+    first = make_frames(5)
+    second = make_frames(7, width=6, height=3) # a later session may have another size
+    record(path, first)
+    record(path, second)
+    with Recording(str(path)) as recording:
+        assert recording.frame_count == 12
+        read = []
+        while (frame := recording.read()) is not None:
+            read.append(frame)
+    assert [lines(frame.framebuffer) for frame in read] == [lines(frame) for frame in first + second]
+    timestamps = [frame.timestamp for frame in read]
+    assert timestamps == sorted(timestamps)
+    assert timestamps[5] == pytest.approx(timestamps[4]) # the second session starts where the first ended
+
+
+def test_unclosed_recording_is_readable(tmp_path: Path) -> None:
+    path = tmp_path / "session.dlrec"
+    frames = make_frames(10)
+    record(path, frames)
+    data = path.read_bytes()
+    _magic, index_offset = TRAILER.unpack(data[-TRAILER.size:])
+    # as if the process was killed while writing another frame, before writing the index
+    path.write_bytes(data[:index_offset] + data[index_offset:index_offset + 5])
+    with Recording(str(path)) as recording:
+        assert recording.frame_count == 10
+        assert lines(recording.seek(-1).framebuffer) == lines(frames[-1])
+
+
+def test_rejects_other_files(tmp_path: Path) -> None:
+    path = tmp_path / "other.txt"
+    path.write_bytes(b"not a recording")
+    with pytest.raises(ValueError):
+        Recording(str(path))
+    with pytest.raises(ValueError):
+        Recorder(AsciiScreen(4, 2), str(path))
+
+
+def test_interrupted_engine_closes_the_writer_and_the_recording(tmp_path: Path) -> None:
+    path = tmp_path / "session.dlrec"
+    engines: list[dl.Engine] = []
+
+    class Engine(dl.Engine):
+        def _on_start(self) -> None:
+            engines.append(self)
+            self.sprite = dl.Sprite(texture=[[*"ab"]])
+            self.frame = 0
+
+        def _update(self, delta: float) -> None:
+            if self.frame == 30:
+                raise KeyboardInterrupt
+            self.sprite.position.x = self.frame % 8
+            self.frame += 1
+
+    with pytest.raises(KeyboardInterrupt):
+        Engine(tps=1_000_000, width=10, height=2, screen_type=dl.MemoryScreen, double_buffered=True, record=str(path))
+    engine = engines[0]
+    writer = engine.screen.writer
+    assert writer is not None and not writer.is_running
+    assert writer.frames_written + writer.frames_dropped == writer.frames_submitted == 30 # the waiting frame was written
+    assert engine.screen.get_lines() == [" " * 5 + "ab" + " " * 3, " " * 10]
+    with open(path, "rb") as file:
+        index = read_index(file)
+    assert index is not None # closed with its trailer
+    assert index[1] == 30
+    with Recording(str(path)) as recording:
+        assert recording.seek(-1).framebuffer.get_lines() == engine.screen.get_lines()
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import io
+from pathlib import Path
+
+import pytest
+
+from displaylib.ascii.framebuffer import Framebuffer
+from displaylib.ascii.recording import Recorder, Recording
+from displaylib.ascii.replay import dump, parse_frames
+from displaylib.ascii.screen import AsciiScreen
+
+FRAME_COUNT = 30
+KEYFRAME_INTERVAL = 8
+
+
+class FakeClock:
+    elapsed_time = 0.0
+
+
+def expected_lines(index: int) -> list[str]:
+    return [f"{index:>4}", "    "]
+
+
+@pytest.fixture
+def recording(tmp_path: Path):
+    path = tmp_path / "replay.dlrec"
+    clock = FakeClock()
+    recorder = Recorder(AsciiScreen(4, 2), str(path), clock=clock) # type: ignore
+    recorder.keyframe_interval = KEYFRAME_INTERVAL
+    framebuffer = Framebuffer(4, 2)
+    for index in range(FRAME_COUNT):
+        framebuffer.blit([[*f"{index:>4}"]], 0, 0)
+        clock.elapsed_time = index * 0.5
+        recorder.submit(framebuffer.copy())
+    recorder.close()
+    with Recording(str(path)) as recording:
+        yield recording
+
+
+def test_keyframes_are_indexed(recording: Recording) -> None:
+    assert [keyframe.frame for keyframe in recording.keyframes] == list(range(0, FRAME_COUNT, KEYFRAME_INTERVAL))
+    assert recording.duration == pytest.approx((FRAME_COUNT - 1) * 0.5)
+
+
+@pytest.mark.parametrize("frames", [[0, 29, 7, 8, 9, 3], [15, 16, 24, 1, 1], [29, 0]])
+def test_seek_in_any_order(recording: Recording, frames: list[int]) -> None:
+    for frame in frames:
+        recorded = recording.seek(frame)
+        assert recorded.frame == frame
+        assert recorded.timestamp == pytest.approx(frame * 0.5)
+        assert recorded.framebuffer.get_lines() == expected_lines(frame)
+
+
+def test_read_continues_after_seek(recording: Recording) -> None:
+    recording.seek(14)
+    following = recording.read()
+    assert following is not None
+    assert following.frame == 15
+    assert following.framebuffer.get_lines() == expected_lines(15)
+
+
+def test_seek_counts_negative_frames_from_the_end(recording: Recording) -> None:
+    assert recording.seek(-1).frame == FRAME_COUNT - 1
+
+
+@pytest.mark.parametrize("frame", [FRAME_COUNT, -FRAME_COUNT - 1])
+def test_seek_outside_recording(recording: Recording, frame: int) -> None:
+    with pytest.raises(IndexError):
+        recording.seek(frame)
+
+
+@pytest.mark.parametrize("timestamp, frame", [(-1.0, 0), (0.0, 0), (4.2, 8), (4.5, 9), (100.0, FRAME_COUNT - 1)])
+def test_find_frame_by_timestamp(recording: Recording, timestamp: float, frame: int) -> None:
+    assert recording.find_frame(timestamp) == frame
+
+
+def test_parse_frames(recording: Recording) -> None:
+    assert parse_frames("1,3-5,-1", recording) == [1, 3, 4, 5, FRAME_COUNT - 1]
+    assert parse_frames("every:10", recording) == [0, 10, 20]
+    assert parse_frames("at:0.9,2", recording) == [1, 4]
+    assert parse_frames("28-40", recording) == [28, 29] # frames past the end are dropped
+
+
+def test_dump_writes_selected_frames(recording: Recording) -> None:
+    out = io.StringIO()
+    dump(recording, [2, 12], file=out)
+    assert out.getvalue() == (
+        "--- frame 2 at 1.000s ---\n   2\n    \n"
+        "--- frame 12 at 6.000s ---\n  12\n    \n"
+    )
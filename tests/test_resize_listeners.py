@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+
+import displaylib.ascii as dl
+from displaylib.ascii.node import Ascii
+from displaylib.math import Vec2i
+
+
+class Listener(dl.Node2D):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.sizes: list[Vec2i] = []
+
+    def _on_screen_resize(self, size: Vec2i) -> None:
+        self.sizes.append(size)
+
+
+def test_only_overriding_nodes_are_registered() -> None:
+    listener = Listener()
+    dl.Node2D()
+    dl.Sprite(texture=[["#"]])
+    assert Ascii._resize_listeners == {listener.uid: listener}
+
+
+def test_queue_free_unregisters() -> None:
+    first = Listener()
+    second = Listener()
+    first.queue_free()
+    assert Ascii._resize_listeners == {second.uid: second}
+    first.queue_free() # already unregistered
+    assert Ascii._resize_listeners == {second.uid: second}
+
+
+@pytest.mark.parametrize("columns, lines, notified", [(41, 11, True), (21, 9, False)])
+def test_terminal_resize_notifies_listeners(monkeypatch: pytest.MonkeyPatch, columns: int, lines: int, notified: bool) -> None:
+    monkeypatch.setattr(os, "get_terminal_size", lambda *args: os.terminal_size((columns, lines)))
+    engine_sizes: list[Vec2i] = []
+
+    class Engine(dl.Engine):
+        def _on_start(self) -> None:
+            self.listener = Listener()
+            self.freed = Listener()
+            self.freed.queue_free()
+            self._apply_terminal_size()
+
+        def _update(self, delta: float) -> None:
+            self.is_running = False
+
+        def _on_screen_resize(self, size: Vec2i) -> None:
+            engine_sizes.append(size)
+
+    engine = Engine(tps=1_000_000, width=20, height=8, screen_type=dl.MemoryScreen)
+    expected = [Vec2i(columns, lines)] if notified else []
+    assert engine_sizes == expected
+    assert engine.listener.sizes == expected
+    assert engine.freed.sizes == []
+    if notified:
+        assert (engine.screen.width, engine.screen.height) == (columns - 1, lines - 1)
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import pytest
+
+from displaylib.ascii.framebuffer import Framebuffer, encode_attribute
+from displaylib.ascii.screen import AsciiScreen, _get_min_full_size
+
+
+@pytest.fixture
+def screen() -> AsciiScreen:
+    screen = AsciiScreen(8, 3)
+    screen.diff_output = True
+    return screen
+
+
+def show(screen: AsciiScreen, capsys: pytest.CaptureFixture[str]) -> str:
+    screen.show()
+    return capsys.readouterr().out
+
+
+def test_diff_moves_cursor_to_changed_cell(screen: AsciiScreen) -> None:
+    last = Framebuffer(8, 3)
+    frame = last.copy()
+    frame.blit([["x"]], 5, 1)
+    # down 1 line, to column 6 (1-indexed), then back up to the top left corner
+    assert screen._get_diff_output(frame, last) == "\x1b[1B\x1b[6Gx\x1b[1A\r"
+
+
+def test_diff_merges_runs_separated_by_a_small_gap(screen: AsciiScreen) -> None:
+    last = Framebuffer(8, 3)
+    frame = last.copy()
+    frame.blit([["a"]], 1, 0)
+    frame.blit([["z"]], 7, 0) # 5 unchanged cells apart, more than `diff_gap`
+    assert screen._get_diff_output(frame, last) == "\x1b[2Ga\x1b[8Gz\r"
+    frame.blit([["b"]], 3, 0) # now 3 unchanged cells apart, rewritten instead of moving the cursor
+    assert screen._get_diff_output(frame, last) == "\x1b[2Ga b   z\r"
+
+
+def test_diff_includes_colors_of_changed_cells(screen: AsciiScreen) -> None:
+    last = Framebuffer(8, 3)
+    frame = last.copy()
+    frame.blit([[*"ab"]], 1, 0, color=encode_attribute("\x1b[31m"))
+    assert screen._get_diff_output(frame, last) == "\x1b[2G\x1b[31mab\x1b[0m\r"
+
+
+def test_diff_detects_color_only_changes(screen: AsciiScreen) -> None:
+    last = Framebuffer(8, 3)
+    last.blit([["a"]], 0, 0)
+    frame = last.copy()
+    frame.blit([["a"]], 0, 0, color=encode_attribute("\x1b[32m"))
+    assert screen._get_diff_output(frame, last) == "\x1b[1G\x1b[32ma\x1b[0m\r"
+
+
+def test_diff_is_none_after_resize(screen: AsciiScreen) -> None:
+    assert screen._get_diff_output(Framebuffer(8, 3), Framebuffer(6, 3)) is None
+
+
+def test_show_writes_full_frame_then_only_changes(screen: AsciiScreen, capsys: pytest.CaptureFixture[str]) -> None:
+    screen.framebuffer.blit([["x"]], 5, 1)
+    assert show(screen, capsys) == "         \n     x   \n         \n\x1b[A\x1b[A\x1b[A\r"
+    assert show(screen, capsys) == "" # unchanged
+    screen.framebuffer.blit([["y"]], 0, 2)
+    assert show(screen, capsys) == "\x1b[2B\x1b[1Gy\x1b[2A\r"
+
+
+def test_show_writes_full_frame_when_shorter_than_diff(screen: AsciiScreen, capsys: pytest.CaptureFixture[str]) -> None:
+    show(screen, capsys)
+    screen.framebuffer.fill("x") # every line changed, so moving the cursor costs more than rewriting
+    assert show(screen, capsys) == "xxxxxxxx \n" * 3 + "\x1b[A" * 3 + "\r"
+
+
+def test_show_writes_full_frame_after_resize(screen: AsciiScreen, capsys: pytest.CaptureFixture[str]) -> None:
+    show(screen, capsys)
+    screen.width = 4
+    screen.clear()
+    assert show(screen, capsys) == "     \n" * 3 + "\x1b[A" * 3 + "\r"
+
+
+def test_show_clears_terminal_before_full_frame(screen: AsciiScreen, capsys: pytest.CaptureFixture[str]) -> None:
+    show(screen, capsys)
+    screen.clear_terminal()
+    assert show(screen, capsys).startswith("\x1b[2J\x1b[H         \n")
+
+
+def test_show_writes_full_frame_when_shorter_with_empty_default(screen: AsciiScreen, capsys: pytest.CaptureFixture[str]) -> None:
+    screen.cell_default = "" # transparent cells are not written at all
+    show(screen, capsys)
+    for y in range(3):
+        screen.framebuffer.blit([["x"]], 7, y)
+    full = screen._get_full_output(screen.framebuffer)
+    assert _get_min_full_size(screen.framebuffer, screen.cell_default) <= len(full)
+    assert len(full) < len(screen._get_diff_output(screen.framebuffer, screen._last_frame) or "")
+    assert show(screen, capsys) == full == "x \n" * 3 + "\x1b[A" * 3 + "\r"
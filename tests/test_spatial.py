@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import pytest
+
+import displaylib.ascii as dl
+from displaylib.ascii.prototypes.parallex_sprite import ParallexSprite
+from displaylib.ascii.prototypes.texture_collider import TextCollider
+from displaylib.ascii.spatial import SpatialGrid
+from displaylib.ascii.texture import Texture
+from displaylib.template import Node
+from displaylib.math import Vec2
+
+
+class Wavy(dl.Sprite):
+    def _get_final_texture(self) -> list[list[str]]:
+        return [["~"] * 3]
+
+
+def rect(left: float, top: float, right: float, bottom: float) -> tuple[Vec2, Vec2]:
+    return (Vec2(left, top), Vec2(right, bottom))
+
+
+@pytest.fixture
+def grid() -> SpatialGrid:
+    return SpatialGrid(cell_size=4)
+
+
+def make_sprite(grid: SpatialGrid, x: float, y: float, width: int = 2, height: int = 2, **kwargs) -> dl.Sprite:
+    sprite = dl.Sprite(x=x, y=y, texture=[["#"] * width for _ in range(height)], **kwargs)
+    grid.insert(sprite)
+    return sprite
+
+
+def test_query_rect_finds_overlapping_nodes(grid: SpatialGrid) -> None:
+    near = make_sprite(grid, 1, 1)
+    straddling = make_sprite(grid, 3, 3, width=6) # covers several cells
+    far = make_sprite(grid, 40, 20)
+    assert len(grid) == 3 and near in grid
+    assert grid.query_rect(rect(0, 0, 2, 2)) == [near]
+    assert grid.query_rect(rect(8, 4, 9, 4)) == [straddling]
+    assert grid.query_rect(rect(10, 0, 30, 30)) == []
+    assert grid.query_point(Vec2(41, 21)) == [far]
+    assert grid.query_rect(rect(-100, -100, 100, 100)) == [near, straddling, far]
+
+
+def test_results_are_sorted_by_z_index_priority_and_insertion(grid: SpatialGrid) -> None:
+    first = make_sprite(grid, 0, 0)
+    top = make_sprite(grid, 0, 0, z_index=2)
+    urgent = make_sprite(grid, 0, 0)
+    urgent.process_priority = -1
+    second = make_sprite(grid, 0, 0)
+    assert grid.query_point(Vec2(1, 1)) == [urgent, first, second, top]
+
+
+def test_changes_are_picked_up_by_refresh(grid: SpatialGrid) -> None:
+    sprite = make_sprite(grid, 0, 0)
+    sprite.position.x = 20 # mutated in place
+    assert grid.refresh() == 1
+    assert grid.query_point(Vec2(0, 0)) == []
+    assert grid.query_point(Vec2(21, 1)) == [sprite]
+    sprite.texture = [["#"] * 10]
+    assert grid.refresh() == 1
+    assert grid.query_point(Vec2(29, 0)) == [sprite]
+    sprite.texture[0] += ["#"] * 10 # mutated in place, so only seen after invalidating
+    assert grid.query_point(Vec2(37, 0)) == []
+    sprite.invalidate_texture()
+    grid.refresh()
+    assert grid.query_point(Vec2(37, 0)) == [sprite]
+    assert grid.refresh() == 0 # unchanged since
+
+
+def test_rotation_and_parent_movement_are_picked_up(grid: SpatialGrid) -> None:
+    parent = dl.Node2D(x=0, y=0)
+    sprite = dl.Sprite(parent, x=1, y=0, texture=[["#"] * 6], centered=True)
+    grid.insert(sprite)
+    assert grid.query_point(Vec2(1, 4)) == []
+    sprite.rotation = 1.5
+    grid.refresh()
+    assert grid.query_point(Vec2(1, 3)) == [sprite] # rotated texture reaches along the y axis
+    parent.position.y = 30
+    grid.refresh()
+    assert grid.query_point(Vec2(1, 3)) == []
+    assert grid.query_point(Vec2(1, 30)) == [sprite]
+
+
+def test_unbounded_nodes_are_always_returned(grid: SpatialGrid) -> None:
+    wavy = Wavy(x=100, y=100, texture=[["~"]])
+    parallax = ParallexSprite(x=100, y=100) # drawn without the `Texture` component
+    grid.insert(wavy)
+    grid.insert(parallax) # type: ignore
+    sprite = make_sprite(grid, 0, 0)
+    assert grid.query_point(Vec2(50, 50)) == [wavy, parallax]
+    assert grid.query_point(Vec2(0, 0)) == [wavy, parallax, sprite]
+
+
+def test_remove_and_forced_refresh(grid: SpatialGrid) -> None:
+    kept = make_sprite(grid, 0, 0)
+    removed = make_sprite(grid, 0, 0)
+    grid.remove(removed)
+    grid.remove(removed) # no longer present
+    assert removed not in grid
+    assert grid.query_point(Vec2(0, 0)) == [kept]
+    kept.texture[0][0] = "@" # same size, so nothing to rehash
+    assert grid.refresh(force=True) == 0
+    assert grid.query_point(Vec2(0, 0)) == [kept]
+
+
+def test_nodes_follow_the_engine_index() -> None:
+    Texture._spatial_index = SpatialGrid()
+    sprite = dl.Sprite(texture=[["#"]])
+    assert sprite in Texture._spatial_index
+    parallax = ParallexSprite()
+    assert parallax in Texture._spatial_index
+    sprite.queue_free()
+    parallax.queue_free()
+    assert len(Texture._spatial_index) == 0
+
+
+class Box(TextCollider, dl.Sprite):
+    ...
+
+
+@pytest.mark.parametrize("spatial_index", [False, True])
+def test_colliders_moved_by_assignment_are_found(spatial_index: bool) -> None:
+    if spatial_index:
+        Texture._spatial_index = SpatialGrid()
+    a = Box(x=0, y=0, texture=[["#"] * 3 for _ in range(3)])
+    b = Box(x=20, y=20, texture=[["#"] * 3 for _ in range(3)])
+    assert a.get_collider() is None
+    b.position = Vec2(1, 1)
+    assert a.get_collider() is b
+    b.position.x = 30 # mutated in place
+    assert a.get_collider() is None
+
+
+def test_refresh_reports_mostly_moving_scenes(grid: SpatialGrid) -> None:
+    sprites = [make_sprite(grid, x * 10, 0) for x in range(8)]
+    sprites[0].position.x += 1
+    sprites[1].texture = [["@"]] # texture changes do not count as moving
+    grid.refresh()
+    assert not grid.is_busy
+    for sprite in sprites[:3]:
+        sprite.position.y += 1
+    grid.refresh()
+    assert grid.is_busy
+    grid.refresh()
+    assert not grid.is_busy
+
+
+@pytest.mark.parametrize("moving", [1, 40])
+def test_engine_renders_the_same_with_the_index(moving: int) -> None:
+    frames: dict[bool, list[list[str]]] = {}
+    for spatial_index in (False, True):
+        Node.nodes = {}
+        Texture._instances = []
+        Texture._spatial_index = None
+        lines: list[list[str]] = []
+
+        class Engine(dl.Engine):
+            def _on_start(self) -> None:
+                self.sprites = [dl.Sprite(x=x * 3 - 20, y=x % 7, texture=[[*"ab"]]) for x in range(40)]
+                self.frame = 0
+
+            def _update(self, delta: float) -> None:
+                for sprite in self.sprites[:moving]:
+                    sprite.position.x += 1
+                lines.append(self.screen.get_lines())
+                self.frame += 1
+                if self.frame == 40:
+                    self.is_running = False
+
+        engine = Engine(tps=1_000_000, width=30, height=8, screen_type=dl.MemoryScreen, spatial_index=spatial_index)
+        frames[spatial_index] = lines
+        if spatial_index:
+            assert (engine._spatial_index_skips > 0) == (moving > 10) # the index is skipped while most nodes move
+    assert frames[True] == frames[False]
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from typing import Callable
+
+import pytest
+
+import displaylib.ascii as dl
+from displaylib.ascii.screen import AsciiScreen
+from displaylib.ascii.texture import Texture
+from displaylib.ascii.prototypes.parallex_sprite import ParallexSprite, ParallexLayer
+
+
+def render(screen: AsciiScreen) -> list[str]:
+    screen.clear()
+    screen.render(sorted(Texture._instances, key=lambda node: (node.z_index, node.process_priority)))
+    return screen.framebuffer.get_lines(styled=True)
+
+
+def make_static_screen() -> AsciiScreen:
+    screen = AsciiScreen(12, 4)
+    screen.static_layers = {0}
+    return screen
+
+
+@pytest.fixture(autouse=True)
+def camera() -> dl.Camera:
+    return dl.Camera().as_current()
+
+
+@pytest.fixture
+def sprites() -> list[dl.Sprite]:
+    return [dl.Sprite(x=2 * index, y=index % 3, texture=[[*"ab"], [*"cd"]]) for index in range(4)]
+
+
+def test_static_layer_matches_plain_render(sprites: list[dl.Sprite]) -> None:
+    top = dl.Sprite(x=1, y=1, texture=[[*"TOP"]], z_index=1) # drawn over the layer
+    plain = AsciiScreen(12, 4)
+    static = make_static_screen()
+    def mutate() -> None:
+        sprites[0].texture[0][0] = "!"
+        sprites[0].invalidate_texture()
+    steps: list[Callable[[], None]] = [
+        lambda: setattr(sprites[1], "texture", [[*"###"]]),
+        mutate,
+        lambda: setattr(sprites[2], "color", dl.color.RED),
+        lambda: setattr(top.position, "x", 5),
+        lambda: setattr(sprites[3].position, "y", 0),
+        lambda: setattr(sprites[1], "visible", False),
+        lambda: sprites[2].queue_free(),
+    ]
+    assert render(static) == render(plain)
+    for step in steps:
+        step()
+        assert render(static) == render(plain)
+
+
+def test_static_layer_is_reused_until_a_member_changes(sprites: list[dl.Sprite]) -> None:
+    screen = make_static_screen()
+    render(screen)
+    (layer,) = screen._static_cache.values()
+    render(screen)
+    (reused,) = screen._static_cache.values()
+    assert reused is layer
+
+    sprites[1].invalidate_texture()
+    assert not layer.is_valid
+    render(screen)
+    (rebuilt,) = screen._static_cache.values()
+    assert rebuilt is not layer and rebuilt.is_valid
+
+    sprites[2].position.x += 1 # moved in place, which is compared every frame
+    render(screen)
+    (moved,) = screen._static_cache.values()
+    assert moved is not rebuilt
+
+
+def test_released_layer_is_not_invalidated_by_former_members(sprites: list[dl.Sprite]) -> None:
+    screen = make_static_screen()
+    render(screen)
+    (layer,) = screen._static_cache.values()
+    screen.static_layers = set()
+    render(screen)
+    assert not screen._static_cache
+    assert all(sprite._static_layer is None for sprite in sprites)
+    sprites[0].texture = [["x"]]
+    assert layer.is_valid
+
+
+@pytest.mark.parametrize("static_layers", [set(), {0}])
+@pytest.mark.parametrize("dirty_tracking", [False, True])
+def test_nodes_without_texture_component_are_rendered(static_layers: set[int], dirty_tracking: bool) -> None:
+    frames: list[list[str]] = []
+
+    class Engine(dl.Engine):
+        def _on_start(self) -> None:
+            self.screen.static_layers = static_layers
+            self.screen.dirty_tracking = dirty_tracking
+            parallax = ParallexSprite(x=3, y=2)
+            parallax.add_layer(ParallexLayer(texture=[[*"abc"]]))
+            dl.Sprite(x=1, y=1, texture=[[*"xy"]])
+
+        def _update(self, delta: float) -> None:
+            frames.append(self.screen.get_lines())
+            if len(frames) == 3:
+                self.is_running = False
+
+    Engine(tps=1_000_000, width=10, height=5, screen_type=dl.MemoryScreen)
+    assert frames[-1][1] == " xy       "
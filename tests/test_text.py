@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import copy
+import math
+import random
+from typing import Iterable
+
+import pytest
+
+from displaylib.ascii import text
+from displaylib.ascii.text import Conversion
+
+SYMBOLS = "/\\()[]{}<>´`dbp.'¨_wWmMvV^A|-ax #"
+
+
+# reference implementations, as before the lookup tables were precomputed
+def reference_fliph(line: str | Iterable[str]) -> str:
+    return "".join(Conversion.horizontal.get(letter, letter) for letter in line)[::-1]
+
+
+def reference_flipv(line: str | Iterable[str]) -> str:
+    return "".join(Conversion.vertical.get(letter, letter) for letter in line)
+
+
+def reference_rotate(symbol: str, angle: float) -> str:
+    if symbol in Conversion.rotational:
+        options = len(Conversion.rotational[symbol])
+        index = round(((angle % math.pi) / (2*math.pi)) * options)
+        return Conversion.rotational[symbol][index]
+    for idx, options in enumerate(Conversion.rotational.values()):
+        if symbol in options:
+            break
+    else: # nobreak
+        return symbol
+    key = list(Conversion.rotational.keys())[idx]
+    options = Conversion.rotational[key]
+    where = options.index(symbol)
+    index = round(((angle % math.pi) / (2*math.pi)) * len(options)) - where
+    return Conversion.rotational[key][index]
+
+
+@pytest.fixture(autouse=True)
+def restore_conversion():
+    databases = (copy.deepcopy(Conversion.horizontal), copy.deepcopy(Conversion.vertical), copy.deepcopy(Conversion.rotational))
+    yield
+    Conversion.horizontal, Conversion.vertical, Conversion.rotational = databases
+    Conversion.rebuild()
+
+
+def random_lines(rng: random.Random, count: int, cells: str) -> list[list[str]]:
+    return [[rng.choice(cells) for _ in range(rng.randrange(12))] for _ in range(count)]
+
+
+def random_angles(rng: random.Random, count: int) -> list[float]:
+    steps = [step * math.pi / 8 for step in range(-16, 17)] # where rounding is on the edge
+    return steps + [rng.uniform(-10, 10) for _ in range(count)]
+
+
+def assert_same_as_reference(rng: random.Random, cells: str | list[str]) -> None:
+    lines = random_lines(rng, 500, cells) # type: ignore[arg-type]
+    for line in lines:
+        assert text.fliph(line) == reference_fliph(line)
+        assert text.flipv(line) == reference_flipv(line)
+        assert text.fliph("".join(line)) == reference_fliph("".join(line))
+        assert text.fliph(iter(line)) == reference_fliph(line) # consumed once
+    assert text.mapfliph(lines) == [[Conversion.horizontal.get(cell, cell) for cell in line][::-1] for line in lines]
+    assert text.mapflipv(lines) == [[Conversion.vertical.get(cell, cell) for cell in line] for line in lines]
+    for angle in random_angles(rng, 500):
+        for symbol in set(cells):
+            assert text.rotate(symbol, angle) == reference_rotate(symbol, angle), (symbol, angle)
+
+
+def test_builtin_tables_match_the_reference() -> None:
+    assert_same_as_reference(random.Random(0), SYMBOLS)
+
+
+def test_multi_character_cells_match_the_reference() -> None:
+    assert_same_as_reference(random.Random(1), [*SYMBOLS, "<>", "ab"])
+
+
+def test_extended_tables_match_the_reference() -> None:
+    version = Conversion._version
+    Conversion.extend(horizontal={"q": "p"}, vertical={"n": "u"}, rotational={"-": ["-", "/", "|", "\\"]})
+    assert Conversion._version == version + 1 # invalidates cached rotated rasters
+    assert text.lookuph("p") == "q" # mirrored like the builtin flips
+    assert_same_as_reference(random.Random(2), SYMBOLS + "qnu")
+    Conversion.extend(horizontal={"<<": ">>"}) # no longer a table for `str.translate`
+    assert Conversion._horizontal_table is None
+    assert_same_as_reference(random.Random(3), [*SYMBOLS, "<<", ">>"])
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import types
+
+import pytest
+
+from displaylib.template import timing
+from displaylib.template.timing import FrameTimer, PhaseTiming
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def perf_counter(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(timing, "_time", types.SimpleNamespace(perf_counter=clock.perf_counter))
+    return clock
+
+
+def run_frame(timer: FrameTimer, clock: FakeClock, **phases: float) -> None:
+    for phase, seconds in phases.items():
+        clock.now += seconds
+        timer.mark(phase)
+    timer.end_frame()
+
+
+def test_phases_are_measured_between_marks(clock: FakeClock) -> None:
+    timer = FrameTimer(capacity=4)
+    timer.begin_frame()
+    clock.now += 0.5 # counted towards the first phase, which starts with the frame
+    run_frame(timer, clock, update=1.0, render=2.0)
+    clock.now += 1.0
+    timer.mark("update") # marked twice within a frame
+    run_frame(timer, clock, update=0.25)
+    assert timer.phases == ["update", "render"]
+    assert timer.get_samples("update") == [1.5, 1.25]
+    assert timer.get_samples("render") == [2.0, 0.0] # not marked in the second frame
+    assert timer.get_samples(FrameTimer.TOTAL) == [3.5, 1.25]
+    with pytest.raises(KeyError):
+        timer.get_samples("output")
+
+
+def test_ring_buffer_keeps_recent_frames_oldest_first(clock: FakeClock) -> None:
+    timer = FrameTimer(capacity=3)
+    timer.begin_frame()
+    for seconds in (1.0, 2.0, 3.0, 4.0, 5.0):
+        run_frame(timer, clock, update=seconds)
+    assert timer.frame_count == 5
+    assert timer.get_samples("update") == [3.0, 4.0, 5.0]
+
+
+@pytest.mark.parametrize("percentile, expected", [(0, 1.0), (1, 1.0), (50, 50.0), (95, 95.0), (99, 99.0), (99.5, 100.0), (100, 100.0)])
+def test_percentiles_use_the_nearest_rank(clock: FakeClock, percentile: float, expected: float) -> None:
+    timer = FrameTimer(capacity=100)
+    timer.begin_frame()
+    for seconds in reversed(range(1, 101)): # sorted before picking
+        run_frame(timer, clock, update=float(seconds))
+    assert timer.get_percentile("update", percentile) == expected
+
+
+def test_timings_of_every_phase(clock: FakeClock) -> None:
+    timer = FrameTimer(capacity=8)
+    assert timer.get_percentile(FrameTimer.TOTAL, 50) == 0.0
+    assert timer.get_timings() == {FrameTimer.TOTAL: PhaseTiming(0.0, 0.0, 0.0, 0.0, 0.0)}
+    timer.begin_frame()
+    for seconds in (1.0, 3.0, 2.0, 6.0):
+        run_frame(timer, clock, update=seconds, render=1.0)
+    timings = timer.get_timings()
+    assert list(timings) == ["update", "render", FrameTimer.TOTAL]
+    assert timings["update"] == PhaseTiming(2.0, 6.0, 6.0, 3.0, 6.0)
+    assert timings[FrameTimer.TOTAL] == PhaseTiming(3.0, 7.0, 7.0, 4.0, 7.0)
+    lines = timer.report().splitlines()
+    assert lines[0].split() == ["phase", "p50", "p95", "p99", "mean", "max"]
+    assert lines[1].split() == ["update", "2000.000", "6000.000", "6000.000", "3000.000", "6000.000"]
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from displaylib.ascii.framebuffer import Framebuffer
+from displaylib.ascii.headless import MemoryScreen
+from displaylib.ascii.writer import FrameWriter
+
+
+class GatedScreen(MemoryScreen):
+    """Screen whose writes wait for `.gate`, to hold the writer thread busy
+    """
+    def __init__(self, width: int = 1, height: int = 1) -> None:
+        super().__init__(width, height)
+        self.gate = threading.Event()
+        self.gate.set()
+        self.started = threading.Semaphore(0) # released when a write starts
+        self.written: list[tuple[str, bool]] = []
+        self.fail = False
+
+    def _write_frame(self, frame: Framebuffer, clear: bool = False) -> None:
+        self.started.release()
+        self.gate.wait()
+        if self.fail:
+            self.fail = False
+            raise OSError("terminal closed")
+        self.written.append((frame.get_lines()[0], clear))
+        super()._write_frame(frame, clear)
+
+
+def make_frame(symbol: str) -> Framebuffer:
+    frame = Framebuffer(1, 1)
+    frame.blit([[symbol]], 0, 0)
+    return frame
+
+
+@pytest.fixture
+def screen() -> GatedScreen:
+    return GatedScreen()
+
+
+def test_frames_are_written_in_order_and_flushed_on_stop(screen: GatedScreen) -> None:
+    writer = FrameWriter(screen)
+    screen.gate.clear()
+    writer.submit(make_frame("a"))
+    assert screen.started.acquire(timeout=5) # "a" is being written
+    writer.submit(make_frame("b"))
+    writer.submit(make_frame("c"), clear=True) # replaces "b"
+    writer.submit(make_frame("d")) # replaces "c", keeping its clear request
+    screen.gate.set()
+    writer.stop() # writes the waiting frame before returning
+    assert not writer.is_running
+    assert screen.written == [("a", False), ("d", True)]
+    assert (writer.frames_submitted, writer.frames_written, writer.frames_dropped) == (4, 2, 2)
+    assert screen.get_lines() == ["d"]
+
+
+def test_stop_without_frames(screen: GatedScreen) -> None:
+    writer = FrameWriter(screen)
+    writer.stop()
+    writer.submit(make_frame("a")) # started again
+    writer.stop()
+    writer.stop()
+    assert screen.written == [("a", False)]
+
+
+def test_errors_are_raised_on_the_main_thread(screen: GatedScreen) -> None:
+    writer = FrameWriter(screen)
+    screen.fail = True
+    writer.submit(make_frame("a"))
+    assert screen.started.acquire(timeout=5)
+    with pytest.raises(OSError):
+        writer.stop()
+    writer.submit(make_frame("b")) # the writer restarts after a failure
+    writer.stop()
+    assert screen.written == [("b", False)]
+
+
+def test_screen_hands_frames_to_the_writer(screen: GatedScreen) -> None:
+    screen.writer = FrameWriter(screen)
+    screen.framebuffer.blit([["x"]], 0, 0)
+    screen.show()
+    screen.framebuffer.blit([["y"]], 0, 0) # the submitted frame is a snapshot
+    screen.writer.stop()
+    assert screen.written == [("x", False)]